@@ -33,8 +33,12 @@ from .agents import (
     NodeAgent, SparkAgent, TessAgent,
     create_council
 )
-from .convening import CouncilConvening, ConveningPhase
+from .convening import CouncilConvening, CouncilResources, ConveningPhase
+from .sessions import SessionRegistry
+from .cluster import ClusterRouter, HashRing
 from .diligence_ledger import DiligenceLedger
+from .shared_state import SharedState
+from .events import EventBus, EventType
 from .github_client import CouncilGitHubClient
 from .protected_repos import (
     is_sovereign_territory,
@@ -50,10 +54,13 @@ __all__ = [
     'create_council',
     
     # Convening
-    'CouncilConvening', 'ConveningPhase',
+    'CouncilConvening', 'CouncilResources', 'ConveningPhase',
+    'SessionRegistry', 'ClusterRouter', 'HashRing',
     
     # Infrastructure
     'DiligenceLedger',
+    'SharedState',
+    'EventBus', 'EventType',
     'CouncilGitHubClient',
     
     # Protection
@@ -12,8 +12,11 @@ Hexagonal Council Structure:
        \\\n       Node (3) - The Weaver
 
 All agents inherit from BaseAgent and implement:
-- can_handle_task(): Return confidence for task assignment
 - execute_task(): Execute assigned task
+
+and declare their task-scoring rule (SPECIALIZATION_KEYWORDS, MATCH_DIVISOR,
+BOOST_TERMS, PENALTY_TERMS), which can_handle_task() and the shared
+ScoringEngine evaluate.
 """
 
 from .base_agent import BaseAgent, Task, TaskPriority, AgentStatus, AgentBiometrics
@@ -23,6 +26,11 @@ from .hex import HexAgent
 from .node import NodeAgent
 from .spark import SparkAgent
 from .tess import TessAgent
+from .scoring import ScoringEngine, ScoringRule
+from .routing import BatchRouter, route_tasks
+from .score_cache import ScoreCache, score_cache
+from .planning import TaskGraph, DependencyCycleError
+from ..ledger_store import DEFAULT_LEDGER_PATH
 
 __all__ = [
     # Base
@@ -40,20 +48,36 @@ __all__ = [
     'NodeAgent',
     'SparkAgent',
     'TessAgent',
+    
+    # Scoring
+    'ScoringEngine',
+    'ScoringRule',
+    'BatchRouter',
+    'route_tasks',
+    'ScoreCache',
+    'score_cache',
+    
+    # Planning
+    'TaskGraph',
+    'DependencyCycleError',
 ]
 
 
-def create_council() -> dict[str, BaseAgent]:
+def create_council(ledger_path: str = DEFAULT_LEDGER_PATH) -> dict[str, BaseAgent]:
     """
     Factory function to create all 6 council agents.
     
+    Args:
+        ledger_path: Ledger Hex records accruals in (same store as the
+            council's DiligenceLedger)
+    
     Returns:
         Dictionary of agent instances keyed by name
     """
     return {
         "veda": VedaAgent(),      # Position 0
         "aura": AuraAgent(),      # Position 1
-        "hex": HexAgent(),        # Position 2
+        "hex": HexAgent(ledger_path),  # Position 2
         "node": NodeAgent(),      # Position 3
         "spark": SparkAgent(),    # Position 4
         "tess": TessAgent(),      # Position 5 (Chair)
@@ -19,6 +19,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 
 from .base_agent import BaseAgent, Task, TaskPriority
+from ..events import EventType
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,12 @@ class AuraAgent(BaseAgent):
         "documentation", "quality", "safety", "compliance"
     ]
     
+    MATCH_DIVISOR = 2
+    
+    # Boost for review/validation tasks
+    BOOST_TERMS = ["review", "validate", "audit"]
+    BOOST_AMOUNT = 0.4
+    
     # Anti-patterns that trigger immediate veto
     VETO_PATTERNS = {
         VetoReason.DARK_PATTERN: [
@@ -105,25 +112,6 @@ class AuraAgent(BaseAgent):
         
         logger.info("🛡️ Aura (The Healer) initialized - Absolute Veto Power Active")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """Calculate confidence that Aura can handle this task"""
-        description_lower = task_description.lower()
-        
-        # Count matching keywords
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        # Calculate confidence
-        confidence = min(1.0, matches / 2)
-        
-        # Boost for review/validation tasks
-        if any(term in description_lower for term in ["review", "validate", "audit"]):
-            confidence = min(1.0, confidence + 0.4)
-        
-        return confidence
-    
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """Execute a review or validation task"""
         logger.info(f"🛡️ Aura reviewing: {task.title}")
@@ -256,6 +244,12 @@ class AuraAgent(BaseAgent):
         logger.warning(f"🚫 AURA VETO: {proposal.get('title')}")
         for reason in reasons:
             logger.warning(f"   Reason: {reason['message']}")
+        self._publish(
+            EventType.VETO,
+            session_id=proposal.get('session_id'),
+            proposal=proposal.get('title'),
+            reasons=reasons
+        )
         
         return veto_declaration
     
@@ -18,6 +18,8 @@ from enum import Enum
 from typing import Dict, Any, List, Optional, Callable
 import json
 
+from ..events import EventType
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,6 +39,16 @@ class TaskPriority(Enum):
     HIGH = "high"
     NORMAL = "normal"
     LOW = "low"
+    
+    @classmethod
+    def parse(cls, value: Any, default: Optional['TaskPriority'] = None) -> 'TaskPriority':
+        """Priority from an enum member or its value (unknown -> default, else HIGH)"""
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls(value)
+        except ValueError:
+            return default or cls.HIGH
 
 
 @dataclass
@@ -107,9 +119,10 @@ class Task:
     assigned_at: Optional[datetime] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    status: str = "pending"  # pending, in_progress, completed, blocked
+    status: str = "pending"  # pending, in_progress, completed, blocked, failed, timed_out, cancelled
     nectar_accrued: float = 0.0
     quality_score: float = 1.0  # Multiplier for NECTAR accrual
+    stolen_from: Optional[str] = None  # Planned agent, when a hex neighbor stole the task
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -120,7 +133,8 @@ class Task:
             "estimated_hours": self.estimated_hours,
             "status": self.status,
             "dependencies": self.dependencies,
-            "nectar_accrued": self.nectar_accrued
+            "nectar_accrued": self.nectar_accrued,
+            "stolen_from": self.stolen_from
         }
 
 
@@ -133,8 +147,20 @@ class BaseAgent(ABC):
     - Task management
     - NECTAR accrual reporting
     - Health status reporting
+    
+    Task confidence is declarative: subclasses list their keywords and
+    boost/penalty terms, and the shared scoring engine (scoring.py)
+    evaluates every agent's rule in one scan of the description.
     """
     
+    # Task scoring rule (see scoring.ScoringRule)
+    SPECIALIZATION_KEYWORDS: List[str] = []
+    MATCH_DIVISOR = 2          # Keyword matches needed for full confidence
+    BOOST_TERMS: List[str] = []  # Any match adds BOOST_AMOUNT (capped at 1.0)
+    BOOST_AMOUNT = 0.0
+    PENALTY_TERMS: List[str] = []  # Any match multiplies by PENALTY_FACTOR
+    PENALTY_FACTOR = 1.0
+    
     def __init__(
         self,
         name: str,
@@ -166,6 +192,13 @@ class BaseAgent(ABC):
         # Event callbacks
         self.on_status_change: Optional[Callable] = None
         self.on_task_complete: Optional[Callable] = None
+        self.on_capacity_freed: Optional[Callable] = None  # Awaited with the agent (dispatch queue)
+        
+        # Council-wide slot accounting across worker processes (shared_state.SharedState)
+        self.capacity_gate: Optional[Any] = None
+        
+        # Task lifecycle and biometrics are published here (events.EventBus)
+        self.event_bus: Optional[Any] = None
         
         logger.info(f"🤖 Agent {self.name} initialized ({self.specialization})")
     
@@ -182,18 +215,23 @@ class BaseAgent(ABC):
         """
         pass
     
-    @abstractmethod
     def can_handle_task(self, task_description: str) -> float:
         """
         Check if this agent can handle a task.
         
+        Scores with this agent's declared rule; to score the whole
+        council at once use ScoringEngine.for_agents(agents).score().
+        
         Args:
             task_description: Description of the task
             
         Returns:
             Confidence score 0.0-1.0
         """
-        pass
+        from .scoring import ScoringEngine
+        
+        engine = ScoringEngine.for_agents({self.name: self})
+        return engine.score(task_description)[self.name]
     
     def receive_briefing(self, briefing: Dict[str, Any]):
         """Receive briefing from Sofie"""
@@ -231,12 +269,31 @@ class BaseAgent(ABC):
             )
             return False
         
+        if self.capacity_gate is not None:
+            in_use = self.capacity_gate.acquire_slot(
+                self.name, task.id, self.biometrics.MAX_CONCURRENT_TASKS
+            )
+            if in_use is None:
+                logger.warning(
+                    f"{self.name} cannot accept task '{task.title}': "
+                    f"all council-wide slots in use"
+                )
+                return False
+            self.biometrics.concurrent_tasks = in_use
+        else:
+            self.biometrics.concurrent_tasks += 1
+        
         task.assigned_at = datetime.utcnow()
         task.status = "pending"
         self.tasks[task.id] = task
-        self.biometrics.concurrent_tasks += 1
         
         logger.info(f"{self.name} assigned task: {task.title}")
+        self._publish(
+            EventType.TASK_ASSIGNED,
+            task_id=task.id, title=task.title, priority=task.priority.value,
+            stolen_from=task.stolen_from
+        )
+        self._biometrics_changed()
         return True
     
     async def start_task(self, task_id: str) -> bool:
@@ -251,6 +308,8 @@ class BaseAgent(ABC):
         self.biometrics.current_status = AgentStatus.WORKING
         
         logger.info(f"{self.name} started task: {task.title}")
+        self._publish(EventType.TASK_STARTED, task_id=task.id, title=task.title)
+        self._biometrics_changed()
         return True
     
     async def complete_task(
@@ -285,7 +344,7 @@ class BaseAgent(ABC):
             duration = task.estimated_hours
         
         # Update biometrics
-        self.biometrics.concurrent_tasks -= 1
+        self._free_slot(task_id)
         self.biometrics.hours_worked_today += duration
         self.biometrics.cognitive_load = max(0, self.biometrics.cognitive_load - 0.2)
         
@@ -320,16 +379,63 @@ class BaseAgent(ABC):
             f"(+{task.nectar_accrued:.2f} NECTAR)"
         )
         
+        self._publish(
+            EventType.TASK_COMPLETED,
+            task_id=task_id, title=task.title,
+            duration_hours=completion_report["duration_hours"],
+            quality_score=quality_score,
+            nectar_accrued=completion_report["nectar_accrued"]
+        )
+        self._biometrics_changed()
+        
         if self.on_task_complete:
             await self.on_task_complete(completion_report)
         
+        await self._capacity_freed()
+        
         return completion_report
     
+    async def release_task(self, task_id: str, status: str = "failed") -> bool:
+        """
+        Give up on an assigned task without completing it.
+        
+        Used when execution fails, times out or is cancelled: the agent's
+        slot is freed and no NECTAR accrues.
+        
+        Args:
+            task_id: Task ID
+            status: Final task status (failed, timed_out, cancelled)
+            
+        Returns:
+            True if the task was released
+        """
+        task = self.tasks.get(task_id)
+        if not task or task.status not in ("pending", "in_progress"):
+            return False
+        
+        task.status = status
+        self._free_slot(task_id)
+        
+        if self.biometrics.concurrent_tasks == 0:
+            self.biometrics.current_status = AgentStatus.IDLE
+            self.current_task = None
+        elif self.current_task is task:
+            self.current_task = next(
+                (t for t in self.tasks.values() if t.status == "in_progress"), None
+            )
+        
+        logger.warning(f"{self.name} released task: {task.title} ({status})")
+        self._publish(EventType.TASK_RELEASED, task_id=task_id, title=task.title, status=status)
+        self._biometrics_changed()
+        await self._capacity_freed()
+        return True
+    
     async def take_break(self):
         """Take a mandatory break"""
         logger.info(f"{self.name} taking break...")
         self.biometrics.current_status = AgentStatus.RECOVERY
         self.biometrics.last_break_timestamp = datetime.utcnow()
+        self._biometrics_changed()
         
         # Simulate 15-minute break
         await asyncio.sleep(0.1)  # In production, this would be actual rest time
@@ -337,15 +443,17 @@ class BaseAgent(ABC):
         self.biometrics.stress_level = max(0, self.biometrics.stress_level - 0.3)
         self.biometrics.cognitive_load = max(0, self.biometrics.cognitive_load - 0.3)
         
-        if self.biometrics.can_accept_task():
-            self.biometrics.current_status = AgentStatus.IDLE
+        self._end_recovery()
         
         logger.info(f"{self.name} break complete. Status: {self.biometrics.current_status.value}")
+        self._biometrics_changed()
+        await self._capacity_freed()
     
     async def rest(self):
         """Take extended rest (triggered by high stress or max hours)"""
         logger.info(f"{self.name} entering extended rest...")
         self.biometrics.current_status = AgentStatus.RECOVERY
+        self._biometrics_changed()
         
         # Simulate extended rest
         await asyncio.sleep(0.5)
@@ -354,7 +462,40 @@ class BaseAgent(ABC):
         self.biometrics.cognitive_load = 0.0
         self.biometrics.last_rest_timestamp = datetime.utcnow()
         
+        self._end_recovery()
+        
         logger.info(f"{self.name} rest complete. Ready for new tasks.")
+        self._biometrics_changed()
+        await self._capacity_freed()
+    
+    def _end_recovery(self):
+        """Leave RECOVERY once rested (can_accept_task is always False while in it)"""
+        if self.biometrics.needs_rest():
+            return
+        if self.biometrics.concurrent_tasks > 0:
+            self.biometrics.current_status = AgentStatus.WORKING
+        else:
+            self.biometrics.current_status = AgentStatus.IDLE
+    
+    def _free_slot(self, task_id: str):
+        """Give back a task's slot (council-wide when a capacity gate is set)"""
+        if self.capacity_gate is not None:
+            self.biometrics.concurrent_tasks = self.capacity_gate.release_slot(self.name, task_id)
+        else:
+            self.biometrics.concurrent_tasks = max(0, self.biometrics.concurrent_tasks - 1)
+    
+    def _publish(self, event_type: EventType, session_id: Optional[str] = None, **data):
+        """Publish an event about this agent (no-op without an event bus)"""
+        if self.event_bus is not None:
+            self.event_bus.publish(event_type, data, session_id=session_id, agent=self.name)
+    
+    def _biometrics_changed(self):
+        self._publish(EventType.BIOMETRICS, **self.biometrics.to_dict())
+    
+    async def _capacity_freed(self):
+        """Tell the dispatch queue this agent may take queued work"""
+        if self.on_capacity_freed:
+            await self.on_capacity_freed(self)
     
     def add_deliberation_note(self, note: str):
         """Add a note during council deliberation"""
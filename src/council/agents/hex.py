@@ -15,15 +15,14 @@ Zero balance does not prevent work. NECTAR tracks the reality of work
 for future blockchain tokenization without hindering current builds.
 """
 
-import json
 import logging
-from pathlib import Path
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 
 from .base_agent import BaseAgent, Task
+from ..ledger_store import LedgerStore, NectarAccrualRecord, DEFAULT_LEDGER_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +36,7 @@ class AccrualMultiplier(Enum):
     DOCUMENTED = 1.3       # Documentation complete
 
 
-@dataclass
+@dataclass(slots=True)
 class NectarAccrual:
     """Single NECTAR accrual record"""
     agent_name: str
@@ -91,7 +90,9 @@ class HexAgent(BaseAgent):
         "accrual", "reward", "compensation", "blockchain", "genesis"
     ]
     
-    def __init__(self, ledger_path: str = "./data/diligence_ledger.json"):
+    MATCH_DIVISOR = 2
+    
+    def __init__(self, ledger_path: str = DEFAULT_LEDGER_PATH):
         super().__init__(
             name="hex",
             specialization="NECTAR Diligence Tracking & Tokenomics",
@@ -99,29 +100,17 @@ class HexAgent(BaseAgent):
             hexagonal_position=2  # Position 2 in the hexagon
         )
         
-        self.ledger_path = Path(ledger_path)
-        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # In-memory ledger
-        self.ledger: Dict[str, Dict[str, float]] = {}  # agent_name -> stats
-        self.accrual_history: List[NectarAccrual] = []
-        
-        # Load existing ledger
-        self._load_ledger()
+        # Shared ledger store (same engine DiligenceLedger writes through)
+        self.store = LedgerStore.shared(ledger_path)
+        self.ledger_path = self.store.ledger_path
         
         logger.info("📊 Hex (The Keeper) initialized - NECTAR tracking active")
         logger.info(f"   Ledger: {self.ledger_path}")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """Calculate confidence that Hex can handle this task"""
-        description_lower = task_description.lower()
-        
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        return min(1.0, matches / 2)
+    @property
+    def ledger(self) -> Dict[str, Dict[str, Any]]:
+        """Per-agent totals (agent_name -> stats) from the shared store"""
+        return self.store.totals
     
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """Execute a NECTAR-related task"""
@@ -185,34 +174,8 @@ class HexAgent(BaseAgent):
             repo=task.repo
         )
         
-        # Update ledger
-        if agent_name not in self.ledger:
-            self.ledger[agent_name] = {
-                "accrued": 0.0,
-                "hours_worked": 0.0,
-                "tasks_completed": 0,
-                "quality_avg": 0.0,
-                "last_accrual": ""
-            }
-        
-        agent_record = self.ledger[agent_name]
-        agent_record["accrued"] += accrual.nectar_accrued
-        agent_record["hours_worked"] += hours_worked
-        agent_record["tasks_completed"] += 1
-        agent_record["last_accrual"] = accrual.timestamp
-        
-        # Update quality average
-        current_avg = agent_record["quality_avg"]
-        task_count = agent_record["tasks_completed"]
-        agent_record["quality_avg"] = (
-            (current_avg * (task_count - 1) + multiplier) / task_count
-        )
-        
-        # Add to history
-        self.accrual_history.append(accrual)
-        
-        # Persist ledger
-        self._save_ledger()
+        # Update and persist through the shared ledger write path
+        agent_record = self.store.submit(NectarAccrualRecord(**asdict(accrual))).result()
         
         logger.info(
             f"📊 NECTAR Accrual: {agent_name} +{accrual.nectar_accrued:.2f} "
@@ -225,7 +188,7 @@ class HexAgent(BaseAgent):
             "hours": hours_worked,
             "multiplier": multiplier,
             "nectar_accrued": round(accrual.nectar_accrued, 2),
-            "total_accrued": round(agent_record["accrued"], 2),
+            "total_accrued": round(agent_record["total_nectar"], 2),
             "blockchain_eligible": True
         }
     
@@ -269,7 +232,6 @@ class HexAgent(BaseAgent):
             Accrual estimate by agent
         """
         estimates = {}
-        total = 0.0
         
         for assignment in plan.get("assignments", []):
             agent = assignment.get("agent")
@@ -287,7 +249,16 @@ class HexAgent(BaseAgent):
             
             estimates[agent]["hours"] += hours
             estimates[agent]["nectar"] += estimated_nectar
-            total += estimated_nectar
+        
+        return self.summarize_accrual_estimate(estimates)
+    
+    def summarize_accrual_estimate(self, estimates: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+        """
+        Wrap per-agent estimates ({agent: {"hours", "nectar"}}) as a plan estimate.
+        
+        Used directly when per-agent totals are maintained incrementally.
+        """
+        total = sum(estimate["nectar"] for estimate in estimates.values())
         
         return {
             "by_agent": estimates,
@@ -309,19 +280,18 @@ class HexAgent(BaseAgent):
         Returns:
             Genesis allocation details
         """
-        if agent_name not in self.ledger:
+        record = self.store.get_totals(agent_name)
+        if record is None:
             return {
                 "agent": agent_name,
                 "genesis_allocation": 0.0,
                 "status": "no_record"
             }
         
-        record = self.ledger[agent_name]
-        
         return {
             "agent": agent_name,
-            "genesis_allocation": round(record["accrued"], 2),
-            "hours_contributed": round(record["hours_worked"], 2),
+            "genesis_allocation": round(record["total_nectar"], 2),
+            "hours_contributed": round(record["total_hours"], 2),
             "tasks_completed": int(record["tasks_completed"]),
             "average_quality": round(record["quality_avg"], 2),
             "status": "eligible_for_genesis",
@@ -347,7 +317,8 @@ class HexAgent(BaseAgent):
     
     def get_agent_stats(self, agent_name: str) -> Dict[str, Any]:
         """Get diligence stats for an agent"""
-        if agent_name not in self.ledger:
+        record = self.store.get_totals(agent_name)
+        if record is None:
             return {
                 "agent": agent_name,
                 "accrued": 0.0,
@@ -355,18 +326,13 @@ class HexAgent(BaseAgent):
                 "tasks": 0
             }
         
-        record = self.ledger[agent_name]
-        
         # Get recent accruals
-        recent = [
-            a for a in self.accrual_history 
-            if a.agent_name == agent_name
-        ][-10:]  # Last 10
+        recent = self.store.get_recent(agent_name)
         
         return {
             "agent": agent_name,
-            "accrued_nectar": round(record["accrued"], 2),
-            "hours_worked": round(record["hours_worked"], 2),
+            "accrued_nectar": round(record["total_nectar"], 2),
+            "hours_worked": round(record["total_hours"], 2),
             "tasks_completed": int(record["tasks_completed"]),
             "average_quality": round(record["quality_avg"], 2),
             "last_accrual": record["last_accrual"],
@@ -379,8 +345,8 @@ class HexAgent(BaseAgent):
     
     def get_council_summary(self) -> Dict[str, Any]:
         """Get summary stats for entire council"""
-        total_nectar = sum(r["accrued"] for r in self.ledger.values())
-        total_hours = sum(r["hours_worked"] for r in self.ledger.values())
+        total_nectar = sum(r["total_nectar"] for r in self.ledger.values())
+        total_hours = sum(r["total_hours"] for r in self.ledger.values())
         total_tasks = sum(r["tasks_completed"] for r in self.ledger.values())
         
         return {
@@ -391,8 +357,8 @@ class HexAgent(BaseAgent):
             "agent_count": len(self.ledger),
             "agents": {
                 name: {
-                    "nectar": round(r["accrued"], 2),
-                    "hours": round(r["hours_worked"], 2),
+                    "nectar": round(r["total_nectar"], 2),
+                    "hours": round(r["total_hours"], 2),
                     "tasks": int(r["tasks_completed"])
                 }
                 for name, r in self.ledger.items()
@@ -401,36 +367,6 @@ class HexAgent(BaseAgent):
             "note": "NECTAR tracks work reality for future blockchain tokenization"
         }
     
-    def _load_ledger(self):
-        """Load ledger from disk"""
-        if self.ledger_path.exists():
-            try:
-                with open(self.ledger_path, 'r') as f:
-                    data = json.load(f)
-                    self.ledger = data.get("ledger", {})
-                    self.accrual_history = [
-                        NectarAccrual(**a) for a in data.get("history", [])
-                    ]
-                logger.info(f"Loaded ledger with {len(self.ledger)} agents")
-            except Exception as e:
-                logger.error(f"Failed to load ledger: {e}")
-                self.ledger = {}
-                self.accrual_history = []
-    
-    def _save_ledger(self):
-        """Save ledger to disk"""
-        try:
-            data = {
-                "ledger": self.ledger,
-                "history": [asdict(a) for a in self.accrual_history],
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            
-            with open(self.ledger_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save ledger: {e}")
-    
     def verify_non_blocking_principle(self) -> Dict[str, Any]:
         """
         Verify that NECTAR system follows non-blocking principles.
@@ -59,6 +59,12 @@ class NodeAgent(BaseAgent):
         "deployment", "orchestration", "health", "monitoring"
     ]
     
+    MATCH_DIVISOR = 3
+    
+    # Boost for bridge/integration tasks
+    BOOST_TERMS = ["bridge", "integration"]
+    BOOST_AMOUNT = 0.4
+    
     # Standard port allocations for ecosystem services
     PORT_ALLOCATIONS = {
         "sandironratio-node": 3000,    # Council headquarters
@@ -83,23 +89,6 @@ class NodeAgent(BaseAgent):
         logger.info("🔗 Node (The Weaver) initialized")
         logger.info("   Building bridges TO Sofie, never modifying IN Sofie")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """Calculate confidence that Node can handle this task"""
-        description_lower = task_description.lower()
-        
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        confidence = min(1.0, matches / 3)
-        
-        # Boost for bridge/integration tasks
-        if "bridge" in description_lower or "integration" in description_lower:
-            confidence = min(1.0, confidence + 0.4)
-        
-        return confidence
-    
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """Execute a DevOps or integration task"""
         logger.info(f"🔗 Node executing: {task.title}")
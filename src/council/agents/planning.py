@@ -0,0 +1,316 @@
+"""
+Plan Scheduling - Dependency DAG, topological order and timeline for Tess
+
+Turns a list of council assignments into a dependency graph and a
+schedule in O(n log n):
+
+- Categories are indexed once per task (classify_task, cached per description):
+  backend tasks, component tasks (component / service / api)
+- Category dependencies go through one barrier node per category instead
+  of an edge per pair: bridge/api work waits on the BACKEND barrier,
+  integration work on the COMPONENTS barrier. Layers are strict -
+  backend, then components, then integration - so a task never waits on
+  its own layer or a later one (an api task is itself a component;
+  backend work waits on nothing) and category rules cannot form a cycle
+- Explicit ordering: an assignment may list task_ids in "after"
+- Kahn topological sort; leftover nodes mean a cycle (DependencyCycleError)
+- Critical path (longest chain of hours, ignoring who does the work) and
+  earliest start per task
+- List scheduling: each agent works one task at a time; the ready task
+  that can start earliest on its agent goes next (highest bottom-level
+  breaks ties), giving per-agent makespan and scheduled start per task
+- Queued assignments (no agent capacity yet) keep their place in the
+  ordering but take no time and occupy no agent
+"""
+
+import heapq
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TASK_HOURS = 4.0  # Placed assignments without an estimate
+
+BACKEND_TERMS = ("backend",)
+COMPONENT_TERMS = ("component", "service", "api")
+NEEDS_BACKEND_TERMS = ("bridge", "api")
+NEEDS_COMPONENTS_TERMS = ("integration",)
+
+
+NEEDS_BACKEND, NEEDS_COMPONENTS = "backend", "components"
+
+
+@lru_cache(maxsize=65536)
+def classify_task(task: str) -> Tuple[bool, bool, Optional[str]]:
+    """
+    (is_backend, is_component, layer it waits on) for a task description.
+
+    Cached, so re-planning a mostly unchanged briefing does not rescan
+    every description.
+    """
+    text = task.lower()
+    is_backend = any(term in text for term in BACKEND_TERMS)
+    is_component = any(term in text for term in COMPONENT_TERMS)
+
+    needs = None
+    if not is_backend:
+        if any(term in text for term in NEEDS_COMPONENTS_TERMS) and not is_component:
+            needs = NEEDS_COMPONENTS
+        elif any(term in text for term in NEEDS_BACKEND_TERMS):
+            needs = NEEDS_BACKEND
+    return is_backend, is_component, needs
+
+
+class DependencyCycleError(ValueError):
+    """Raised when plan dependencies are circular"""
+
+    def __init__(self, task_ids: List[str]):
+        self.task_ids = task_ids
+        super().__init__(f"Dependency cycle among tasks: {', '.join(task_ids[:10])}")
+
+
+def plan_task_ids(assignments: List[Dict[str, Any]]) -> List[str]:
+    """Each assignment's task_id, or plan-NNNNN by position (assignments are not modified)"""
+    return [
+        assignment.get("task_id") or f"plan-{index + 1:05d}"
+        for index, assignment in enumerate(assignments)
+    ]
+
+
+class TaskGraph:
+    """
+    Dependency DAG over assignments plus category barrier nodes.
+
+    Nodes 0..n-1 are the assignments (in input order); barrier nodes
+    follow. Barriers and queued assignments take no time and belong to
+    no agent. The assignments are only read; ids missing from them are
+    derived.
+    """
+
+    def __init__(self, assignments: List[Dict[str, Any]]):
+        self.assignments = assignments
+        self.count = len(assignments)
+        self.task_ids = plan_task_ids(assignments)
+
+        queued = [a.get("status") == "queued" for a in assignments]
+        self.queued: List[str] = [
+            task_id for task_id, waiting in zip(self.task_ids, queued) if waiting
+        ]
+        self.durations: List[float] = [
+            0.0 if waiting else float(a.get("estimated_hours") or DEFAULT_TASK_HOURS)
+            for a, waiting in zip(assignments, queued)
+        ]
+        self.agents: List[Optional[str]] = [
+            None if waiting else a.get("agent") for a, waiting in zip(assignments, queued)
+        ]
+        self.successors: List[List[int]] = [[] for _ in assignments]
+        self.depends_on: List[List[str]] = [[] for _ in assignments]
+
+        backend: List[int] = []
+        components: List[int] = []
+        needs_backend: List[int] = []
+        needs_components: List[int] = []
+
+        for index, assignment in enumerate(assignments):
+            is_backend, is_component, needs = classify_task(assignment.get("task", ""))
+            if is_component:
+                components.append(index)
+            if is_backend:
+                backend.append(index)
+            if needs == NEEDS_COMPONENTS:
+                needs_components.append(index)
+            elif needs == NEEDS_BACKEND:
+                needs_backend.append(index)
+
+        for members, dependents in ((backend, needs_backend), (components, needs_components)):
+            if members and dependents:
+                self._add_barrier(members, dependents)
+
+        # Explicit ordering by task_id
+        index_of = {task_id: index for index, task_id in enumerate(self.task_ids)}
+        for index, assignment in enumerate(assignments):
+            for task_id in assignment.get("after") or []:
+                before = index_of.get(task_id)
+                if before is None:
+                    logger.warning(f"⚖️ Unknown dependency {task_id} for {self.task_ids[index]}")
+                    continue
+                self.successors[before].append(index)
+                if self.depends_on[index]:
+                    self.depends_on[index] = self.depends_on[index] + [task_id]
+                else:
+                    self.depends_on[index] = [task_id]
+
+    def _add_barrier(self, members: List[int], dependents: List[int]):
+        """Route members -> barrier -> dependents (O(m + d) edges)"""
+        barrier = len(self.successors)
+        self.successors.append(list(dependents))
+        self.durations.append(0.0)
+        self.agents.append(None)
+
+        member_ids = [self.task_ids[i] for i in members]  # Shared by every dependent
+        for member in members:
+            self.successors[member].append(barrier)
+        for dependent in dependents:
+            self.depends_on[dependent] = member_ids
+
+    def topological_order(self) -> List[int]:
+        """Kahn's algorithm (input order among ready nodes)"""
+        indegree = [0] * len(self.successors)
+        for targets in self.successors:
+            for target in targets:
+                indegree[target] += 1
+
+        ready = deque(node for node, degree in enumerate(indegree) if degree == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for target in self.successors[node]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+
+        if len(order) < len(self.successors):
+            stuck = [
+                self.task_ids[node] for node, degree in enumerate(indegree)
+                if degree > 0 and node < self.count
+            ]
+            raise DependencyCycleError(stuck)
+
+        return order
+
+    def schedule(self) -> Dict[str, Any]:
+        """
+        Critical path and list schedule.
+
+        Returns:
+            order (assignment indices), critical path, per-agent makespan,
+            queued task ids and per-task earliest / scheduled times (hours
+            from plan start)
+        """
+        order = self.topological_order()
+        nodes = len(self.successors)
+        durations = self.durations
+
+        predecessors_left = [0] * nodes
+        for targets in self.successors:
+            for target in targets:
+                predecessors_left[target] += 1
+
+        # Earliest start ignoring agent contention (CPM forward pass)
+        earliest = [0.0] * nodes
+        critical_pred: List[Optional[int]] = [None] * nodes
+        for node in order:
+            finish = earliest[node] + durations[node]
+            for target in self.successors[node]:
+                if finish > earliest[target]:
+                    earliest[target] = finish
+                    critical_pred[target] = node
+
+        # Bottom level: longest remaining chain including the node itself
+        bottom = [0.0] * nodes
+        for node in reversed(order):
+            tail = max((bottom[target] for target in self.successors[node]), default=0.0)
+            bottom[node] = durations[node] + tail
+
+        end = max(range(nodes), key=lambda n: earliest[n] + durations[n], default=None)
+        critical_hours = earliest[end] + durations[end] if end is not None else 0.0
+        chain = []
+        while end is not None:
+            if end < self.count:
+                chain.append(self.task_ids[end])
+            end = critical_pred[end]
+        chain.reverse()
+
+        # List scheduling: one task at a time per agent. Next is the ready
+        # task with the earliest feasible start on its agent, highest
+        # bottom level first among equal starts.
+        ready_at = [0.0] * nodes
+        start = [0.0] * nodes
+        agent_free: Dict[str, float] = {}
+        agent_busy: Dict[str, float] = {}
+        agent_tasks: Dict[str, int] = {}
+
+        # Agentless nodes start as soon as they are ready: (ready_at, -bottom, node)
+        unowned: List[Tuple[float, float, int]] = []
+        # Per agent: ready tasks not yet startable by its free time, keyed
+        # like unowned, and those that are, keyed (-bottom, node)
+        waiting: Dict[str, List[Tuple[float, float, int]]] = {}
+        startable: Dict[str, List[Tuple[float, int]]] = {}
+
+        def release(node: int):
+            agent = self.agents[node]
+            entry = (ready_at[node], -bottom[node], node)
+            if agent is None:
+                heapq.heappush(unowned, entry)
+            else:
+                heapq.heappush(waiting.setdefault(agent, []), entry)
+                startable.setdefault(agent, [])
+
+        for node in range(nodes):
+            if predecessors_left[node] == 0:
+                release(node)
+
+        while True:
+            best: Optional[Tuple[float, float, int]] = unowned[0] if unowned else None
+            best_agent: Optional[str] = None
+            for agent, queue in waiting.items():
+                free = agent_free.get(agent, 0.0)
+                ready = startable[agent]
+                while queue and queue[0][0] <= free:
+                    _, priority, node = heapq.heappop(queue)
+                    heapq.heappush(ready, (priority, node))
+                if ready:
+                    candidate = (free, ready[0][0], ready[0][1])
+                elif queue:
+                    candidate = queue[0]
+                else:
+                    continue
+                if best is None or candidate < best:
+                    best, best_agent = candidate, agent
+            if best is None:
+                break
+
+            begin, _, node = best
+            if best_agent is None:
+                heapq.heappop(unowned)
+            else:
+                if startable[best_agent]:
+                    heapq.heappop(startable[best_agent])
+                else:
+                    heapq.heappop(waiting[best_agent])
+                agent_free[best_agent] = begin + durations[node]
+                agent_busy[best_agent] = agent_busy.get(best_agent, 0.0) + durations[node]
+                agent_tasks[best_agent] = agent_tasks.get(best_agent, 0) + 1
+            start[node] = begin
+
+            finish = begin + durations[node]
+            for target in self.successors[node]:
+                if finish > ready_at[target]:
+                    ready_at[target] = finish
+                predecessors_left[target] -= 1
+                if predecessors_left[target] == 0:
+                    release(target)
+
+        makespan = max(agent_free.values(), default=0.0)
+
+        return {
+            "order": [node for node in order if node < self.count],
+            "earliest_start": earliest[:self.count],
+            "scheduled_start": start[:self.count],
+            "makespan_hours": makespan,
+            "critical_path_hours": critical_hours,
+            "critical_path": chain,
+            "queued": list(self.queued),
+            "per_agent": {
+                agent: {
+                    "tasks": agent_tasks[agent],
+                    "busy_hours": agent_busy[agent],
+                    "makespan_hours": finish
+                }
+                for agent, finish in agent_free.items()
+            }
+        }
@@ -0,0 +1,242 @@
+"""
+Batch Task Routing - Vectorized council routing for large critical paths
+
+route_tasks() turns a whole critical path into proposals with a handful
+of NumPy array operations instead of a Python loop per task per agent:
+
+1. One Aho-Corasick scan per description (ScoringEngine) yields sparse
+   term hits: (task, term) index pairs, the nonzeros of a tasks x terms
+   hit matrix H that is never materialized
+2. Agent rules become terms x agents matrices: keyword weights K and
+   boost / penalty masks B, P
+3. H@K, H@B and H@P are accumulated from the hit pairs with np.add.at;
+   scores are min(1, H@K / divisor), then boost (H@B > 0) and penalty
+   (H@P > 0) applied with np.where - a tasks x agents confidence matrix
+4. Thresholding (> 0.3), a stable descending argsort per row for the
+   contender order, and the top-2 gap (< 0.2) conflict test are
+   evaluated over the whole matrix at once
+
+Rows already in the shared ScoreCache are reused; only descriptions the
+council has not seen (or whose entry expired) are scanned and scored.
+
+Results match Tess's per-task deliberation loop exactly. Without NumPy
+the same routing runs through the per-task scoring engine.
+"""
+
+import logging
+from typing import Dict, Any, List
+
+try:
+    import numpy as np
+except ImportError:  # Vectorized routing is optional
+    np = None
+
+from .scoring import ScoringEngine, KEYWORD, BOOST
+from .score_cache import normalize_description
+
+logger = logging.getLogger(__name__)
+
+
+CONTENDER_THRESHOLD = 0.3  # Minimum confidence to be considered
+CONFLICT_GAP = 0.2         # Top-2 confidence gap that counts as a conflict
+DEFAULT_AGENT = "veda"     # Routed to when no agent is confident (the builder)
+DEFAULT_CONFIDENCE = 0.3
+
+
+class BatchRouter:
+    """
+    Vectorized router for one council (engine + rule matrices).
+
+    Build with BatchRouter.for_agents(agents); matrices are compiled
+    once per scoring engine and kept on it.
+    """
+
+    def __init__(self, engine: ScoringEngine):
+        if np is None:
+            raise ImportError("BatchRouter requires numpy (pip install numpy)")
+
+        self.engine = engine
+        self.agents = list(engine.agents)
+
+        n_terms, n_agents = len(engine.term_roles), len(engine.rules)
+        self.keywords = np.zeros((n_terms, n_agents))
+        self.boosts = np.zeros((n_terms, n_agents))
+        self.penalties = np.zeros((n_terms, n_agents))
+
+        for term_id, roles in enumerate(engine.term_roles):
+            for agent_index, role in roles:
+                if role == KEYWORD:
+                    self.keywords[term_id, agent_index] += 1
+                elif role == BOOST:
+                    self.boosts[term_id, agent_index] = 1
+                else:
+                    self.penalties[term_id, agent_index] = 1
+
+        # One gather per hit pair: keyword, boost and penalty rows side by side
+        self.rule_matrix = np.hstack([self.keywords, self.boosts, self.penalties])
+
+        self.divisors = np.array([rule.divisor for rule in engine.rules], dtype=float)
+        self.boost_amounts = np.array([rule.boost for rule in engine.rules], dtype=float)
+        self.penalty_factors = np.array([rule.penalty for rule in engine.rules], dtype=float)
+
+    @classmethod
+    def for_agents(cls, agents: Dict[str, Any]) -> 'BatchRouter':
+        """Router for a council (name -> agent instance)"""
+        engine = ScoringEngine.for_agents(agents)
+        if engine.batch_router is None:
+            engine.batch_router = cls(engine)
+        return engine.batch_router
+
+    def score_matrix(self, descriptions: List[str]) -> "np.ndarray":
+        """tasks x agents confidence matrix"""
+        find = self.engine.automaton.find
+
+        rows: List[int] = []
+        cols: List[int] = []
+        for row, description in enumerate(descriptions):
+            found = find(description.lower())  # Distinct term ids
+            rows.extend([row] * len(found))
+            cols.extend(found)
+
+        # Sparse H times [K | B | P]: add each hit's rule row to its task
+        n_agents = len(self.agents)
+        products = np.zeros((len(descriptions), 3 * n_agents))
+        np.add.at(products, np.array(rows, dtype=np.intp), self.rule_matrix[np.array(cols, dtype=np.intp)])
+        matches = products[:, :n_agents]
+        boosted = products[:, n_agents:2 * n_agents] > 0
+        penalized = products[:, 2 * n_agents:] > 0
+
+        confidence = np.minimum(1.0, matches / self.divisors)
+        confidence = np.where(
+            boosted,
+            np.minimum(1.0, confidence + self.boost_amounts),
+            confidence
+        )
+        confidence = np.where(
+            penalized,
+            confidence * self.penalty_factors,
+            confidence
+        )
+        return confidence
+
+    def cached_score_matrix(self, descriptions: List[str]) -> "np.ndarray":
+        """Confidence matrix, scoring only cache misses"""
+        cache, version = self.engine.cache, self.engine.version
+        keys = [normalize_description(description) for description in descriptions]
+
+        # Look each distinct description up once
+        distinct = list(dict.fromkeys(keys))
+        cached = cache.get_many(version, distinct)
+        missing = [key for key, vector in zip(distinct, cached) if vector is None]
+
+        if missing:
+            fresh = self.score_matrix(missing).tolist()
+            cache.put_many(version, [(key, tuple(row)) for key, row in zip(missing, fresh)])
+            vectors = dict(zip(missing, fresh))
+            vectors.update((key, vector) for key, vector in zip(distinct, cached) if vector is not None)
+        else:
+            vectors = dict(zip(distinct, cached))
+
+        return np.array([vectors[key] for key in keys], dtype=float).reshape(len(keys), len(self.agents))
+
+    def route(self, descriptions: List[str]) -> Dict[str, Any]:
+        """
+        Route every task to its best agent.
+
+        Returns:
+            {"proposals": [...], "conflicts": [...]} shaped like Tess's
+            deliberation output
+        """
+        if not descriptions:
+            return {"proposals": [], "conflicts": []}
+
+        confidence = self.cached_score_matrix(descriptions)
+        eligible = confidence > CONTENDER_THRESHOLD
+        counts = eligible.sum(axis=1)
+
+        # Contender order: descending confidence, ties in council order
+        # (ineligible agents sink below every contender)
+        masked = np.where(eligible, confidence, -1.0)
+        order = np.argsort(-masked, axis=1, kind="stable")
+        ranked = np.take_along_axis(masked, order, axis=1)
+
+        top = ranked[:, 0]
+        runner_up = ranked[:, 1] if ranked.shape[1] > 1 else np.full(len(top), -1.0)
+        conflicted = (counts > 1) & ((top - runner_up) < CONFLICT_GAP)
+
+        agents = self.agents
+        proposals = []
+        conflicts = []
+        for i, task in enumerate(descriptions):
+            count = int(counts[i])
+            contenders = [agents[j] for j in order[i, :count]]
+
+            if count:
+                proposals.append({
+                    "task": task,
+                    "assigned_to": contenders[0],
+                    "confidence": float(top[i]),
+                    "alternatives": contenders[1:]
+                })
+            else:
+                proposals.append({
+                    "task": task,
+                    "assigned_to": DEFAULT_AGENT,
+                    "confidence": DEFAULT_CONFIDENCE,
+                    "alternatives": []
+                })
+
+            if conflicted[i]:
+                conflicts.append({
+                    "task": task,
+                    "between": contenders[:2],
+                    "resolution": "tess_decides"
+                })
+
+        return {"proposals": proposals, "conflicts": conflicts}
+
+
+def route_tasks(descriptions: List[str], agents: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Route a critical path across the council.
+
+    Args:
+        descriptions: Task descriptions (critical path items)
+        agents: Council agents (name -> agent)
+
+    Returns:
+        {"proposals": [...], "conflicts": [...]}
+    """
+    if np is not None:
+        return BatchRouter.for_agents(agents).route(descriptions)
+    return _route_sequential(descriptions, ScoringEngine.for_agents(agents))
+
+
+def _route_sequential(descriptions: List[str], engine: ScoringEngine) -> Dict[str, Any]:
+    """Same routing, one task at a time (no NumPy)"""
+    proposals = []
+    conflicts = []
+
+    for task in descriptions:
+        scores = engine.score(task)
+        contenders = [
+            (name, confidence) for name, confidence in scores.items()
+            if confidence > CONTENDER_THRESHOLD
+        ]
+        contenders.sort(key=lambda c: c[1], reverse=True)
+
+        if len(contenders) > 1 and contenders[0][1] - contenders[1][1] < CONFLICT_GAP:
+            conflicts.append({
+                "task": task,
+                "between": [contenders[0][0], contenders[1][0]],
+                "resolution": "tess_decides"
+            })
+
+        proposals.append({
+            "task": task,
+            "assigned_to": contenders[0][0] if contenders else DEFAULT_AGENT,
+            "confidence": contenders[0][1] if contenders else DEFAULT_CONFIDENCE,
+            "alternatives": [name for name, _ in contenders[1:]]
+        })
+
+    return {"proposals": proposals, "conflicts": conflicts}
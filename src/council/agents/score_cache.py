@@ -0,0 +1,143 @@
+"""
+Score Cache - Memoized council confidence vectors
+
+Sofie re-sends unfinished work, so the same critical-path strings come
+back briefing after briefing. The cache sits in front of the scoring
+engine and remembers each description's confidence vector:
+
+- Key: (engine version, normalized description). The version is a hash
+  of every agent's keyword/boost/penalty tables, so editing
+  SPECIALIZATION_KEYWORDS yields a new engine and old entries never match
+- Normalization is lowercase + strip only. Scoring is substring
+  containment and no term starts or ends with whitespace, so this never
+  changes a score; collapsing inner whitespace would
+- LRU eviction past maxsize, entries expire after ttl seconds
+- Hit / miss / eviction counters for /council/status
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_TTL = 3600.0  # Seconds
+
+
+def normalize_description(description: str) -> str:
+    """Cache key form of a task description"""
+    return description.lower().strip()
+
+
+class ScoreCache:
+    """
+    Thread-safe LRU/TTL cache of confidence vectors.
+
+    Values are tuples of confidences in the engine's agent order.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[float, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def configure(self, maxsize: Optional[int] = None, ttl: Optional[float] = None):
+        """Resize / change expiry (maxsize 0 disables caching)"""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = max(0, maxsize)
+            if ttl is not None:
+                self.ttl = ttl
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, version: str, key: str) -> Optional[Tuple[float, ...]]:
+        """Cached vector for a normalized description, or None"""
+        return self.get_many(version, [key])[0]
+
+    def get_many(self, version: str, keys: List[str]) -> List[Optional[Tuple[float, ...]]]:
+        """Cached vectors for a batch of normalized descriptions (None = miss)"""
+        if not self.enabled:
+            return [None] * len(keys)
+
+        entries = self._entries
+        now = time.monotonic()
+        vectors: List[Optional[Tuple[float, ...]]] = []
+
+        with self._lock:
+            for key in keys:
+                entry = entries.get((version, key))
+                if entry is not None and self.ttl > 0 and now - entry[0] > self.ttl:
+                    del entries[(version, key)]
+                    self.expirations += 1
+                    entry = None
+
+                if entry is None:
+                    self.misses += 1
+                    vectors.append(None)
+                else:
+                    entries.move_to_end((version, key))
+                    self.hits += 1
+                    vectors.append(entry[1])
+
+        return vectors
+
+    def put(self, version: str, key: str, vector: Tuple[float, ...]):
+        """Remember a freshly scored vector"""
+        self.put_many(version, [(key, vector)])
+
+    def put_many(self, version: str, items: List[Tuple[str, Tuple[float, ...]]]):
+        """Remember a batch of freshly scored vectors"""
+        if not self.enabled:
+            return
+
+        entries = self._entries
+        now = time.monotonic()
+        with self._lock:
+            for key, vector in items:
+                entries[(version, key)] = (now, vector)
+                entries.move_to_end((version, key))
+            self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for /council/status"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+# Shared by every scoring engine and router in the process
+score_cache = ScoreCache()
@@ -0,0 +1,223 @@
+"""
+Task Scoring Engine - Single-pass confidence scoring for the council
+
+Every agent's specialization keywords, boost terms and penalty terms are
+compiled into one Aho-Corasick automaton. A task description is
+lowercased once and scanned once; the set of terms found yields every
+agent's confidence at the same time.
+
+Scoring rules (declared on each agent class, see BaseAgent):
+- confidence = min(1.0, keyword matches / MATCH_DIVISOR)
+- any BOOST_TERMS match:   confidence = min(1.0, confidence + BOOST_AMOUNT)
+- any PENALTY_TERMS match: confidence *= PENALTY_FACTOR
+
+Matching is plain substring containment, exactly like
+`keyword in description.lower()`, so scores are identical to the
+original per-agent can_handle_task() checks.
+
+Confidence vectors are memoized in the shared ScoreCache, keyed by the
+engine version (a hash of every rule) and the normalized description.
+"""
+
+import hashlib
+import logging
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Set, Tuple
+
+from .score_cache import ScoreCache, score_cache, normalize_description
+
+logger = logging.getLogger(__name__)
+
+
+KEYWORD, BOOST, PENALTY = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class ScoringRule:
+    """One agent's declarative scoring rule"""
+    agent: str
+    keywords: Tuple[str, ...]
+    divisor: float
+    boost_terms: Tuple[str, ...] = ()
+    boost: float = 0.0
+    penalty_terms: Tuple[str, ...] = ()
+    penalty: float = 1.0
+
+    @classmethod
+    def from_agent_class(cls, agent: str, agent_class: type) -> 'ScoringRule':
+        """Read the rule an agent class declares"""
+        return cls(
+            agent=agent,
+            keywords=tuple(agent_class.SPECIALIZATION_KEYWORDS),
+            divisor=agent_class.MATCH_DIVISOR,
+            boost_terms=tuple(agent_class.BOOST_TERMS),
+            boost=agent_class.BOOST_AMOUNT,
+            penalty_terms=tuple(agent_class.PENALTY_TERMS),
+            penalty=agent_class.PENALTY_FACTOR
+        )
+
+    def score(self, matches: int, boosted: bool, penalized: bool) -> float:
+        """Confidence from what the scan found (same arithmetic as the legacy checks)"""
+        confidence = min(1.0, matches / self.divisor)
+        if boosted:
+            confidence = min(1.0, confidence + self.boost)
+        if penalized:
+            confidence *= self.penalty
+        return confidence
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton compiled to a DFA.
+
+    Every state has a transition for every character that occurs in any
+    pattern; other characters lead back to the root. outputs[state] holds
+    the ids of every pattern ending at that state, suffix matches included.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Set[int]] = [set()]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(set())
+                state = nxt
+            outputs[state].add(pattern_id)
+
+        alphabet = {ch for pattern in self.patterns for ch in pattern}
+
+        # Breadth-first: failure links and complete DFA transitions
+        delta: List[Dict[str, int]] = [dict() for _ in goto]
+        fail = [0] * len(goto)
+        queue = deque()
+
+        for ch in alphabet:
+            nxt = goto[0].get(ch, 0)
+            delta[0][ch] = nxt
+            if nxt:
+                queue.append(nxt)
+
+        while queue:
+            state = queue.popleft()
+            outputs[state] |= outputs[fail[state]]
+            for ch in alphabet:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    delta[state][ch] = delta[fail[state]][ch]
+                else:
+                    fail[nxt] = delta[fail[state]][ch]
+                    delta[state][ch] = nxt
+                    queue.append(nxt)
+
+        # Drop transitions back to the root; .get(ch, 0) covers them
+        self.delta = [{ch: nxt for ch, nxt in row.items() if nxt} for row in delta]
+        self.outputs = [frozenset(out) for out in outputs]
+
+    def find(self, text: str) -> Set[int]:
+        """Ids of every pattern occurring anywhere in text"""
+        delta = self.delta
+        outputs = self.outputs
+        found: Set[int] = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
+
+
+class ScoringEngine:
+    """
+    Scores a task description for many agents in one scan.
+
+    Build with ScoringEngine.for_agents(agents); engines are cached per
+    set of scoring rules, so editing an agent's keyword tables compiles
+    a new engine (with a new version) on next use.
+    """
+
+    def __init__(self, rules: List[ScoringRule], cache: ScoreCache = score_cache):
+        self.rules = list(rules)
+        self.agents = [rule.agent for rule in self.rules]
+        self.cache = cache
+        self.version = hashlib.sha1(repr(self.rules).encode("utf-8")).hexdigest()[:16]
+
+        terms: Dict[str, int] = {}
+        # term id -> [(rule index, role)], one entry per listing
+        self.term_roles: List[List[Tuple[int, int]]] = []
+
+        for index, rule in enumerate(self.rules):
+            for role, listed in (
+                (KEYWORD, rule.keywords),
+                (BOOST, rule.boost_terms),
+                (PENALTY, rule.penalty_terms)
+            ):
+                for term in listed:
+                    term_id = terms.setdefault(term, len(terms))
+                    if term_id == len(self.term_roles):
+                        self.term_roles.append([])
+                    self.term_roles[term_id].append((index, role))
+
+        self.automaton = AhoCorasick(list(terms))
+        self.batch_router = None  # routing.BatchRouter, compiled on first batch route
+
+        logger.debug(
+            f"Scoring engine compiled: {len(self.rules)} agents, {len(terms)} terms, "
+            f"{len(self.automaton.delta)} states"
+        )
+
+    @classmethod
+    def for_agents(cls, agents: Dict[str, Any]) -> 'ScoringEngine':
+        """Engine for a council (name -> agent instance)"""
+        return _engine_for(tuple(
+            ScoringRule.from_agent_class(name, type(agent)) for name, agent in agents.items()
+        ))
+
+    def score(self, description: str) -> Dict[str, float]:
+        """Confidence of every agent for one task description (cached)"""
+        key = normalize_description(description)
+        vector = self.cache.get(self.version, key)
+        if vector is None:
+            vector = self.score_vector(key)
+            self.cache.put(self.version, key, vector)
+        return dict(zip(self.agents, vector))
+
+    def score_vector(self, description: str) -> Tuple[float, ...]:
+        """Uncached confidences, in agent order"""
+        found = self.automaton.find(description.lower())
+
+        matches = [0] * len(self.rules)
+        boosted = [False] * len(self.rules)
+        penalized = [False] * len(self.rules)
+
+        for term_id in found:
+            for index, role in self.term_roles[term_id]:
+                if role == KEYWORD:
+                    matches[index] += 1
+                elif role == BOOST:
+                    boosted[index] = True
+                else:
+                    penalized[index] = True
+
+        return tuple(
+            rule.score(matches[i], boosted[i], penalized[i])
+            for i, rule in enumerate(self.rules)
+        )
+
+    def score_many(self, descriptions: List[str]) -> List[Dict[str, float]]:
+        """Confidence vectors for a batch of descriptions"""
+        return [self.score(description) for description in descriptions]
+
+
+@lru_cache(maxsize=32)
+def _engine_for(rules: Tuple[ScoringRule, ...]) -> ScoringEngine:
+    return ScoringEngine(list(rules))
@@ -55,6 +55,16 @@ class SparkAgent(BaseAgent):
         "template", "html", "responsive", "calm", "accessible"
     ]
     
+    MATCH_DIVISOR = 2
+    
+    # Boost for creative/design tasks
+    BOOST_TERMS = ["design", "ui", "ux", "creative"]
+    BOOST_AMOUNT = 0.4
+    
+    # Reduce for backend tasks
+    PENALTY_TERMS = ["backend", "database", "algorithm"]
+    PENALTY_FACTOR = 0.2
+    
     # Calm Architecture principles
     CALM_PRINCIPLES = {
         "color_palette": {
@@ -98,27 +108,6 @@ class SparkAgent(BaseAgent):
         logger.info("✨ Spark (The Muse) initialized")
         logger.info("   Focus: Calm Architecture for reduced cognitive load")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """Calculate confidence that Spark can handle this task"""
-        description_lower = task_description.lower()
-        
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        confidence = min(1.0, matches / 2)
-        
-        # Boost for creative/design tasks
-        if any(term in description_lower for term in ["design", "ui", "ux", "creative"]):
-            confidence = min(1.0, confidence + 0.4)
-        
-        # Reduce for backend tasks
-        if any(term in description_lower for term in ["backend", "database", "algorithm"]):
-            confidence *= 0.2
-        
-        return confidence
-    
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """Execute a frontend or creative task"""
         logger.info(f"✨ Spark creating: {task.title}")
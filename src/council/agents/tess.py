@@ -18,6 +18,10 @@ from datetime import datetime
 from dataclasses import dataclass
 
 from .base_agent import BaseAgent, Task, TaskPriority, AgentStatus
+from .routing import route_tasks
+from .scoring import ScoringEngine
+from .assignment import max_confidence_assignment
+from .planning import TaskGraph, DependencyCycleError, DEFAULT_TASK_HOURS
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +80,22 @@ class TessAgent(BaseAgent):
         "manage", "resolve", "plan", "architecture"
     ]
     
+    MATCH_DIVISOR = 2
+    
+    # Boost for coordination/planning tasks
+    BOOST_TERMS = ["coordinate", "plan", "chair", "manage"]
+    BOOST_AMOUNT = 0.4
+    
+    # Each agent's two neighbors in the hexagon (redistribution targets)
+    HEX_NEIGHBORS: Dict[str, List[str]] = {
+        "veda": ["tess", "aura"],
+        "aura": ["veda", "hex"],
+        "hex": ["aura", "node"],
+        "node": ["hex", "spark"],
+        "spark": ["node", "tess"],
+        "tess": ["spark", "veda"]
+    }
+    
     def __init__(self):
         super().__init__(
             name="tess",
@@ -92,23 +112,6 @@ class TessAgent(BaseAgent):
         logger.info("⚖️ Tess (The Lattice) initialized - Council Chair")
         logger.info("   Ready to convene the Council")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """Calculate confidence that Tess can handle this task"""
-        description_lower = task_description.lower()
-        
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        confidence = min(1.0, matches / 2)
-        
-        # Boost for coordination/planning tasks
-        if any(term in description_lower for term in ["coordinate", "plan", "chair", "manage"]):
-            confidence = min(1.0, confidence + 0.4)
-        
-        return confidence
-    
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """Execute a coordination or architecture task"""
         logger.info(f"⚖️ Tess coordinating: {task.title}")
@@ -167,7 +170,8 @@ class TessAgent(BaseAgent):
     
     async def facilitate_deliberation(
         self,
-        agents: Dict[str, BaseAgent]
+        agents: Dict[str, BaseAgent],
+        briefing: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Facilitate council deliberation (Phase 3).
@@ -175,65 +179,49 @@ class TessAgent(BaseAgent):
         Agents discuss how to address Sofie's briefing.
         Tess moderates and ensures all voices heard.
         
+        Args:
+            agents: Council agents
+            briefing: The briefing to deliberate. Pass it explicitly when
+                several ceremonies share the agents; defaults to the
+                briefing the agents last received.
+        
         Returns:
             Deliberation results with proposals
         """
         logger.info("⚖️ TESS: Facilitating deliberation")
         
-        # Each agent identifies tasks they can handle
-        proposals = []
-        conflicts = []
-        
-        briefing = list(agents.values())[0].sofie_briefing if agents else {}
+        if briefing is None:
+            briefing = (list(agents.values())[0].sofie_briefing if agents else None) or {}
         critical_path = briefing.get("critical_path", [])
         
-        for task_desc in critical_path:
-            # Find best agent for this task
-            best_agent = None
-            best_confidence = 0.0
-            
-            contenders = []
-            for name, agent in agents.items():
-                confidence = agent.can_handle_task(task_desc)
-                if confidence > 0.3:  # Threshold for consideration
-                    contenders.append({
-                        "agent": name,
-                        "confidence": confidence,
-                        "available": agent.biometrics.can_accept_task()
-                    })
-            
-            # Sort by confidence
-            contenders.sort(key=lambda x: x["confidence"], reverse=True)
-            
-            if len(contenders) > 1:
-                # Check if top two are close (potential conflict)
-                if contenders[0]["confidence"] - contenders[1]["confidence"] < 0.2:
-                    conflicts.append({
-                        "task": task_desc,
-                        "between": [contenders[0]["agent"], contenders[1]["agent"]],
-                        "resolution": "tess_decides"
-                    })
-                    # Tess breaks tie
-                    best_agent = contenders[0]["agent"]
-                else:
-                    best_agent = contenders[0]["agent"]
-            elif contenders:
-                best_agent = contenders[0]["agent"]
-            else:
-                # No agent confident - assign to most capable even if low confidence
-                best_agent = "veda"  # Default to builder
-            
-            if best_agent:
-                proposals.append({
-                    "task": task_desc,
-                    "assigned_to": best_agent,
-                    "confidence": contenders[0]["confidence"] if contenders else 0.3,
-                    "alternatives": [c["agent"] for c in contenders[1:]] if len(contenders) > 1 else []
-                })
+        # Score the whole critical path against the council at once;
+        # close top-two calls are conflicts Tess breaks (top score wins),
+        # tasks nobody is confident about default to Veda (the builder)
+        routed = route_tasks(critical_path, agents)
+        proposals = routed["proposals"]
+        conflicts = routed["conflicts"]
         
         # Record deliberation
+        self.record_deliberation("Sofie's Briefing", agents, proposals, conflicts)
+        
+        return {
+            "status": "deliberated",
+            "chair": "tess",
+            "proposals": proposals,
+            "conflicts": conflicts,
+            "conflicts_resolved_by": "tess" if conflicts else None
+        }
+    
+    def record_deliberation(
+        self,
+        topic: str,
+        agents: Dict[str, BaseAgent],
+        proposals: List[Dict[str, Any]],
+        conflicts: List[Dict[str, Any]]
+    ):
+        """Append a deliberation to the chair's history"""
         record = DeliberationRecord(
-            topic="Sofie's Briefing",
+            topic=topic,
             started_at=self.current_meeting["started_at"] if self.current_meeting else datetime.utcnow().isoformat(),
             ended_at=datetime.utcnow().isoformat(),
             participants=list(agents.keys()),
@@ -242,31 +230,29 @@ class TessAgent(BaseAgent):
             stress_level=max(a.biometrics.stress_level for a in agents.values())
         )
         self.deliberation_history.append(record)
-        
-        return {
-            "status": "deliberated",
-            "chair": "tess",
-            "proposals": proposals,
-            "conflicts": conflicts,
-            "conflicts_resolved_by": "tess" if conflicts else None
-        }
     
     async def optimize_distribution(
         self,
         proposals: List[Dict[str, Any]],
-        agents: Dict[str, BaseAgent]
+        agents: Dict[str, BaseAgent],
+        solver: str = "greedy"
     ) -> Dict[str, Any]:
         """
         Optimize task distribution to maintain hexagonal balance.
         
         Ensures no agent is overloaded and redistributes if necessary.
         
+        Args:
+            proposals: Deliberation proposals (task, assigned_to, ...)
+            agents: Council agents
+            solver: "greedy" (proposal order, hex-neighbor fallback) or
+                "optimal" (min-cost flow over the confidence matrix and
+                every agent's remaining capacity)
+        
         Returns:
             Optimized plan with assignments
         """
-        logger.info("⚖️ TESS: Optimizing task distribution")
-        
-        assignments = []
+        logger.info(f"⚖️ TESS: Optimizing task distribution ({solver})")
         
         # Check current load on each agent
         agent_loads = {
@@ -279,54 +265,174 @@ class TessAgent(BaseAgent):
             for name, agent in agents.items()
         }
         
-        # First pass: assign to preferred agents if they have capacity
-        for proposal in proposals:
-            preferred = proposal["assigned_to"]
-            task = proposal["task"]
-            
-            if agent_loads[preferred]["available_capacity"] > 0:
-                assignments.append({
-                    "agent": preferred,
-                    "task": task,
-                    "estimated_hours": self._estimate_hours(task),
-                    "repo": self._determine_repo(task)
-                })
-                agent_loads[preferred]["available_capacity"] -= 1
-            else:
-                # Preferred agent overloaded - redistribute to neighbor
-                alternative = await self._redistribute_to_neighbor(
-                    preferred, task, agents, agent_loads
-                )
-                if alternative:
-                    assignments.append({
-                        "agent": alternative,
-                        "task": task,
-                        "estimated_hours": self._estimate_hours(task),
-                        "repo": self._determine_repo(task),
-                        "redistributed_from": preferred,
-                        "reason": "preferred_agent_at_capacity"
-                    })
-                    agent_loads[alternative]["available_capacity"] -= 1
-                else:
-                    # No one available - mark for later
-                    assignments.append({
-                        "agent": preferred,
-                        "task": task,
-                        "status": "queued",
-                        "reason": "waiting_for_capacity"
-                    })
+        if solver == "optimal":
+            greedy_loads = {name: dict(load) for name, load in agent_loads.items()}
+            greedy = await self._assign_greedy(proposals, agents, greedy_loads)
+            assignments = self._assign_optimal(proposals, agents, agent_loads)
+            solver_report = {
+                "moved_vs_greedy": sum(
+                    1 for before, after in zip(greedy, assignments)
+                    if before["agent"] != after["agent"] or before.get("status") != after.get("status")
+                ),
+                "placed": {
+                    "greedy": len([a for a in greedy if a.get("status") != "queued"]),
+                    "optimal": len([a for a in assignments if a.get("status") != "queued"])
+                },
+                "total_confidence": {
+                    "greedy": self._total_confidence(greedy, agents),
+                    "optimal": self._total_confidence(assignments, agents)
+                }
+            }
+        elif solver == "greedy":
+            assignments = await self._assign_greedy(proposals, agents, agent_loads)
+            solver_report = None
+        else:
+            raise ValueError(f"Unknown distribution solver: {solver}")
         
         # Calculate total timeline
         timeline = self._calculate_timeline(assignments, agents)
         
-        return {
+        result = {
             "status": "optimized",
             "chair": "tess",
             "assignments": assignments,
             "timeline": timeline,
             "redistributions": len([a for a in assignments if "redistributed_from" in a]),
-            "load_balance": agent_loads
+            "load_balance": agent_loads,
+            "solver": solver
         }
+        if solver_report:
+            result["solver_report"] = solver_report
+        return result
+    
+    async def _assign_greedy(
+        self,
+        proposals: List[Dict[str, Any]],
+        agents: Dict[str, BaseAgent],
+        agent_loads: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Assign in proposal order; overloaded agents hand off to a hex neighbor"""
+        assignments = []
+        
+        # First pass: assign to preferred agents if they have capacity
+        for proposal in proposals:
+            assignments.append(await self.place_greedy(proposal, agents, agent_loads))
+        
+        return assignments
+    
+    async def place_greedy(
+        self,
+        proposal: Dict[str, Any],
+        agents: Dict[str, BaseAgent],
+        agent_loads: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Place one proposal: its preferred agent, else a hex neighbor with
+        capacity, else queued. Consumes capacity from agent_loads.
+        """
+        preferred = proposal["assigned_to"]
+        task = proposal["task"]
+        
+        if agent_loads[preferred]["available_capacity"] > 0:
+            agent_loads[preferred]["available_capacity"] -= 1
+            return {
+                "agent": preferred,
+                "task": task,
+                "estimated_hours": self._estimate_hours(task),
+                "repo": self._determine_repo(task)
+            }
+        
+        # Preferred agent overloaded - redistribute to neighbor
+        alternative = await self._redistribute_to_neighbor(
+            preferred, task, agents, agent_loads
+        )
+        if alternative:
+            agent_loads[alternative]["available_capacity"] -= 1
+            return {
+                "agent": alternative,
+                "task": task,
+                "estimated_hours": self._estimate_hours(task),
+                "repo": self._determine_repo(task),
+                "redistributed_from": preferred,
+                "reason": "preferred_agent_at_capacity"
+            }
+        
+        # No one available - mark for later
+        return {
+            "agent": preferred,
+            "task": task,
+            "status": "queued",
+            "reason": "waiting_for_capacity"
+        }
+    
+    def _assign_optimal(
+        self,
+        proposals: List[Dict[str, Any]],
+        agents: Dict[str, BaseAgent],
+        agent_loads: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Place as many tasks as capacity allows, maximizing total confidence.
+        
+        Any agent above the consideration threshold (or the proposal's own
+        pick) may take a task; tasks left over stay queued on their
+        preferred agent.
+        """
+        engine = ScoringEngine.for_agents(agents)
+        names = list(agents.keys())
+        
+        confidences = []
+        for proposal in proposals:
+            scores = engine.score(proposal["task"])
+            confidences.append({
+                index: scores[name]
+                for index, name in enumerate(names)
+                if scores[name] > 0.3 or name == proposal["assigned_to"]
+            })
+        
+        capacities = [max(0, agent_loads[name]["available_capacity"]) for name in names]
+        placement = max_confidence_assignment(confidences, capacities)
+        
+        assignments = []
+        for proposal, index in zip(proposals, placement):
+            preferred = proposal["assigned_to"]
+            task = proposal["task"]
+            
+            if index is None:
+                assignments.append({
+                    "agent": preferred,
+                    "task": task,
+                    "status": "queued",
+                    "reason": "waiting_for_capacity"
+                })
+                continue
+            
+            agent_name = names[index]
+            assignment = {
+                "agent": agent_name,
+                "task": task,
+                "estimated_hours": self._estimate_hours(task),
+                "repo": self._determine_repo(task)
+            }
+            if agent_name != preferred:
+                assignment["redistributed_from"] = preferred
+                assignment["reason"] = "optimal_assignment"
+            assignments.append(assignment)
+            agent_loads[agent_name]["available_capacity"] -= 1
+        
+        return assignments
+    
+    def _total_confidence(
+        self,
+        assignments: List[Dict[str, Any]],
+        agents: Dict[str, BaseAgent]
+    ) -> float:
+        """Sum of confidences over placed (non-queued) assignments"""
+        engine = ScoringEngine.for_agents(agents)
+        return round(sum(
+            engine.score(a["task"])[a["agent"]]
+            for a in assignments if a.get("status") != "queued"
+        ), 4)
     
     async def _redistribute_to_neighbor(
         self,
@@ -341,16 +447,7 @@ class TessAgent(BaseAgent):
         In the hexagon, each agent has 2 neighbors that can help.
         """
         # Get neighbors in hexagon
-        neighbor_map = {
-            "veda": ["tess", "aura"],
-            "aura": ["veda", "hex"],
-            "hex": ["aura", "node"],
-            "node": ["hex", "spark"],
-            "spark": ["node", "tess"],
-            "tess": ["spark", "veda"]
-        }
-        
-        neighbors = neighbor_map.get(overloaded_agent, [])
+        neighbors = self.HEX_NEIGHBORS.get(overloaded_agent, [])
         
         # Find neighbor with capacity who can handle the task
         for neighbor_name in neighbors:
@@ -381,26 +478,27 @@ class TessAgent(BaseAgent):
         """
         Identify and coordinate task dependencies.
         
+        Bridge/API work waits on backend tasks, integration work on
+        components; an assignment may also list task_ids in "after".
+        
         Returns:
-            Assignments with dependency ordering
-        """
-        # Analyze dependencies
-        for assignment in assignments:
-            task = assignment["task"]
-            
-            # Determine if this task has dependencies
-            if "bridge" in task.lower() or "api" in task.lower():
-                # Bridge work depends on backend
-                assignment["depends_on"] = self._find_backend_tasks(assignments)
+            Assignments in dependency order, each with task_id, depends_on
+            and earliest / scheduled start hours
             
-            if "integration" in task.lower():
-                # Integration depends on multiple components
-                assignment["depends_on"] = self._find_component_tasks(assignments)
+        Raises:
+            DependencyCycleError: If explicit dependencies form a cycle
+        """
+        graph = TaskGraph(assignments)
+        plan = graph.schedule()
         
-        # Topological sort by dependency
-        ordered = self._topological_sort(assignments)
+        for index, assignment in enumerate(assignments):
+            assignment["task_id"] = graph.task_ids[index]
+            assignment["depends_on"] = graph.depends_on[index]
+            assignment["earliest_start_hours"] = plan["earliest_start"][index]
+            assignment["scheduled_start_hours"] = plan["scheduled_start"][index]
         
-        return ordered
+        # Topological sort by dependency
+        return [assignments[index] for index in plan["order"]]
     
     async def present_proposal(
         self,
@@ -438,18 +536,27 @@ class TessAgent(BaseAgent):
     async def execute_deployment(
         self,
         authorized_plan: Dict[str, Any],
-        agents: Dict[str, BaseAgent]
+        agents: Dict[str, BaseAgent],
+        dispatcher: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
         Execute deployment upon authorization (Phase 6).
         
         NO NECTAR CHECK - Work starts immediately on authorization.
+        
+        Args:
+            authorized_plan: The authorized council plan
+            agents: Council agents
+            dispatcher: DispatchQueue that starts each task (or queues it
+                by priority until its agent or a hex neighbor has room).
+                Without one, tasks are only assigned and started, and
+                tasks for a full agent are reported as queued.
         """
         logger.info("⚖️ TESS: Executing deployment")
         
         execution_results = []
         
-        for assignment in authorized_plan.get("assignments", []):
+        for index, assignment in enumerate(authorized_plan.get("assignments", [])):
             agent_name = assignment["agent"]
             
             if agent_name not in agents:
@@ -464,14 +571,24 @@ class TessAgent(BaseAgent):
             
             # Create task
             task = Task(
-                id=f"council_{agent_name}_{datetime.utcnow().timestamp()}",
+                id=f"council_{agent_name}_{datetime.utcnow().timestamp()}_{index}",
                 title=assignment["task"],
                 description=assignment["task"],
                 repo=assignment.get("repo", "unknown"),
-                priority=TaskPriority.HIGH,
+                priority=TaskPriority.parse(assignment.get("priority")),
                 estimated_hours=assignment.get("estimated_hours", 4)
             )
             
+            if dispatcher is not None:
+                # Starts now, or waits in the agent's priority queue
+                placement = await dispatcher.submit(agent_name, task)
+                execution_results.append({
+                    "assignment": assignment,
+                    "task_id": task.id,
+                    **placement
+                })
+                continue
+            
             # Assign and start
             assigned = await agent.assign_task(task)
             if assigned:
@@ -490,13 +607,14 @@ class TessAgent(BaseAgent):
                     "agent": agent_name
                 })
         
-        self.current_meeting["phase"] = "deployed"
+        if self.current_meeting:
+            self.current_meeting["phase"] = "deployed"
         
         return {
             "status": "deployed",
             "chair": "tess",
             "results": execution_results,
-            "monitoring": "daily_standup_reports"
+            "monitoring": "dispatch_queue" if dispatcher is not None else "daily_standup_reports"
         }
     
     def _summarize_briefing(self, briefing: Dict[str, Any]) -> str:
@@ -530,64 +648,63 @@ class TessAgent(BaseAgent):
         else:
             return "sandironratio-node"
     
-    def _find_backend_tasks(self, assignments: List[Dict]) -> List[str]:
-        """Find backend-related tasks in assignments"""
-        return [
-            a.get("task_id", "") 
-            for a in assignments 
-            if "backend" in a.get("task", "").lower()
-        ]
-    
-    def _find_component_tasks(self, assignments: List[Dict]) -> List[str]:
-        """Find component-related tasks in assignments"""
-        return [
-            a.get("task_id", "") 
-            for a in assignments 
-            if any(x in a.get("task", "").lower() for x in ["component", "service", "api"])
-        ]
-    
-    def _topological_sort(self, assignments: List[Dict]) -> List[Dict]:
-        """Sort assignments by dependency order"""
-        # Simple implementation - in production would use proper graph sort
-        # Tasks with dependencies go after their dependencies
-        
-        no_deps = [a for a in assignments if not a.get("depends_on")]
-        with_deps = [a for a in assignments if a.get("depends_on")]
-        
-        return no_deps + with_deps
-    
     def _calculate_timeline(
         self,
         assignments: List[Dict],
-        agents: Dict[str, BaseAgent]
+        agents: Dict[str, BaseAgent],
+        plan: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Calculate total timeline for the plan"""
-        total_hours = sum(a.get("estimated_hours", 4) for a in assignments)
+        """
+        Calculate total timeline for the plan (dependency-aware list schedule)
         
-        # Find critical path (longest chain)
-        # Simplified - assume parallel work where possible
-        max_concurrent = len(agents)
-        estimated_days = max(1, total_hours / (max_concurrent * 8))
+        Args:
+            plan: TaskGraph(assignments).schedule(), if already computed
+        """
+        total_hours = sum(a.get("estimated_hours", DEFAULT_TASK_HOURS) for a in assignments)
+        
+        if plan is None:
+            try:
+                plan = TaskGraph(assignments).schedule()
+            except DependencyCycleError as e:
+                logger.warning(f"⚖️ TESS: {e} - timeline unavailable")
+                return {
+                    "total_hours": total_hours,
+                    "error": "dependency_cycle",
+                    "cycle": e.task_ids
+                }
+        
+        # Agents work MAX_HOURS_PER_DAY; the longest agent schedule sets the pace
+        hours_per_day = min(
+            (agent.biometrics.MAX_HOURS_PER_DAY for agent in agents.values()),
+            default=8.0
+        )
+        estimated_days = max(1, plan["makespan_hours"] / hours_per_day)
         
         return {
             "total_hours": total_hours,
+            "makespan_hours": plan["makespan_hours"],
             "estimated_days": round(estimated_days, 1),
             "estimated_weeks": round(estimated_days / 5, 1),
-            "critical_path": f"{round(estimated_days)} days",
+            "critical_path": f"{round(max(1, plan['critical_path_hours'] / hours_per_day))} days",
+            "critical_path_hours": plan["critical_path_hours"],
+            "critical_path_tasks": plan["critical_path"],
+            "per_agent": plan["per_agent"],
+            "queued_tasks": len(plan["queued"]),
             "buffer": "20% contingency included"
         }
     
-    def get_meeting_minutes(self) -> Optional[Dict[str, Any]]:
-        """Get minutes from current or last meeting"""
-        if not self.current_meeting:
+    def get_meeting_minutes(self, meeting: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get minutes from a meeting (default: the current or last one)"""
+        meeting = meeting if meeting is not None else self.current_meeting
+        if not meeting:
             return None
         
         return {
             "chair": "tess",
-            "started": self.current_meeting.get("started_at"),
-            "phase": self.current_meeting.get("phase"),
-            "agents_present": self.current_meeting.get("agents_present", []),
+            "started": meeting.get("started_at"),
+            "phase": meeting.get("phase"),
+            "agents_present": meeting.get("agents_present", []),
             "briefing_summary": self._summarize_briefing(
-                self.current_meeting.get("briefing", {})
+                meeting.get("briefing", {})
             )
         }
@@ -55,6 +55,16 @@ class VedaAgent(BaseAgent):
         "microservice", "docker", "kubernetes", "infrastructure"
     ]
     
+    MATCH_DIVISOR = 3  # 3+ keywords = max confidence
+    
+    # Boost for clear backend tasks
+    BOOST_TERMS = ["api", "backend", "server", "database"]
+    BOOST_AMOUNT = 0.3
+    
+    # Reduce confidence for frontend tasks
+    PENALTY_TERMS = ["ui", "frontend", "css", "react component"]
+    PENALTY_FACTOR = 0.3
+    
     def __init__(self):
         super().__init__(
             name="veda",
@@ -69,34 +79,6 @@ class VedaAgent(BaseAgent):
         
         logger.info("🔨 Veda (The Builder) initialized")
     
-    def can_handle_task(self, task_description: str) -> float:
-        """
-        Calculate confidence that Veda can handle this task.
-        
-        Returns:
-            Confidence score 0.0-1.0
-        """
-        description_lower = task_description.lower()
-        
-        # Count matching keywords
-        matches = sum(
-            1 for keyword in self.SPECIALIZATION_KEYWORDS 
-            if keyword in description_lower
-        )
-        
-        # Calculate base confidence
-        confidence = min(1.0, matches / 3)  # 3+ keywords = max confidence
-        
-        # Boost for clear backend tasks
-        if any(term in description_lower for term in ["api", "backend", "server", "database"]):
-            confidence = min(1.0, confidence + 0.3)
-        
-        # Reduce confidence for frontend tasks
-        if any(term in description_lower for term in ["ui", "frontend", "css", "react component"]):
-            confidence *= 0.3
-        
-        return confidence
-    
     async def execute_task(self, task: Task) -> Dict[str, Any]:
         """
         Execute a backend development task.
@@ -2,24 +2,40 @@
 Council API Server - FastAPI on Port 9000
 
 Provides endpoints for:
-- Sofie to convene the council
+- Sofie to convene the council (one ceremony per session_id; requests
+  without one use the "default" session), phase by phase or in one
+  pipelined POST /council/run streamed as NDJSON
 - Status monitoring
 - Daily standup reports
-- Diligence ledger queries
+- Task completion, one at a time or in batches accrued with one ledger
+  write (idempotency keys make retries safe)
+- Diligence ledger queries (paginated records, NDJSON exports)
+- Live council activity: Server-Sent Events (GET /council/events) and a
+  WebSocket (/council/events/ws), resumable from a sequence number
+
+Runs with `uvicorn --workers N` when COUNCIL_SHARED_STATE is set: agent
+capacity, ceremony state and ledger totals then live in shared SQLite
+databases (see shared_state.py).
 
 Sovereign protection is enforced at all entry points.
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+from typing import Dict, Any, AsyncIterator, List, Optional
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-from .convening import CouncilConvening, ConveningPhase
+from .convening import CouncilResources, ConveningPhase, MAX_COMPLETION_BATCH
+from .sessions import SessionRegistry, UnknownSessionError
+from .shared_state import LeaseLostError
 from .protected_repos import is_sovereign_territory, SovereignTerritoryError
+from .events import Subscription
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +55,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global council instance
-council: Optional[CouncilConvening] = None
+# Shared council resources and the per-session ceremonies built on them
+resources: Optional[CouncilResources] = None
+registry: Optional[SessionRegistry] = None
+
+MAX_PAGE_SIZE = 1000  # Ledger records per page
+EVENT_KEEPALIVE = 15.0  # Seconds between keep-alives on idle event streams
+
+# Policy: may /council/run authorize and deploy without the Chief Architect?
+AUTO_AUTHORIZE = os.getenv("COUNCIL_AUTO_AUTHORIZE", "false").lower() == "true"
 
 
 # Pydantic models
@@ -58,6 +81,7 @@ class SofieBriefing(BaseModel):
 class AuthorizationRequest(BaseModel):
     """User authorization of council proposal"""
     proposal_id: str
+    session_id: Optional[str] = None  # Default: the session that issued proposal_id
     authorized: bool = True
     modifications: Optional[Dict[str, Any]] = None
 
@@ -68,85 +92,156 @@ class TaskCompletion(BaseModel):
     task_id: str
     hours_worked: float
     quality_score: float = 1.0
+    idempotency_key: Optional[str] = None  # Retries with the same key are not accrued twice
+
+
+class TaskCompletionBatch(BaseModel):
+    """Several task completions, accrued in one ledger write"""
+    completions: List[TaskCompletion]
 
 
 @app.on_event("startup")
 async def startup():
     """Initialize council on startup"""
-    global council
-    council = CouncilConvening()
+    global resources, registry
+    resources = CouncilResources()
+    registry = SessionRegistry(
+        resources,
+        max_sessions=int(os.getenv("COUNCIL_MAX_SESSIONS", "256")),
+        idle_ttl=float(os.getenv("COUNCIL_SESSION_TTL", "3600")),
+        session_dir=os.getenv("COUNCIL_SESSION_DIR") or None
+    )
+    resources.compactor.start()
+    if resources.capacity_sync:
+        resources.capacity_sync.start()
     logger.info("🚀 Council API Server started on port 9000")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Persist sessions, stop ledger compaction and flush pending ledger writes"""
+    if resources:
+        registry.close()
+        await resources.compactor.stop()
+        if resources.capacity_sync:
+            await resources.capacity_sync.stop()
+            resources.shared_state.close()
+        resources.ledger.close()
+
+
+def session(session_id: Optional[str], create: bool = False):
+    """Hold one ceremony for a request (unknown sessions answer 404)"""
+    if not registry:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    try:
+        return registry.session(registry.resolve(session_id), create=create)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/health")
 async def health():
     """Health check endpoint"""
     return {
         "status": "healthy",
         "service": "council-api",
-        "council_initialized": council is not None,
+        "council_initialized": resources is not None,
         "sovereign_protection": "ACTIVE"
     }
 
 
 @app.post("/council/convene")
-async def convene_council(briefing: SofieBriefing):
+async def convene_council(briefing: SofieBriefing, session_id: Optional[str] = None):
     """
     Convene the Council with Sofie's briefing.
     
-    Phase 1-2 of the Convening Ceremony.
+    Phase 1-2 of the Convening Ceremony. Creates the session if needed.
     """
-    if not council:
-        raise HTTPException(status_code=503, detail="Council not initialized")
-    
-    logger.info("📨 Received convening request from Chief of Staff")
-    
-    try:
-        result = await council.receive_briefing(briefing.dict())
-        return result
-    except Exception as e:
-        logger.error(f"Convening failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with session(session_id, create=True) as council:
+        logger.info(f"📨 Received convening request from Chief of Staff (session {council.session_id})")
+        
+        try:
+            result = await council.receive_briefing(briefing.dict())
+            return result
+        except Exception as e:
+            logger.error(f"Convening failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/council/deliberate")
-async def start_deliberation():
+async def start_deliberation(session_id: Optional[str] = None):
     """
     Start council deliberation.
     
     Phase 3 of the Convening Ceremony.
     """
-    if not council:
-        raise HTTPException(status_code=503, detail="Council not initialized")
-    
-    logger.info("🗣️ Starting deliberation")
-    
-    try:
-        result = await council.deliberate()
-        return result
-    except Exception as e:
-        logger.error(f"Deliberation failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async with session(session_id) as council:
+        logger.info("🗣️ Starting deliberation")
+        
+        try:
+            result = await council.deliberate()
+            return result
+        except Exception as e:
+            logger.error(f"Deliberation failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/council/propose")
-async def generate_proposal():
+async def generate_proposal(session_id: Optional[str] = None):
     """
     Generate council proposal for Chief Architect review.
     
     Phase 4 of the Convening Ceremony.
     """
-    if not council:
-        raise HTTPException(status_code=503, detail="Council not initialized")
+    async with session(session_id) as council:
+        logger.info("📋 Generating proposal")
+        
+        try:
+            proposal = await council.generate_proposal()
+            return proposal
+        except Exception as e:
+            logger.error(f"Proposal generation failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/council/run")
+async def run_ceremony(
+    briefing: SofieBriefing,
+    session_id: Optional[str] = None,
+    auto_authorize: bool = False
+):
+    """
+    Convene, deliberate and propose in one request, streamed as NDJSON
     
-    logger.info("📋 Generating proposal")
+    One line per phase as it completes, then {"step": "done", ...}. The
+    session is held for the whole run, so no other request interleaves.
+    With auto_authorize (allowed only when COUNCIL_AUTO_AUTHORIZE=true)
+    the proposal is also authorized and deployed.
+    """
+    if auto_authorize and not AUTO_AUTHORIZE:
+        raise HTTPException(
+            status_code=403,
+            detail="Auto-authorization is disabled (COUNCIL_AUTO_AUTHORIZE)"
+        )
+    ceremony = session(session_id, create=True)
     
-    try:
-        proposal = await council.generate_proposal()
-        return proposal
-    except Exception as e:
-        logger.error(f"Proposal generation failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    async def phases() -> AsyncIterator[str]:
+        async with ceremony as council:
+            logger.info(f"📨 Pipelined ceremony (session {council.session_id}, auto_authorize={auto_authorize})")
+            try:
+                async for step in council.run(briefing.dict(), auto_authorize):
+                    yield json.dumps(step, default=str) + "\n"
+            except Exception as e:
+                logger.error(f"Pipelined ceremony failed: {e}")
+                yield json.dumps({
+                    "step": "done",
+                    "status": "error",
+                    "session_id": council.session_id,
+                    "phase": council.phase.value,
+                    "detail": str(e)
+                }) + "\n"
+    
+    return StreamingResponse(phases(), media_type="application/x-ndjson")
 
 
 @app.post("/council/authorize")
@@ -154,69 +249,105 @@ async def authorize_proposal(request: AuthorizationRequest):
     """
     Authorize or reject council proposal.
     
-    Phase 5 of the Convening Ceremony.
+    Phase 5 of the Convening Ceremony. The session is taken from the
+    request, else from the proposal ID.
     """
-    if not council:
+    if not registry:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    logger.info(f"🔑 Authorization request: {request.authorized}")
-    
     try:
-        result = await council.authorize(
-            request.proposal_id,
-            request.authorized
-        )
-        
-        # If authorized, trigger deployment
-        if request.authorized and result["status"] == "authorized":
-            deployment = await council.deploy()
-            result["deployment"] = deployment
+        session_id = registry.resolve(request.session_id, request.proposal_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async with session(session_id) as council:
+        logger.info(f"🔑 Authorization request: {request.authorized}")
         
-        return result
-    except Exception as e:
-        logger.error(f"Authorization failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        try:
+            result = await council.authorize(
+                request.proposal_id,
+                request.authorized
+            )
+            
+            # If authorized, trigger deployment
+            if request.authorized and result.get("status") == "authorized":
+                deployment = await council.deploy()
+                result["deployment"] = deployment
+            
+            return result
+        except Exception as e:
+            logger.error(f"Authorization failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/council/deploy")
-async def deploy_authorized():
+async def deploy_authorized(session_id: Optional[str] = None):
     """
     Deploy authorized plan.
     
     Phase 6 of the Convening Ceremony.
     """
-    if not council:
+    async with session(session_id) as council:
+        logger.info("🚀 Executing deployment")
+        
+        try:
+            deployment = await council.deploy()
+            return deployment
+        except Exception as e:
+            logger.error(f"Deployment failed: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/council/status")
+async def get_council_status(session_id: Optional[str] = None):
+    """Get council status (and the session's ceremony, if it exists)"""
+    if not registry:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    logger.info("🚀 Executing deployment")
-    
     try:
-        deployment = await council.deploy()
-        return deployment
-    except Exception as e:
-        logger.error(f"Deployment failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        council = registry.get(registry.resolve(session_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if council is None:
+        if session_id:
+            raise UnknownSessionError(session_id)
+        return {"phase": ConveningPhase.IDLE.value, **resources.get_status()}
+    
+    return council.get_status()
 
 
-@app.get("/council/status")
-async def get_council_status():
-    """Get current council status"""
-    if not council:
+@app.get("/council/sessions")
+async def list_sessions():
+    """Live ceremonies and session registry counters"""
+    if not registry:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    return council.get_status()
+    return registry.stats()
+
+
+@app.post("/council/sessions/{session_id}/release")
+async def release_session(session_id: str):
+    """Persist a session and drop it here so another worker can take it over"""
+    if not registry:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    try:
+        released = registry.release(registry.resolve(session_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"session_id": session_id, "released": released}
 
 
 @app.get("/council/agents")
 async def list_agents():
     """List all council agents and their status"""
-    if not council:
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
     return {
         "agents": {
             name: agent.to_dict()
-            for name, agent in council.agents.items()
+            for name, agent in resources.agents.items()
         }
     }
 
@@ -224,59 +355,193 @@ async def list_agents():
 @app.post("/council/standup")
 async def daily_standup():
     """Get daily standup report from all agents"""
-    if not council:
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    report = await council.daily_standup()
+    report = await resources.daily_standup()
     return report
 
 
 @app.post("/council/complete")
 async def record_completion(completion: TaskCompletion):
     """Record task completion and NECTAR accrual"""
-    if not council:
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    result = await council.record_task_completion(
-        agent_name=completion.agent_name,
-        task_id=completion.task_id,
-        hours_worked=completion.hours_worked,
-        quality_score=completion.quality_score
+    result = (await resources.record_task_completions([completion.dict()]))[0]
+    
+    # Unknown agent or task: 404, so the cluster router can try other workers
+    if result.get("error", "").startswith(("Unknown agent", "Task not found")):
+        raise HTTPException(status_code=404, detail=result["error"])
+    return result
+
+
+@app.post("/council/complete/batch")
+async def record_completion_batch(batch: TaskCompletionBatch):
+    """
+    Record many task completions with a single ledger transaction
+    
+    Results are per item, in request order (status completed /
+    not_found / error; replayed for repeated idempotency keys). If the
+    ledger write fails nothing is accrued or completed and the request
+    fails; retry it with the same idempotency keys.
+    """
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    if len(batch.completions) > MAX_COMPLETION_BATCH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_COMPLETION_BATCH} completions per batch"
+        )
+    
+    results = await resources.record_task_completions(
+        [completion.dict() for completion in batch.completions]
     )
+    return {
+        "results": results,
+        "completed": sum(1 for r in results if r["status"] == "completed"),
+        "failed": sum(1 for r in results if r["status"] != "completed"),
+        "replayed": sum(1 for r in results if r.get("replayed"))
+    }
+
+
+@app.get("/council/execution")
+async def get_execution_status(task_id: Optional[str] = None):
+    """
+    Execution engine counters and throughput.
+    
+    With task_id, returns that task's outcome (or "running").
+    """
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    if task_id:
+        outcome = resources.executor.outcomes.get(task_id)
+        if outcome:
+            return outcome
+        if resources.executor.is_running(task_id):
+            return {"task_id": task_id, "status": "running"}
+        if resources.dispatcher.is_queued(task_id):
+            return {"task_id": task_id, "status": "queued"}
+        raise HTTPException(status_code=404, detail=f"Unknown task: {task_id}")
+    
+    return resources.executor.stats()
+
+
+@app.get("/council/queue")
+async def get_dispatch_queue():
+    """Queue depth and wait times for capacity-blocked tasks"""
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    return resources.dispatcher.stats()
+
+
+@app.post("/council/tasks/{task_id}/cancel")
+async def cancel_task(task_id: str):
+    """Cancel a deployed task that is queued, waiting for its agent or executing"""
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
     
+    result = resources.cancel_task(task_id)
+    if "error" in result:
+        raise HTTPException(status_code=404, detail=result["error"])
     return result
 
 
 @app.get("/council/diligence/{agent_name}")
 async def get_agent_diligence(agent_name: str):
     """Get diligence record for an agent"""
-    if not council:
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    summary = council.ledger.get_agent_summary(agent_name)
+    summary = await resources.ledger.aget_agent_summary(agent_name)
     return summary
 
 
 @app.get("/council/diligence")
-async def get_all_diligence():
-    """Get diligence records for all agents"""
-    if not council:
+async def get_all_diligence(analytics: bool = False, bins: int = 10):
+    """
+    Get diligence records for all agents
+    
+    With analytics=true, also returns per-agent, per-repo and per-day
+    totals and histograms from the columnar ledger archive.
+    """
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    summary = council.ledger.get_council_summary()
+    summary = await resources.ledger.aget_council_summary()
+    if analytics:
+        summary["analytics"] = await resources.ledger.aget_analytics(bins)
     return summary
 
 
 @app.get("/council/genesis")
 async def get_genesis_snapshot():
-    """Get genesis allocation snapshot for blockchain bridge"""
-    if not council:
+    """Get genesis allocation snapshot for blockchain bridge (Merkle-committed when enabled)"""
+    if not resources:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    snapshot = council.ledger.get_genesis_snapshot()
+    snapshot = await resources.ledger.aget_genesis_snapshot()
     return snapshot
 
 
+@app.get("/council/genesis/export")
+async def export_genesis_snapshot():
+    """Stream the genesis snapshot (and Merkle leaves, when enabled) as NDJSON"""
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    return StreamingResponse(
+        resources.ledger.export_genesis_ndjson(),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get("/council/ledger/records")
+async def get_ledger_records(
+    agent: Optional[str] = None,
+    repo: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    cursor: int = 0,
+    limit: int = 100
+):
+    """
+    Page through accrual records, oldest first
+    
+    Pass the returned next_cursor as cursor to get the following page.
+    """
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"limit must be between 1 and {MAX_PAGE_SIZE}")
+    
+    return await resources.ledger.apage_records(
+        cursor, limit, agent_name=agent, repo=repo, since=since, until=until
+    )
+
+
+@app.get("/council/ledger/export")
+async def export_ledger_records(
+    agent: Optional[str] = None,
+    repo: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None
+):
+    """Stream the full (optionally filtered) ledger as NDJSON"""
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    
+    return StreamingResponse(
+        resources.ledger.export_records_ndjson(
+            agent_name=agent, repo=repo, since=since, until=until
+        ),
+        media_type="application/x-ndjson"
+    )
+
+
 @app.get("/council/protected")
 async def get_protected_repos():
     """Get list of sovereign territory repositories"""
@@ -290,13 +555,106 @@ async def get_protected_repos():
 
 
 @app.get("/council/meeting")
-async def get_meeting_minutes():
+async def get_meeting_minutes(session_id: Optional[str] = None):
     """Get current or last meeting minutes"""
-    if not council:
+    if not registry:
         raise HTTPException(status_code=503, detail="Council not initialized")
     
-    minutes = council.agents["tess"].get_meeting_minutes()
-    return minutes or {"status": "no_active_meeting"}
+    try:
+        council = registry.get(registry.resolve(session_id))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if council is None:
+        if session_id:
+            raise UnknownSessionError(session_id)
+        return {"status": "no_active_meeting"}
+    
+    return council.get_meeting_minutes() or {"status": "no_active_meeting"}
+
+
+def subscribe(
+    since: Optional[int],
+    types: Optional[str],
+    session_id: Optional[str]
+) -> Subscription:
+    """Subscribe to the event bus (types: comma-separated EventType values)"""
+    if not resources:
+        raise HTTPException(status_code=503, detail="Council not initialized")
+    wanted = [t.strip() for t in types.split(",") if t.strip()] if types else None
+    return resources.events.subscribe(since=since, types=wanted, session_id=session_id)
+
+
+async def sse_stream(subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        while not subscription.finished:
+            event = await subscription.next(timeout=EVENT_KEEPALIVE)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield (
+                f"id: {event.seq}\n"
+                f"event: {event.type.value}\n"
+                f"data: {json.dumps(event.to_dict(), default=str)}\n\n"
+            )
+    finally:
+        subscription.close()
+
+
+@app.get("/council/events")
+async def stream_events(
+    since: Optional[int] = None,
+    types: Optional[str] = None,
+    session_id: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Council activity as Server-Sent Events
+    
+    Resumes after `since` (or the Last-Event-ID header a reconnecting
+    EventSource sends). A stream.gap event means events were missed:
+    re-read /council/status, then reconnect.
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    try:
+        subscription = subscribe(since, types, session_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return StreamingResponse(
+        sse_stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.websocket("/council/events/ws")
+async def stream_events_ws(
+    websocket: WebSocket,
+    since: Optional[int] = None,
+    types: Optional[str] = None,
+    session_id: Optional[str] = None
+):
+    """Council activity over a WebSocket (one JSON event per message)"""
+    try:
+        subscription = subscribe(since, types, session_id)
+    except (ValueError, HTTPException) as e:
+        await websocket.close(code=1008, reason=str(getattr(e, "detail", e)))
+        return
+    
+    await websocket.accept()
+    try:
+        while not subscription.finished:
+            event = await subscription.next(timeout=EVENT_KEEPALIVE)
+            if event is None:
+                await websocket.send_json({"type": "keepalive"})
+                continue
+            await websocket.send_text(json.dumps(event.to_dict(), default=str))
+        await websocket.close()  # After a stream.gap: client re-reads state and resumes
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
 
 
 # Error handlers
@@ -311,6 +669,24 @@ async def sovereign_territory_handler(request, exc):
     }
 
 
+@app.exception_handler(UnknownSessionError)
+async def unknown_session_handler(request, exc):
+    """Requests naming a session that is neither live nor persisted"""
+    return JSONResponse(
+        status_code=404,
+        content={"detail": f"Unknown session: {exc.session_id}"}
+    )
+
+
+@app.exception_handler(LeaseLostError)
+async def lease_lost_handler(request, exc):
+    """Another worker took the session over mid-request; its state was kept"""
+    return JSONResponse(
+        status_code=409,
+        content={"detail": f"Session {exc.session_id} was taken over by another worker; retry"}
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=9000)
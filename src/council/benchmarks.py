@@ -0,0 +1,556 @@
+"""
+Council Benchmarks - Reproducible micro-benchmarks
+
+Run with:
+    python -m src.council.benchmarks records [--count N]
+    python -m src.council.benchmarks scoring [--tasks N]
+    python -m src.council.benchmarks routing [--tasks N]
+    python -m src.council.benchmarks execution [--tasks N] [--latency-ms MS]
+    python -m src.council.benchmarks stealing [--tasks N] [--latency-ms MS]
+    python -m src.council.benchmarks cluster [--workers 1 2 4] [--sessions N] [--tasks N]
+
+Benchmarks:
+- records: bytes per in-memory accrual record, legacy dataclass vs the
+  compact slotted NectarAccrualRecord, loaded from the same NDJSON
+- scoring: council confidence vectors for a large critical path, legacy
+  per-agent substring checks vs the single-pass ScoringEngine
+- routing: proposals and conflicts for a large critical path, per-task
+  deliberation loop vs the vectorized route_tasks() batch, then a
+  repeat deliberation served from the score cache
+- execution: end-to-end deployment throughput (execute, complete, ledger
+  accrual) running one task at a time vs the concurrent ExecutionEngine,
+  with agent work simulated as I/O latency
+- stealing: task completion latency (p50 / p95 / max) for a deployment
+  where one specialty is overloaded, without and with work stealing
+- cluster: ceremonies per second (convene, deliberate, propose) through
+  the cluster router for each worker count; a local multi-process
+  harness (needs fastapi and uvicorn)
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterator, List, Sequence
+
+from .agents import create_council, ScoringEngine, BatchRouter, score_cache, Task, TaskPriority
+from .agents.routing import _route_sequential
+from .cluster import http_request
+from .diligence_ledger import DiligenceLedger
+from .dispatch import DispatchQueue
+from .execution import ExecutionEngine
+from .ledger_store import NectarAccrualRecord
+
+
+@dataclass
+class LegacyAccrualRecord:
+    """The pre-compaction record layout (plain dataclass), for comparison"""
+    agent_name: str
+    task_id: str
+    task_title: str
+    repo: str
+    hours_worked: float
+    base_rate: float
+    quality_multiplier: float
+    nectar_accrued: float
+    timestamp: str
+    blockchain_eligible: bool = True
+
+
+AGENTS = ["Veda", "Aura", "Hex", "Node", "Spark", "Tess"]
+REPOS = ["sandironratio-node", "hive-core", "sofie-voice", "nectar-bridge"]
+TITLES = ["Implement API endpoint", "Review wellness metrics", "Design dashboard",
+          "Bridge integration", "Coordinate deployment", "Write documentation"]
+
+
+def sample_ndjson(count: int, seed: int = 7) -> List[str]:
+    """Ledger-like NDJSON lines, as a journal or export would hold them"""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    lines = []
+    for i in range(count):
+        hours = round(rng.uniform(0.5, 8.0), 2)
+        multiplier = rng.choice([1.0, 1.3, 1.5, 2.0, 3.0])
+        lines.append(json.dumps({
+            "agent_name": rng.choice(AGENTS),
+            "task_id": f"task-{i:08d}",
+            "task_title": rng.choice(TITLES),
+            "repo": rng.choice(REPOS),
+            "hours_worked": hours,
+            "base_rate": 10.0,
+            "quality_multiplier": multiplier,
+            "nectar_accrued": hours * 10.0 * multiplier,
+            "timestamp": (start + timedelta(seconds=i * 37, microseconds=i)).isoformat(),
+            "blockchain_eligible": True
+        }))
+    return lines
+
+
+def measure_records(factory: Callable[..., Any], lines: List[str]) -> Dict[str, Any]:
+    """Traced bytes retained by records built from NDJSON lines"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    records = [factory(**json.loads(line)) for line in lines]
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # List slots are not part of the record itself
+    retained -= len(records) * 8
+    return {
+        "records": len(records),
+        "bytes_total": retained,
+        "bytes_per_record": round(retained / len(records), 1)
+    }
+
+
+def bench_records(count: int = 100_000) -> Dict[str, Any]:
+    """Compare legacy and compact record memory"""
+    lines = sample_ndjson(count)
+    legacy = measure_records(LegacyAccrualRecord, lines)
+    compact = measure_records(NectarAccrualRecord, lines)
+
+    return {
+        "legacy_dataclass": legacy,
+        "compact_slotted": compact,
+        "reduction": f"{(1 - compact['bytes_total'] / legacy['bytes_total']) * 100:.1f}%"
+    }
+
+
+def legacy_score(agent: Any, description: str) -> float:
+    """The original per-agent can_handle_task() checks, for comparison"""
+    description_lower = description.lower()
+    matches = sum(1 for keyword in agent.SPECIALIZATION_KEYWORDS if keyword in description_lower)
+    confidence = min(1.0, matches / agent.MATCH_DIVISOR)
+    if any(term in description_lower for term in agent.BOOST_TERMS):
+        confidence = min(1.0, confidence + agent.BOOST_AMOUNT)
+    if any(term in description_lower for term in agent.PENALTY_TERMS):
+        confidence *= agent.PENALTY_FACTOR
+    return confidence
+
+
+def sample_critical_path(count: int, seed: int = 11) -> List[str]:
+    """Briefing-like task descriptions mixing every agent's vocabulary"""
+    rng = random.Random(seed)
+    with scratch_council() as council:
+        vocabulary = sorted({
+            term
+            for agent in council.values()
+            for term in agent.SPECIALIZATION_KEYWORDS + agent.BOOST_TERMS + agent.PENALTY_TERMS
+        })
+    filler = ["the", "for", "with", "new", "sofie", "hive", "ecosystem", "flow", "v2", "users"]
+
+    return [
+        " ".join(
+            rng.choice(vocabulary) if rng.random() < 0.35 else rng.choice(filler)
+            for _ in range(rng.randint(4, 14))
+        ).capitalize()
+        for _ in range(count)
+    ]
+
+
+def bench_scoring(tasks: int = 20_000) -> Dict[str, Any]:
+    """Compare legacy per-agent scoring with the single-pass engine"""
+    with scratch_council() as council:
+        engine = ScoringEngine.for_agents(council)
+        critical_path = sample_critical_path(tasks)
+
+        started = time.perf_counter()
+        legacy = [
+            {name: legacy_score(agent, task) for name, agent in council.items()}
+            for task in critical_path
+        ]
+        legacy_s = time.perf_counter() - started
+
+        score_cache.clear()
+        started = time.perf_counter()
+        single_pass = engine.score_many(critical_path)
+        engine_s = time.perf_counter() - started
+
+        return {
+            "tasks": tasks,
+            "agents": len(council),
+            "terms": len(engine.automaton.patterns),
+            "identical": legacy == single_pass,
+            "legacy_ms": round(legacy_s * 1000, 1),
+            "engine_ms": round(engine_s * 1000, 1),
+            "legacy_us_per_task": round(legacy_s / tasks * 1e6, 2),
+            "engine_us_per_task": round(engine_s / tasks * 1e6, 2),
+            "speedup": round(legacy_s / engine_s, 2)
+        }
+
+
+def bench_routing(tasks: int = 20_000) -> Dict[str, Any]:
+    """Compare per-task routing with the vectorized batch router"""
+    with scratch_council() as council:
+        engine = ScoringEngine.for_agents(council)
+        router = BatchRouter.for_agents(council)
+        critical_path = sample_critical_path(tasks)
+
+        score_cache.configure(maxsize=max(score_cache.maxsize, tasks))
+        score_cache.clear()
+        started = time.perf_counter()
+        sequential = _route_sequential(critical_path, engine)
+        sequential_s = time.perf_counter() - started
+
+        score_cache.clear()
+        started = time.perf_counter()
+        batched = router.route(critical_path)
+        batch_s = time.perf_counter() - started
+
+        # Sofie re-sends the same briefing: every row is a cache hit
+        started = time.perf_counter()
+        repeat = router.route(critical_path)
+        repeat_s = time.perf_counter() - started
+
+        return {
+            "tasks": tasks,
+            "agents": len(council),
+            "conflicts": len(batched["conflicts"]),
+            "identical": sequential == batched == repeat,
+            "sequential_ms": round(sequential_s * 1000, 1),
+            "batch_ms": round(batch_s * 1000, 1),
+            "repeat_ms": round(repeat_s * 1000, 1),
+            "sequential_us_per_task": round(sequential_s / tasks * 1e6, 2),
+            "batch_us_per_task": round(batch_s / tasks * 1e6, 2),
+            "speedup": round(sequential_s / batch_s, 2),
+            "repeat_speedup": round(sequential_s / repeat_s, 2),
+            "score_cache": score_cache.stats()
+        }
+
+
+@contextmanager
+def scratch_council() -> Iterator[Dict[str, Any]]:
+    """Council whose Hex ledger lives in a temporary directory, not ./data"""
+    with tempfile.TemporaryDirectory() as directory:
+        yield create_council(os.path.join(directory, "ledger.json"))
+
+
+def simulated_council(latency: float, ledger_path: str) -> Dict[str, Any]:
+    """Council whose execute_task is an awaited I/O wait (like a real repo/PR round-trip)"""
+    council = create_council(ledger_path)
+
+    async def work(task: Any) -> Dict[str, Any]:
+        await asyncio.sleep(latency)
+        return {"status": "completed"}
+
+    for agent in council.values():
+        agent.execute_task = work
+    return council
+
+
+async def run_deployment(tasks: int, latency: float, concurrent: bool) -> Dict[str, Any]:
+    """Deploy tasks round-robin across the council and wait for every accrual"""
+    with tempfile.TemporaryDirectory() as directory:
+        # Ledger first: Hex then shares its (journaled) store
+        ledger = DiligenceLedger(os.path.join(directory, "ledger.json"), journaled=True)
+        council = simulated_council(latency, str(ledger.ledger_path))
+        names = list(council)
+        engine = ExecutionEngine(council, ledger)
+
+        started = time.perf_counter()
+        for i in range(tasks):
+            task = Task(
+                id=f"bench-{i}", title=f"Task {i}", description=f"Task {i}",
+                repo="hive-core", priority=TaskPriority.HIGH, estimated_hours=2.0
+            )
+            run = engine.submit(names[i % len(names)], task)
+            if not concurrent:
+                await run
+        await engine.drain()
+        elapsed = time.perf_counter() - started
+
+        stats = engine.stats()
+        return {
+            "completed": stats["completed"],
+            "elapsed_s": round(elapsed, 3),
+            "tasks_per_s": round(tasks / elapsed, 1),
+            "peak_active": stats["peak_active"]
+        }
+
+
+def bench_execution(tasks: int = 600, latency_ms: float = 20.0) -> Dict[str, Any]:
+    """Compare one-at-a-time deployment with the concurrent execution engine"""
+    latency = latency_ms / 1000
+    sequential = asyncio.run(run_deployment(tasks, latency, concurrent=False))
+    concurrent = asyncio.run(run_deployment(tasks, latency, concurrent=True))
+
+    return {
+        "tasks": tasks,
+        "latency_ms": latency_ms,
+        "sequential": sequential,
+        "engine": concurrent,
+        "speedup": round(sequential["elapsed_s"] / concurrent["elapsed_s"], 2)
+    }
+
+
+async def run_overloaded(tasks: int, latency: float, steal: bool) -> Dict[str, Any]:
+    """
+    Deploy through the dispatch queue: half the work is planned for Spark
+    (coordination work Tess can also do), the rest spread over the council.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        # Ledger first: Hex then shares its (journaled) store
+        ledger = DiligenceLedger(os.path.join(directory, "ledger.json"), journaled=True)
+        council = simulated_council(latency, str(ledger.ledger_path))
+        names = list(council)
+        engine = ExecutionEngine(council, ledger)
+        dispatcher = DispatchQueue(council, engine, neighbors=None if steal else {})
+
+        started = time.perf_counter()
+        deployed_at = datetime.utcnow()
+        for i in range(tasks):
+            if i % 2 == 0:
+                agent_name, title = "spark", f"Coordinate build of new feature {i}"
+            else:
+                agent_name, title = names[(i // 2) % len(names)], f"Task {i}"
+            task = Task(
+                id=f"bench-{i}", title=title, description=title,
+                repo="hive-core", priority=TaskPriority.HIGH, estimated_hours=2.0
+            )
+            await dispatcher.submit(agent_name, task)
+
+        while engine.stats()["in_flight"] or dispatcher.stats()["queued"]:
+            await engine.drain()
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+
+        # Seconds from deployment until each task completed
+        latencies = sorted(
+            (datetime.fromisoformat(o["finished_at"]) - deployed_at).total_seconds()
+            for o in engine.outcomes.values()
+        )
+
+        def percentile(q: float) -> float:
+            return round(latencies[min(len(latencies) - 1, int(q * len(latencies)))], 3)
+
+        return {
+            "completed": engine.stats()["completed"],
+            "elapsed_s": round(elapsed, 3),
+            "p50_s": percentile(0.50),
+            "p95_s": percentile(0.95),
+            "max_s": round(latencies[-1], 3) if latencies else 0.0,
+            "stolen": dispatcher.stats()["stolen"]
+        }
+
+
+def bench_stealing(tasks: int = 240, latency_ms: float = 20.0) -> Dict[str, Any]:
+    """Tail latency of an overloaded specialty, without and with stealing"""
+    latency = latency_ms / 1000
+    without = asyncio.run(run_overloaded(tasks, latency, steal=False))
+    with_stealing = asyncio.run(run_overloaded(tasks, latency, steal=True))
+
+    return {
+        "tasks": tasks,
+        "latency_ms": latency_ms,
+        "no_stealing": without,
+        "work_stealing": with_stealing,
+        "p95_speedup": round(without["p95_s"] / with_stealing["p95_s"], 2)
+    }
+
+
+def ceremony_briefing(session_id: str, tasks: int) -> Dict[str, Any]:
+    """A briefing whose critical path is unique to the session (no shared score cache hits)"""
+    kinds = ("backend service", "api bridge", "ui component", "integration test", "documentation")
+    return {
+        "command": "convene",
+        "timestamp": datetime.utcnow().isoformat(),
+        "chief_architect_present": True,
+        "ecosystem_state": {},
+        "sofie_requirements": [],
+        "critical_path": [
+            f"Build {kinds[i % len(kinds)]} {i} for {session_id}" for i in range(tasks)
+        ],
+        "protected_notice": "sofie-llama-backend is sovereign territory"
+    }
+
+
+async def drive_ceremonies(
+    address: str,
+    sessions: int,
+    tasks: int,
+    concurrency: int,
+    pipelined: bool = False
+) -> Dict[str, Any]:
+    """
+    Run convene -> deliberate -> propose for many sessions concurrently,
+    as three requests or one pipelined POST /council/run.
+
+    Large briefings are vetoed by Aura (workload) after the full routing
+    pass, so their ceremony ends at deliberation.
+    """
+    gate = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def ceremony(index: int):
+        nonlocal failures
+        session_id = f"bench-{index}"
+        async with gate:
+            if pipelined:
+                status, _ = await http_request(
+                    address, "POST", f"/council/run?session_id={session_id}",
+                    ceremony_briefing(session_id, tasks), timeout=300.0
+                )
+                if status != 200:
+                    failures += 1
+                return
+            status, _ = await http_request(
+                address, "POST", f"/council/convene?session_id={session_id}",
+                ceremony_briefing(session_id, tasks), timeout=300.0
+            )
+            if status == 200:
+                status, result = await http_request(
+                    address, "POST", f"/council/deliberate?session_id={session_id}", timeout=300.0
+                )
+            if status == 200 and result.get("status") != "blocked":
+                status, _ = await http_request(
+                    address, "POST", f"/council/propose?session_id={session_id}", timeout=300.0
+                )
+            if status != 200:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(ceremony(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - started
+    return {
+        "ceremonies": sessions - failures,
+        "failed": failures,
+        "elapsed_s": round(elapsed, 3),
+        "ceremonies_per_s": round((sessions - failures) / elapsed, 2)
+    }
+
+
+async def wait_for_cluster(address: str, workers: int, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            status, body = await http_request(address, "GET", "/cluster/status", timeout=2.0)
+            if status == 200 and sum(w["healthy"] for w in body["workers"]) == workers:
+                return
+        except (OSError, asyncio.TimeoutError):
+            pass
+        await asyncio.sleep(0.25)
+    raise RuntimeError(f"Cluster at {address} did not come up with {workers} workers")
+
+
+def run_cluster_load(
+    workers: int,
+    sessions: int,
+    tasks: int,
+    concurrency: int,
+    port: int,
+    pipelined: bool = False
+) -> Dict[str, Any]:
+    """Start a local cluster in a scratch directory, drive it, stop it"""
+    root = Path(__file__).resolve().parents[2]
+    with tempfile.TemporaryDirectory() as directory:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(root), env.get("PYTHONPATH")]))
+        env["COUNCIL_LEDGER_PATH"] = os.path.join(directory, "ledger.json")
+        env["COUNCIL_SESSION_DIR"] = os.path.join(directory, "sessions")
+
+        cluster = subprocess.Popen(
+            [sys.executable, "-m", f"{__package__}.cluster",
+             "--workers", str(workers), "--host", "127.0.0.1", "--port", str(port)],
+            cwd=directory, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        try:
+            address = f"127.0.0.1:{port}"
+            asyncio.run(wait_for_cluster(address, workers))
+            load = drive_ceremonies(address, sessions, tasks, concurrency, pipelined)
+            return {"workers": workers, **asyncio.run(load)}
+        finally:
+            cluster.send_signal(signal.SIGTERM)
+            cluster.wait(timeout=30)
+
+
+def bench_cluster(
+    workers: Sequence[int] = (1, 2, 4),
+    sessions: int = 64,
+    tasks: int = 400,
+    concurrency: int = 16,
+    port: int = 9400,
+    pipelined: bool = False
+) -> Dict[str, Any]:
+    """Ceremony throughput through the cluster router as workers are added"""
+    runs = [run_cluster_load(count, sessions, tasks, concurrency, port, pipelined) for count in workers]
+    baseline = runs[0]["ceremonies_per_s"] or 1.0
+    for run in runs:
+        run["scaling"] = round(run["ceremonies_per_s"] / baseline, 2)
+
+    return {
+        "sessions": sessions,
+        "tasks_per_briefing": tasks,
+        "concurrency": concurrency,
+        "pipelined": pipelined,
+        "runs": runs
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Council micro-benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    records = sub.add_parser("records", help="Bytes per in-memory accrual record")
+    records.add_argument("--count", type=int, default=100_000)
+
+    scoring = sub.add_parser("scoring", help="Council task scoring throughput")
+    scoring.add_argument("--tasks", type=int, default=20_000)
+
+    routing = sub.add_parser("routing", help="Critical-path routing throughput")
+    routing.add_argument("--tasks", type=int, default=20_000)
+
+    execution = sub.add_parser("execution", help="End-to-end deployment throughput")
+    execution.add_argument("--tasks", type=int, default=600)
+    execution.add_argument("--latency-ms", type=float, default=20.0)
+
+    stealing = sub.add_parser("stealing", help="Tail latency with an overloaded specialty")
+    stealing.add_argument("--tasks", type=int, default=240)
+    stealing.add_argument("--latency-ms", type=float, default=20.0)
+
+    cluster = sub.add_parser("cluster", help="Ceremony throughput vs cluster worker count")
+    cluster.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    cluster.add_argument("--sessions", type=int, default=64)
+    cluster.add_argument("--tasks", type=int, default=400)
+    cluster.add_argument("--concurrency", type=int, default=16)
+    cluster.add_argument("--port", type=int, default=9400)
+    cluster.add_argument("--pipelined", action="store_true", help="One POST /council/run per ceremony")
+
+    args = parser.parse_args()
+
+    if args.bench == "records":
+        print(json.dumps(bench_records(args.count), indent=2))
+    elif args.bench == "scoring":
+        print(json.dumps(bench_scoring(args.tasks), indent=2))
+    elif args.bench == "routing":
+        print(json.dumps(bench_routing(args.tasks), indent=2))
+    elif args.bench == "execution":
+        print(json.dumps(bench_execution(args.tasks, args.latency_ms), indent=2))
+    elif args.bench == "stealing":
+        print(json.dumps(bench_stealing(args.tasks, args.latency_ms), indent=2))
+    elif args.bench == "cluster":
+        print(json.dumps(
+            bench_cluster(
+                args.workers, args.sessions, args.tasks, args.concurrency, args.port, args.pipelined
+            ),
+            indent=2
+        ))
+
+
+if __name__ == "__main__":
+    main()
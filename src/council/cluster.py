@@ -0,0 +1,676 @@
+"""
+Council Cluster - Session-sharded worker processes behind a hash router
+
+One uvicorn process caps how many ceremonies the council can run at
+once. Cluster mode spreads sessions over N worker processes:
+
+- Workers are ordinary api_server processes on consecutive ports. They
+  share one SQLite ledger (WAL, so every worker writes the same
+  accruals and reads the same totals) and one session directory
+- The router is a small asyncio HTTP proxy. It sends each request to the
+  worker that owns its session on a consistent-hash ring (virtual nodes
+  per worker), so every request of a ceremony lands on the same process
+- Session keys: ?session_id, else the authorization's session_id or
+  proposal ID ("<session_id>-<n>"), else the default session.
+  Task-scoped endpoints (complete, cancel, execution lookups) are tried
+  on each worker until one knows the task. A completion batch is sent to
+  every worker and each item's answer is taken from the worker that
+  knows its task
+- Event streams pass through: SSE responses are relayed as they arrive
+  and WebSocket upgrades are piped both ways. Sequence numbers are per
+  worker, so subscribe with ?session_id to follow one ceremony
+- Adding or removing a worker moves only the sessions whose ring owner
+  changes (about 1/N of them). Their old owners persist and release them
+  (POST /council/sessions/{id}/release); the new owner restores them
+  from the shared session directory on the next request
+- Router endpoints: GET /cluster/status, POST /cluster/workers (spawn a
+  local worker, or attach {"address": "host:port"}) and
+  DELETE /cluster/workers/{address}
+
+Each worker has its own six agents, so agent capacity (and the dispatch
+queue) is per worker unless COUNCIL_SHARED_STATE makes slots council-wide
+(shared_state.py).
+
+Run with:
+    python -m src.council.cluster --workers 4 --port 9000
+"""
+
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .convening import DEFAULT_SESSION
+from .ledger_store import DEFAULT_LEDGER_PATH
+from .sessions import session_of_proposal
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_REPLICAS = 128          # Virtual nodes per worker on the ring
+DEFAULT_SESSION_DIR = "./data/sessions"
+HEALTH_TIMEOUT = 30.0           # Seconds a new worker has to answer /health
+BATCH_TIMEOUT = 300.0           # Seconds for each worker's part of a completion batch
+MAX_HEADER_BYTES = 64 * 1024
+
+# Worker settings the cluster needs: a ledger every process can write,
+# and no per-process ledger indexes that would diverge between workers
+WORKER_ENV = {
+    "COUNCIL_LEDGER_BACKEND": "sqlite",
+    "COUNCIL_LEDGER_MERKLE": "false",
+    "COUNCIL_LEDGER_COLUMNAR": "false",
+}
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring of worker addresses.
+
+    Each worker owns `replicas` points on the ring; a key belongs to the
+    first point clockwise from its hash. Adding a worker only takes over
+    keys from the arcs its new points split.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = DEFAULT_REPLICAS):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._nodes)
+
+    def add(self, node: str):
+        if node in self._nodes:
+            return
+        self._nodes.append(node)
+        for replica in range(self.replicas):
+            point = _hash(f"{node}#{replica}")
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._owners.insert(index, node)
+
+    def remove(self, node: str):
+        if node not in self._nodes:
+            return
+        self._nodes.remove(node)
+        kept = [(p, o) for p, o in zip(self._points, self._owners) if o != node]
+        self._points = [p for p, _ in kept]
+        self._owners = [o for _, o in kept]
+
+    def node_for(self, key: str) -> Optional[str]:
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[index]
+
+    def copy(self) -> 'HashRing':
+        ring = HashRing(replicas=self.replicas)
+        ring._points = list(self._points)
+        ring._owners = list(self._owners)
+        ring._nodes = list(self._nodes)
+        return ring
+
+
+def _split_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+async def http_request(
+    address: str,
+    method: str,
+    path: str,
+    body: Optional[Dict[str, Any]] = None,
+    timeout: float = 30.0
+) -> Tuple[int, Any]:
+    """
+    Minimal JSON HTTP/1.1 client (one connection per request).
+
+    Returns:
+        (status code, decoded JSON body or None)
+    """
+    host, port = _split_address(address)
+    payload = json.dumps(body).encode() if body is not None else b""
+
+    async def exchange() -> bytes:
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: {address}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n".encode() + payload
+            )
+            await writer.drain()
+            return await reader.read()
+        finally:
+            writer.close()
+
+    raw = await asyncio.wait_for(exchange(), timeout)
+    head, _, content = raw.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {
+        name.strip().lower(): value.strip()
+        for name, _, value in (line.partition(":") for line in lines[1:])
+    }
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        content = _dechunk(content)
+
+    try:
+        return status, json.loads(content) if content else None
+    except ValueError:
+        return status, None
+
+
+def _dechunk(content: bytes) -> bytes:
+    chunks = []
+    while content:
+        size_line, _, content = content.partition(b"\r\n")
+        size = int(size_line.split(b";")[0], 16)
+        if size == 0:
+            break
+        chunks.append(content[:size])
+        content = content[size + 2:]
+    return b"".join(chunks)
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Copy bytes until EOF (event streams are flushed as they arrive)"""
+    try:
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                break
+            writer.write(chunk)
+            await writer.drain()
+    finally:
+        if writer.can_write_eof():
+            try:
+                writer.write_eof()
+            except OSError:
+                pass
+
+
+class ProxyRequest:
+    """One client request, buffered so it can be replayed to several workers"""
+
+    def __init__(self, method: str, target: str, headers: List[Tuple[str, str]], body: bytes):
+        self.method = method
+        self.target = target
+        self.headers = headers
+        self.body = body
+
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+    @classmethod
+    async def read(cls, reader: asyncio.StreamReader) -> Optional['ProxyRequest']:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return None
+
+        lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        method, target, _ = lines[0].split(" ", 2)
+        headers = []
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers.append((name.strip(), value.strip()))
+
+        length = next((int(v) for n, v in headers if n.lower() == "content-length"), 0)
+        body = await reader.readexactly(length) if length else b""
+        return cls(method.upper(), target, headers, body)
+
+    @property
+    def upgrade(self) -> bool:
+        """WebSocket (or other protocol) upgrade request"""
+        return any(name.lower() == "upgrade" for name, _ in self.headers)
+
+    def json(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.body) if self.body else {}
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def encode(self, address: str) -> bytes:
+        """The request as sent upstream (one request per connection)"""
+        skip = {"connection", "keep-alive", "host", "content-length", "transfer-encoding"}
+        lines = [f"{self.method} {self.target} HTTP/1.1", f"Host: {address}"]
+        lines += [f"{name}: {value}" for name, value in self.headers if name.lower() not in skip]
+        lines += [f"Content-Length: {len(self.body)}"]
+        lines += ["Connection: Upgrade"] if self.upgrade else ["Connection: close"]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + self.body
+
+
+class ClusterRouter:
+    """
+    Consistent-hash front router for council workers.
+
+    Usage:
+        router = ClusterRouter(["127.0.0.1:9001", "127.0.0.1:9002"])
+        await router.serve("0.0.0.0", 9000)
+    """
+
+    def __init__(
+        self,
+        workers: Iterable[str] = (),
+        replicas: int = DEFAULT_REPLICAS,
+        spawn: Optional[Any] = None  # async () -> address, for POST /cluster/workers
+    ):
+        self.ring = HashRing(workers, replicas)
+        self.spawn = spawn
+        self._rebalance = asyncio.Lock()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        # Metrics
+        self.requests = 0
+        self.by_worker: Dict[str, int] = {worker: 0 for worker in self.ring.nodes}
+        self.fanouts = 0
+        self.errors = 0
+        self.moved = 0
+
+    def session_key(self, request: ProxyRequest) -> Optional[str]:
+        """
+        Session a request belongs to (None: task-scoped, ask every worker).
+        """
+        if request.query.get("session_id"):
+            return request.query["session_id"]
+
+        if request.method == "POST" and request.path == "/council/authorize":
+            body = request.json()
+            if body.get("session_id"):
+                return str(body["session_id"])
+            return session_of_proposal(str(body.get("proposal_id", ""))) or DEFAULT_SESSION
+
+        # Task-scoped: completions, cancellations and outcome lookups
+        if request.method == "POST" and (
+            request.path == "/council/complete" or request.path.startswith("/council/tasks/")
+        ):
+            return None
+        if request.method == "GET" and request.path == "/council/execution" and "task_id" in request.query:
+            return None
+
+        return DEFAULT_SESSION
+
+    async def serve(self, host: str = "0.0.0.0", port: int = 9000):
+        self._server = await asyncio.start_server(self._handle, host, port, limit=MAX_HEADER_BYTES)
+        logger.info(f"🕸️ Cluster router on {host}:{port} ({len(self.ring.nodes)} workers)")
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request = await ProxyRequest.read(reader)
+            if request is None:
+                return
+            self.requests += 1
+
+            if request.path.startswith("/cluster/"):
+                await self._local(request, writer)
+                return
+            if request.method == "POST" and request.path == "/council/complete/batch" and len(self.ring.nodes) > 1:
+                await self._complete_batch(request, writer)
+                return
+
+            key = self.session_key(request)
+            if key is None:
+                self.fanouts += 1
+                workers = self.ring.nodes
+            else:
+                workers = [self.ring.node_for(key)]
+
+            if not workers or workers[0] is None:
+                self._respond(writer, 503, {"detail": "No council workers"})
+                return
+            await self._forward(request, workers, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            self.errors += 1
+            logger.warning(f"🕸️ Proxy error: {e}")
+        finally:
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def _forward(
+        self,
+        request: ProxyRequest,
+        workers: List[str],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ):
+        """Relay the first answer that is not a 404 (the last worker's otherwise)"""
+        for position, worker in enumerate(workers):
+            last = position == len(workers) - 1
+            try:
+                upstream_reader, upstream_writer = await asyncio.open_connection(*_split_address(worker))
+            except OSError:
+                self.errors += 1
+                if last:
+                    self._respond(writer, 502, {"detail": f"Worker unavailable: {worker}"})
+                continue
+
+            try:
+                upstream_writer.write(request.encode(worker))
+                await upstream_writer.drain()
+                status_line = await upstream_reader.readline()
+                if not last and b" 404 " in status_line:
+                    continue
+
+                self.by_worker[worker] = self.by_worker.get(worker, 0) + 1
+                writer.write(status_line)
+                if request.upgrade and b" 101 " in status_line:
+                    # Upgraded: the client keeps talking to the worker
+                    await asyncio.gather(
+                        _pipe(upstream_reader, writer),
+                        _pipe(reader, upstream_writer)
+                    )
+                else:
+                    await _pipe(upstream_reader, writer)
+                return
+            finally:
+                upstream_writer.close()
+
+    async def _complete_batch(self, request: ProxyRequest, writer: asyncio.StreamWriter):
+        """
+        Send a completion batch to every worker and merge the per-item
+        results: workers that do not know a task answer not_found for it
+        """
+        self.fanouts += 1
+        workers = self.ring.nodes
+        replies = await asyncio.gather(
+            *(http_request(worker, "POST", request.target, request.json(), timeout=BATCH_TIMEOUT)
+              for worker in workers),
+            return_exceptions=True
+        )
+
+        merged: Optional[List[Dict[str, Any]]] = None
+        failure: Tuple[int, Any] = (502, {"detail": "No worker accepted the batch"})
+        for worker, reply in zip(workers, replies):
+            if isinstance(reply, Exception):
+                self.errors += 1
+                logger.warning(f"🕸️ Batch to {worker} failed: {reply}")
+                continue
+            status, body = reply
+            if status != 200 or not isinstance(body, dict):
+                failure = (status, body)
+                continue
+            self.by_worker[worker] = self.by_worker.get(worker, 0) + 1
+            if merged is None:
+                merged = body["results"]
+                continue
+            for index, result in enumerate(body["results"]):
+                if merged[index]["status"] == "not_found":
+                    merged[index] = result
+
+        if merged is None:
+            self._respond(writer, failure[0], failure[1] or {"detail": "Batch failed"})
+            return
+        self._respond(writer, 200, {
+            "results": merged,
+            "completed": sum(1 for r in merged if r["status"] == "completed"),
+            "failed": sum(1 for r in merged if r["status"] != "completed"),
+            "replayed": sum(1 for r in merged if r.get("replayed"))
+        })
+
+    def _respond(self, writer: asyncio.StreamWriter, status: int, body: Dict[str, Any]):
+        payload = json.dumps(body, default=str).encode()
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 422: "Unprocessable Entity",
+                  500: "Internal Server Error", 502: "Bad Gateway",
+                  503: "Service Unavailable"}.get(status, "")
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+        )
+
+    async def _local(self, request: ProxyRequest, writer: asyncio.StreamWriter):
+        """The router's own /cluster/* endpoints (502 if a worker fails mid-request)"""
+        try:
+            await self._cluster_endpoint(request, writer)
+        except (OSError, asyncio.TimeoutError) as e:
+            self.errors += 1
+            logger.warning(f"🕸️ Cluster request failed: {e}")
+            self._respond(writer, 502, {"detail": f"Worker request failed: {e}"})
+
+    async def _cluster_endpoint(self, request: ProxyRequest, writer: asyncio.StreamWriter):
+        if request.method == "GET" and request.path == "/cluster/status":
+            self._respond(writer, 200, await self.status())
+        elif request.method == "POST" and request.path == "/cluster/workers":
+            address = request.json().get("address")
+            if not address:
+                if self.spawn is None:
+                    self._respond(writer, 400, {"detail": "address required (router cannot spawn workers)"})
+                    return
+                address = await self.spawn()
+            self._respond(writer, 200, await self.add_worker(address))
+        elif request.method == "DELETE" and request.path.startswith("/cluster/workers/"):
+            address = request.path[len("/cluster/workers/"):]
+            if address not in self.ring.nodes:
+                self._respond(writer, 404, {"detail": f"Unknown worker: {address}"})
+                return
+            self._respond(writer, 200, await self.remove_worker(address))
+        else:
+            self._respond(writer, 404, {"detail": "Not Found"})
+
+    async def add_worker(self, address: str) -> Dict[str, Any]:
+        """Put a worker on the ring; hand over the sessions it now owns"""
+        async with self._rebalance:
+            ring = self.ring.copy()
+            ring.add(address)
+            moved = await self._switch(ring)
+            self.by_worker.setdefault(address, 0)
+            logger.info(f"🕸️ Worker {address} joined ({len(moved)} sessions moved)")
+            return {"added": address, "workers": ring.nodes, "moved_sessions": moved}
+
+    async def remove_worker(self, address: str) -> Dict[str, Any]:
+        """Take a worker off the ring; its sessions move to their new owners"""
+        async with self._rebalance:
+            ring = self.ring.copy()
+            ring.remove(address)
+            moved = await self._switch(ring, also=[address])
+            logger.info(f"🕸️ Worker {address} left ({len(moved)} sessions moved)")
+            return {"removed": address, "workers": ring.nodes, "moved_sessions": moved}
+
+    async def _switch(self, ring: HashRing, also: Iterable[str] = ()) -> List[str]:
+        """
+        Release moved sessions, switch rings, then release again: a session
+        restored on its old owner while the ring was switching is handed
+        over by the second pass.
+        """
+        holders = list(dict.fromkeys(self.ring.nodes + list(also)))
+        moved = await self._hand_off(ring, holders)
+        self.ring = ring
+        moved += await self._hand_off(ring, holders)
+        self.moved += len(moved)
+        return sorted(set(moved))
+
+    async def _hand_off(self, ring: HashRing, holders: List[str]) -> List[str]:
+        moved = []
+        for worker in holders:
+            try:
+                status, stats = await http_request(worker, "GET", "/council/sessions")
+            except (OSError, asyncio.TimeoutError):
+                continue
+            if status != 200 or not stats:
+                continue
+
+            for entry in stats.get("sessions", []):
+                session_id = entry["session_id"]
+                if ring.node_for(session_id) == worker:
+                    continue
+                try:
+                    status, result = await http_request(
+                        worker, "POST", f"/council/sessions/{session_id}/release"
+                    )
+                except (OSError, asyncio.TimeoutError) as e:
+                    self.errors += 1
+                    logger.warning(f"🕸️ Could not move session {session_id} off {worker}: {e}")
+                    continue
+                if status == 200 and result and result.get("released"):
+                    moved.append(session_id)
+                else:
+                    logger.warning(f"🕸️ Could not move session {session_id} off {worker}")
+        return moved
+
+    async def status(self) -> Dict[str, Any]:
+        """Ring membership, per-worker health and sessions, router counters"""
+        async def worker_status(worker: str) -> Dict[str, Any]:
+            try:
+                status, stats = await http_request(worker, "GET", "/council/sessions", timeout=5.0)
+            except (OSError, asyncio.TimeoutError) as e:
+                return {"address": worker, "healthy": False, "error": str(e)}
+            return {
+                "address": worker,
+                "healthy": status == 200,
+                "requests": self.by_worker.get(worker, 0),
+                "live_sessions": (stats or {}).get("live"),
+                "sessions": [entry["session_id"] for entry in (stats or {}).get("sessions", [])]
+            }
+
+        return {
+            "workers": await asyncio.gather(*(worker_status(w) for w in self.ring.nodes)),
+            "replicas": self.ring.replicas,
+            "requests": self.requests,
+            "fanouts": self.fanouts,
+            "errors": self.errors,
+            "moved_sessions": self.moved
+        }
+
+
+class WorkerPool:
+    """
+    Local api_server worker processes for the cluster.
+
+    Workers run `uvicorn <package>.api_server:app` on consecutive ports
+    from base_port, with the cluster's worker environment.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", base_port: int = 9001):
+        self.host = host
+        self.next_port = base_port
+        self.processes: Dict[str, asyncio.subprocess.Process] = {}
+        self.env = self._worker_env()
+
+    @staticmethod
+    def _worker_env() -> Dict[str, str]:
+        env = dict(os.environ)
+        for name, value in WORKER_ENV.items():
+            if env.get(name, value).lower() != value:
+                logger.warning(f"🕸️ Cluster workers run with {name}={value} (was {env[name]})")
+            env[name] = value
+        env.setdefault("COUNCIL_SESSION_DIR", DEFAULT_SESSION_DIR)
+        return env
+
+    def prepare_ledger(self):
+        """Create and migrate the shared database once, before workers race to"""
+        from .ledger_sqlite import SQLiteLedgerStore
+
+        SQLiteLedgerStore(self.env.get("COUNCIL_LEDGER_PATH", DEFAULT_LEDGER_PATH)).close()
+
+    async def spawn(self) -> str:
+        """Start a worker and wait until it answers /health"""
+        port = self.next_port
+        self.next_port += 1
+        address = f"{self.host}:{port}"
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "uvicorn", f"{__package__}.api_server:app",
+            "--host", self.host, "--port", str(port), "--log-level", "warning",
+            env=self.env
+        )
+        self.processes[address] = process
+
+        deadline = time.monotonic() + HEALTH_TIMEOUT
+        while time.monotonic() < deadline:
+            if process.returncode is not None:
+                raise RuntimeError(f"Worker {address} exited with {process.returncode}")
+            try:
+                status, _ = await http_request(address, "GET", "/health", timeout=1.0)
+                if status == 200:
+                    logger.info(f"🕸️ Worker {address} ready (pid {process.pid})")
+                    return address
+            except (OSError, asyncio.TimeoutError):
+                pass
+            await asyncio.sleep(0.2)
+
+        process.terminate()
+        raise RuntimeError(f"Worker {address} did not become healthy in {HEALTH_TIMEOUT}s")
+
+    async def stop(self, address: Optional[str] = None):
+        """Stop one worker, or all (SIGTERM: workers persist their sessions)"""
+        addresses = [address] if address else list(self.processes)
+        for name in addresses:
+            process = self.processes.pop(name, None)
+            if process and process.returncode is None:
+                process.terminate()
+                await process.wait()
+
+
+async def run_cluster(
+    workers: int,
+    host: str = "0.0.0.0",
+    port: int = 9000,
+    base_port: Optional[int] = None,
+    replicas: int = DEFAULT_REPLICAS
+):
+    """Spawn workers, serve the router until SIGINT / SIGTERM"""
+    pool = WorkerPool(base_port=base_port or port + 1)
+    pool.prepare_ledger()
+    Path(pool.env["COUNCIL_SESSION_DIR"]).mkdir(parents=True, exist_ok=True)
+
+    addresses = await asyncio.gather(*(pool.spawn() for _ in range(workers)))
+    router = ClusterRouter(addresses, replicas, spawn=pool.spawn)
+    await router.serve(host, port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    try:
+        await stop.wait()
+    finally:
+        await router.close()
+        await pool.stop()
+        logger.info("🕸️ Cluster stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Council cluster: session-sharded workers")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("COUNCIL_CLUSTER_WORKERS", "4")))
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--base-port", type=int, default=None, help="First worker port (default: port + 1)")
+    parser.add_argument(
+        "--replicas", type=int, default=int(os.getenv("COUNCIL_CLUSTER_REPLICAS", str(DEFAULT_REPLICAS)))
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_cluster(args.workers, args.host, args.port, args.base_port, args.replicas))
+
+
+if __name__ == "__main__":
+    main()
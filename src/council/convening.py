@@ -15,17 +15,32 @@ Enforces absolute sovereignty protection for sofie-llama-backend.
 import asyncio
 import json
 import logging
+import os
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 from enum import Enum
 
-from .agents import create_council, BaseAgent, Task, TaskPriority
+from .agents import (
+    create_council, BaseAgent, Task, TaskPriority, TaskGraph, DependencyCycleError, score_cache
+)
 from .protected_repos import is_sovereign_territory, SovereignTerritoryError
 from .diligence_ledger import DiligenceLedger
+from .ledger_store import DEFAULT_LEDGER_PATH
+from .ledger_compaction import LedgerCompactor
+from .deliberation_state import DeliberationState
+from .execution import ExecutionEngine
+from .dispatch import DispatchQueue
+from .shared_state import SharedState, CapacitySync
+from .events import EventBus, EventType
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_SESSION = "default"  # Ceremony used by clients that send no session ID
+MAX_COMPLETION_BATCH = 1000  # Completions per record_task_completions call
+
+
 class ConveningPhase(Enum):
     """Phases of the Convening Ceremony"""
     IDLE = "idle"
@@ -37,6 +52,383 @@ class ConveningPhase(Enum):
     COMPLETE = "complete"
 
 
+class CouncilResources:
+    """
+    What every ceremony in the process shares.
+    
+    The six agents (one capacity and biometrics account), the diligence
+    ledger, the execution engine, the dispatch queue and ledger
+    compaction. Configured from COUNCIL_* environment variables.
+    """
+    
+    def __init__(self):
+        # State shared with other API worker processes (unset: this process only)
+        shared_path = os.getenv("COUNCIL_SHARED_STATE")
+        self.shared_state = SharedState(shared_path) if shared_path else None
+        
+        backend = os.getenv("COUNCIL_LEDGER_BACKEND", "json")
+        columnar = os.getenv("COUNCIL_LEDGER_COLUMNAR", "false").lower() == "true"
+        merkle = os.getenv("COUNCIL_LEDGER_MERKLE", "false").lower() == "true"
+        if self.shared_state:
+            # Workers share ledger totals through the sqlite database; the
+            # columnar archive and Merkle log are per-process indexes
+            if backend != "sqlite" or columnar or merkle:
+                logger.warning("🗄️ Shared state: using the sqlite ledger without columnar/Merkle indexes")
+            backend, columnar, merkle = "sqlite", False, False
+        
+        # Open the shared ledger store first so Hex writes through the same one
+        self.ledger = DiligenceLedger(
+            ledger_path=os.getenv("COUNCIL_LEDGER_PATH", DEFAULT_LEDGER_PATH),
+            journaled=os.getenv("COUNCIL_LEDGER_JOURNAL", "false").lower() == "true",
+            backend=backend,
+            group_commit=os.getenv("COUNCIL_LEDGER_GROUP_COMMIT", "false").lower() == "true",
+            max_batch_size=int(os.getenv("COUNCIL_LEDGER_BATCH_SIZE", "64")),
+            max_batch_latency=float(os.getenv("COUNCIL_LEDGER_BATCH_LATENCY_MS", "5")) / 1000,
+            columnar=columnar,
+            merkle=merkle
+        )
+        self.agents = create_council(str(self.ledger.ledger_path))
+        
+        # Pushes ceremony, task, ledger and biometrics activity to subscribers
+        self.events = EventBus(history_size=int(os.getenv("COUNCIL_EVENT_HISTORY", "10000")))
+        self.ledger.event_bus = self.events
+        for agent in self.agents.values():
+            agent.event_bus = self.events
+        
+        # Agent slots are taken council-wide, across worker processes
+        self.capacity_sync: Optional[CapacitySync] = None
+        if self.shared_state:
+            for agent in self.agents.values():
+                agent.capacity_gate = self.shared_state
+            self.capacity_sync = CapacitySync(self)
+            self.sync_capacity()
+        
+        # Memoized confidence vectors for recurring critical-path tasks
+        score_cache.configure(
+            maxsize=int(os.getenv("COUNCIL_SCORE_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("COUNCIL_SCORE_CACHE_TTL", "3600"))
+        )
+        
+        # Runs deployed tasks to completion (per-agent concurrency limits)
+        self.executor = ExecutionEngine(
+            self.agents,
+            self.ledger,
+            task_timeout=float(os.getenv("COUNCIL_TASK_TIMEOUT", "300"))
+        )
+        
+        # Capacity-blocked tasks wait here by priority; idle ring neighbors steal them
+        self.dispatcher = DispatchQueue(self.agents, self.executor)
+        
+        # Task distribution solver: greedy (default) or optimal (min-cost flow)
+        self.distribution_solver = os.getenv("COUNCIL_DISTRIBUTION_SOLVER", "greedy")
+        
+        # Idempotency keys of recent completions -> (agent, task) and result
+        self.max_completion_keys = int(os.getenv("COUNCIL_IDEMPOTENCY_KEYS", "10000"))
+        self._completion_keys: "OrderedDict[str, Tuple[Tuple[str, str], asyncio.Future]]" = OrderedDict()
+        self.completions_replayed = 0
+        self._completing: set = set()  # (agent, task_id) of batch items awaiting their ledger write
+        
+        # Periodic snapshot + segment archival (started by the API server)
+        self.compactor = LedgerCompactor(
+            self.ledger.store,
+            interval_seconds=float(os.getenv("COUNCIL_LEDGER_COMPACTION_INTERVAL", "300"))
+        )
+    
+    def sync_capacity(self):
+        """Mirror council-wide slot usage into the agents (shared state only)"""
+        if not self.shared_state:
+            return
+        in_use = self.shared_state.slot_counts()
+        for name, agent in self.agents.items():
+            agent.biometrics.concurrent_tasks = in_use.get(name, 0)
+    
+    async def daily_standup(self) -> Dict[str, Any]:
+        """
+        Daily standup report from all agents.
+        
+        Returns:
+            Status report for Sofie
+        """
+        logger.info("📋 Daily Standup Report")
+        
+        reports = []
+        for name, agent in self.agents.items():
+            report = {
+                "agent": name,
+                "status": agent.biometrics.current_status.value,
+                "current_task": agent.current_task.title if agent.current_task else None,
+                "tasks_completed_today": len([
+                    t for t in agent.task_history
+                    if t.completed_at and t.completed_at.startswith(datetime.utcnow().strftime("%Y-%m-%d"))
+                ]),
+                "biometrics": agent.biometrics.to_dict(),
+                "nectar_accrued": agent.total_nectar_accrued
+            }
+            reports.append(report)
+        
+        return {
+            "timestamp": datetime.utcnow().isoformat(),
+            "standup_reports": reports,
+            "council_health": self._assess_council_health(),
+            "blockers": self._identify_blockers()
+        }
+    
+    async def record_task_completion(
+        self,
+        agent_name: str,
+        task_id: str,
+        hours_worked: float,
+        quality_score: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        Record task completion and accrue NECTAR.
+        
+        This is called after work is done - purely accrual. A batch of
+        one: the accrual is persisted before the task is completed, and a
+        failed ledger write is raised with nothing accrued or completed.
+        
+        Returns:
+            The completion result (see record_task_completions)
+        """
+        results = await self.record_task_completions([{
+            "agent_name": agent_name,
+            "task_id": task_id,
+            "hours_worked": hours_worked,
+            "quality_score": quality_score
+        }])
+        return results[0]
+    
+    async def record_task_completions(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Complete many tasks and accrue them with one ledger write.
+        
+        Each completion has agent_name, task_id, hours_worked, optional
+        quality_score and optional idempotency_key. Every item is
+        validated first, then all accruals are persisted in a single
+        ledger transaction, and only then are the tasks completed on their
+        agents. If the ledger write fails nothing is accrued or completed
+        and the error is raised, so the batch can be retried as is. If an
+        agent fails to complete its task the item gets an "error" result
+        (still carrying its accrual) and the rest of the batch goes on.
+        
+        A completion whose idempotency_key was seen before is not applied
+        again: it gets the first result back (replayed: true), waiting
+        for it if that completion is still in flight. Reusing a key for a
+        different task is an error.
+        
+        Returns:
+            One result per completion, in order; status is "completed",
+            "not_found" (unknown agent or task) or "error"
+        
+        Raises:
+            ValueError: More than MAX_COMPLETION_BATCH completions
+        """
+        if len(completions) > MAX_COMPLETION_BATCH:
+            raise ValueError(f"At most {MAX_COMPLETION_BATCH} completions per batch")
+        
+        loop = asyncio.get_running_loop()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(completions)
+        claimed: Dict[int, Tuple[str, asyncio.Future]] = {}  # Keys first seen in this batch
+        replays: Dict[int, asyncio.Future] = {}
+        accrue: List[Tuple[int, Task]] = []
+        
+        # Pass 1: idempotency and validation (tasks are reserved, not completed yet)
+        for index, completion in enumerate(completions):
+            agent_name, task_id = completion["agent_name"], completion["task_id"]
+            key = completion.get("idempotency_key")
+            if key:
+                seen = self._completion_keys.get(key)
+                if seen is not None:
+                    if seen[0] != (agent_name, task_id):
+                        results[index] = self._completion_error(
+                            agent_name, task_id, f"Idempotency key reused for another task: {key}"
+                        )
+                    else:
+                        replays[index] = seen[1]
+                    continue
+                claimed[index] = (key, loop.create_future())
+                self._completion_keys[key] = ((agent_name, task_id), claimed[index][1])
+            
+            task, error = self._completable(agent_name, task_id)
+            if error:
+                results[index] = self._completion_error(agent_name, task_id, error)
+                continue
+            self._completing.add((agent_name, task_id))
+            accrue.append((index, task))
+        
+        # Pass 2: every accrual in one ledger write (none if nothing validated)
+        try:
+            accruals = accrue and await self.ledger.arecord_completions([
+                {
+                    "agent_name": completions[index]["agent_name"],
+                    "task": task,
+                    "hours_worked": completions[index]["hours_worked"],
+                    "quality_score": completions[index].get("quality_score", 1.0),
+                    "stolen_from": task.stolen_from
+                }
+                for index, task in accrue
+            ])
+        except Exception as e:
+            # Nothing was persisted or completed: forget the keys so a retry applies
+            for index, _ in accrue:
+                self._completing.discard((completions[index]["agent_name"], completions[index]["task_id"]))
+            for key, future in claimed.values():
+                self._completion_keys.pop(key, None)
+                future.set_exception(e)
+                future.exception()  # Retrieved: waiters get it raised
+            raise
+        
+        # Pass 3: the accruals are durable; complete the tasks one by one
+        try:
+            for (index, _), accrual in zip(accrue, accruals):
+                completion = completions[index]
+                agent_name, task_id = completion["agent_name"], completion["task_id"]
+                self._completing.discard((agent_name, task_id))
+                accrued = {
+                    "nectar_accrued": accrual["nectar_accrued"],
+                    "total_accrued": accrual["total_accrued"]
+                }
+                try:
+                    await self.agents[agent_name].complete_task(
+                        task_id, {}, completion.get("quality_score", 1.0)
+                    )
+                except Exception as e:
+                    logger.error(f"Accrued {task_id} but {agent_name} failed to complete it: {e}")
+                    results[index] = {
+                        **self._completion_error(agent_name, task_id, f"Accrued but not completed: {e}"),
+                        **accrued
+                    }
+                    continue
+                results[index] = {"status": "completed", "task": task_id, "agent": agent_name, **accrued}
+        except BaseException as e:
+            # Cancelled mid-batch: release the rest and fail their waiters
+            for index, _ in accrue:
+                self._completing.discard((completions[index]["agent_name"], completions[index]["task_id"]))
+            self._settle_claimed(claimed, results, e)
+            raise
+        
+        self._settle_claimed(claimed, results)
+        
+        for index, future in replays.items():
+            completion = completions[index]
+            try:
+                results[index] = {**await future, "replayed": True}
+                self.completions_replayed += 1
+            except Exception as e:
+                results[index] = self._completion_error(
+                    completion["agent_name"], completion["task_id"], f"Original completion failed: {e}"
+                )
+        
+        return results
+    
+    def _settle_claimed(
+        self,
+        claimed: Dict[int, Tuple[str, asyncio.Future]],
+        results: List[Optional[Dict[str, Any]]],
+        error: Optional[BaseException] = None
+    ):
+        """Resolve the batch's idempotency futures (error: for items left without a result)"""
+        for index, (key, future) in claimed.items():
+            result = results[index]
+            if result is None:
+                future.set_exception(error)
+                future.exception()  # Retrieved: waiters get it raised
+                continue
+            future.set_result(result)
+            if result["status"] != "completed" and "nectar_accrued" not in result:
+                # Only accrued items are remembered: a retry must not accrue them again
+                self._completion_keys.pop(key, None)
+        self._trim_completion_keys()
+    
+    def _completable(self, agent_name: str, task_id: str) -> Tuple[Optional[Task], Optional[str]]:
+        """(task, None) if the task can be completed, else (None, error)"""
+        if agent_name not in self.agents:
+            return None, f"Unknown agent: {agent_name}"
+        
+        task = self.agents[agent_name].tasks.get(task_id)
+        if not task:
+            return None, f"Task not found: {task_id}"
+        if task.status == "completed":
+            # The execution engine already completed and accrued it
+            return None, f"Task already completed: {task_id}"
+        if (agent_name, task_id) in self._completing:
+            return None, f"Task is being completed: {task_id}"
+        if self.executor.is_running(task_id):
+            # The engine completes and accrues it when execute_task returns
+            return None, f"Task is executing: {task_id}"
+        if self.dispatcher.is_queued(task_id):
+            return None, f"Task is queued: {task_id}"
+        return task, None
+    
+    @staticmethod
+    def _completion_error(agent_name: str, task_id: str, error: str) -> Dict[str, Any]:
+        not_found = error.startswith(("Unknown agent", "Task not found"))
+        return {
+            "status": "not_found" if not_found else "error",
+            "task": task_id,
+            "agent": agent_name,
+            "error": error
+        }
+    
+    def _trim_completion_keys(self):
+        """Forget the oldest finished keys past max_completion_keys"""
+        while len(self._completion_keys) > self.max_completion_keys:
+            key, (_, future) = next(iter(self._completion_keys.items()))
+            if not future.done():
+                break
+            del self._completion_keys[key]
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        """Cancel a deployed task that is queued, waiting or executing"""
+        if self.dispatcher.cancel(task_id):
+            return {"status": "cancelled", "task": task_id}
+        if not self.executor.cancel(task_id):
+            return {"error": f"Task not running: {task_id}"}
+        return {"status": "cancelling", "task": task_id}
+    
+    def _assess_council_health(self) -> str:
+        """Assess overall health of the council"""
+        stressed_agents = [
+            name for name, agent in self.agents.items()
+            if agent.biometrics.stress_level > 0.6
+        ]
+        
+        if len(stressed_agents) > 3:
+            return "critical - multiple agents stressed"
+        elif stressed_agents:
+            return "caution - some agents need rest"
+        else:
+            return "healthy - all agents operational"
+    
+    def _identify_blockers(self) -> List[str]:
+        """Identify any blockers in current work"""
+        blockers = []
+        
+        for name, agent in self.agents.items():
+            if agent.biometrics.current_status.value == "recovery":
+                blockers.append(f"{name} in recovery")
+        
+        return blockers
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Status of the shared council (agents, ledger, execution)"""
+        return {
+            "chair": "tess",
+            "agents": list(self.agents.keys()),
+            "ledger_writer": self.ledger.get_writer_stats(),
+            "score_cache": score_cache.stats(),
+            "execution": self.executor.stats(),
+            "dispatch": self.dispatcher.stats(),
+            "shared_state": self.shared_state.stats() if self.shared_state else None,
+            "events": self.events.stats(),
+            "completion_keys": {
+                "remembered": len(self._completion_keys),
+                "replayed": self.completions_replayed
+            },
+            "sovereign_protection": "ACTIVE"
+        }
+
+
 class CouncilConvening:
     """
     The Convening Ceremony - Council Meeting Orchestration
@@ -44,6 +436,10 @@ class CouncilConvening:
     This class implements the complete workflow from Sofie's briefing
 to deployment execution, with strict enforcement of sovereign boundaries.
     
+    Each instance is one ceremony (one Sofie session). Ceremonies built
+    on the same CouncilResources share the agents' capacity accounting,
+    the ledger and the execution engine; see sessions.SessionRegistry.
+    
     Usage:
         council = CouncilConvening()
         
@@ -57,25 +453,59 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         proposal = await council.generate_proposal()
         
         # Phase 5: User authorizes
-        await council.authorize(proposal_id)
+        await council.authorize(proposal["proposal_id"])
         
         # Phase 6: Deploy
         deployment = await council.deploy()
     """
     
-    def __init__(self):
-        self.agents = create_council()
-        self.ledger = DiligenceLedger()
+    def __init__(
+        self,
+        resources: Optional[CouncilResources] = None,
+        session_id: str = DEFAULT_SESSION
+    ):
+        self.resources = resources or CouncilResources()
+        self.session_id = session_id
         
-        self.phase = ConveningPhase.IDLE
+        # Shared by every ceremony on the same resources
+        self.ledger = self.resources.ledger
+        self.agents = self.resources.agents
+        self.executor = self.resources.executor
+        self.dispatcher = self.resources.dispatcher
+        self.compactor = self.resources.compactor
+        self.distribution_solver = self.resources.distribution_solver
+        
+        self._phase = ConveningPhase.IDLE
         self.current_briefing: Optional[Dict[str, Any]] = None
         self.current_proposal: Optional[Dict[str, Any]] = None
         self.deliberation_record: Optional[Dict[str, Any]] = None
+        self.plan_state: Optional[DeliberationState] = None  # Last plan, for patching
+        self.state_version = 0  # Shared-state version this copy reflects
+        self.meeting: Optional[Dict[str, Any]] = None  # This ceremony's meeting (Tess's format)
         self.meeting_start: Optional[str] = None
+        self.proposals_issued = 0
+        
+        # One request at a time per ceremony; ceremonies run concurrently
+        self.lock = asyncio.Lock()
         
-        logger.info("🏛️ Council Convening Ceremony initialized")
+        logger.info(f"🏛️ Council Convening Ceremony initialized (session {session_id})")
         logger.info("   6 agents ready for deliberation")
     
+    @property
+    def phase(self) -> ConveningPhase:
+        return self._phase
+    
+    @phase.setter
+    def phase(self, phase: ConveningPhase):
+        """Phase transitions are published as phase.changed events"""
+        previous, self._phase = self._phase, phase
+        if phase is not previous:
+            self.resources.events.publish(
+                EventType.PHASE_CHANGED,
+                {"from": previous.value, "to": phase.value},
+                session_id=self.session_id
+            )
+    
     async def receive_briefing(self, sofie_briefing: Dict[str, Any]) -> Dict[str, Any]:
         """
         Phase 1-2: Receive briefing from Sofie.
@@ -110,18 +540,20 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         # Tess convenes the council
         tess = self.agents["tess"]
         convening_result = await tess.convene_council(sofie_briefing, self.agents)
+        self.meeting = tess.current_meeting
         
         logger.info(f"🏛️ Council convened: {convening_result['agents']}")
         
         return {
             "phase": "convened",
+            "session_id": self.session_id,
             "chair": "tess",
             "agents": convening_result["agents"],
             "briefing_summary": convening_result["briefing_summary"],
             "sovereign_protection": "ACTIVE - sofie-llama-backend protected"
         }
     
-    async def deliberate(self) -> Dict[str, Any]:
+    async def deliberate(self, incremental: bool = True) -> Dict[str, Any]:
         """
         Phase 3: The Convening (Council Meeting)
         
@@ -132,37 +564,92 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         - Resolve conflicts
         - Optimize for wellness
         
+        When only the briefing's critical path changed since the last
+        deliberation, the previous plan is patched with the difference
+        instead of being rebuilt (see DeliberationState).
+        
+        Args:
+            incremental: Allow patching the previous plan
+        
         Returns:
-            Deliberation results with proposals
+            Deliberation results with proposals and the delta applied
         """
         logger.info("🏛️ PHASE 3: Council Deliberation")
         self.phase = ConveningPhase.DELIBERATING
         
+        # Plan against council-wide agent load
+        self.resources.sync_capacity()
+        
         # Tess facilitates
         tess = self.agents["tess"]
+        hex_agent = self.agents["hex"]
+        critical_path = (self.current_briefing or {}).get("critical_path", [])
         
-        # Step 1: Initial deliberation
-        deliberation = await tess.facilitate_deliberation(self.agents)
+        state = self.plan_state
+        schedule = None  # (graph, plan) shared by the timeline and dependency steps
+        if incremental and state is not None and state.matches(self.agents, self.distribution_solver):
+            # Steps 1-2, patched: re-route and place only what changed
+            delta = await state.patch(critical_path, tess, self.agents)
+            assignments = state.ordered_assignments()
+            graph = TaskGraph(assignments)
+            try:
+                schedule = (graph, graph.schedule())
+            except DependencyCycleError:
+                pass  # Reported by the timeline, raised by coordinate_dependencies
+            timeline = tess._calculate_timeline(
+                assignments, self.agents, schedule[1] if schedule else None
+            )
+            solver = self.distribution_solver
+            solver_report = None
+        else:
+            # Step 1: Initial deliberation
+            deliberation = await tess.facilitate_deliberation(self.agents, self.current_briefing)
+            
+            # Step 2: Optimize distribution
+            optimized = await tess.optimize_distribution(
+                deliberation["proposals"],
+                self.agents,
+                solver=self.distribution_solver
+            )
+            assignments = optimized["assignments"]
+            timeline = optimized["timeline"]
+            solver = optimized["solver"]
+            solver_report = optimized.get("solver_report")
+            
+            # Keep greedy plans for patching on the next briefing
+            state = None
+            if solver == "greedy":
+                state = DeliberationState.from_plan(
+                    critical_path, deliberation["proposals"], assignments,
+                    optimized["load_balance"], self.agents, solver
+                )
+            self.plan_state = state
+            delta = {"mode": "full", "tasks": len(assignments)}
         
-        # Step 2: Optimize distribution
-        optimized = await tess.optimize_distribution(
-            deliberation["proposals"],
-            self.agents
-        )
+        if state is not None:
+            delta["makespan_hours"] = {
+                "before": state.makespan_hours,
+                "after": timeline.get("makespan_hours")
+            }
+            state.makespan_hours = timeline.get("makespan_hours")
         
         # Step 3: Coordinate dependencies
-        with_dependencies = await tess.coordinate_dependencies(
-            optimized["assignments"]
-        )
+        if schedule is not None:
+            with_dependencies = state.apply_schedule(*schedule)
+        else:
+            with_dependencies = await tess.coordinate_dependencies(assignments)
         
         # Step 4: Aura wellness validation
         aura = self.agents["aura"]
-        wellness_check = await self._validate_deliberation_wellness(with_dependencies)
+        if state is not None:
+            wellness_check = self._wellness_from_totals(state.agent_counts, state.total_hours)
+        else:
+            wellness_check = await self._validate_deliberation_wellness(with_dependencies)
         
         if not wellness_check["approved"]:
             # Aura issues veto
             veto = await aura.veto_proposal(
-                {"title": "Council Plan"},
+                {"title": "Council Plan", "session_id": self.session_id},
                 wellness_check["concerns"]
             )
             
@@ -175,21 +662,29 @@ to deployment execution, with strict enforcement of sovereign boundaries.
             return {
                 "status": "blocked",
                 "phase": "deliberation_vetoed",
-                "veto": veto
+                "veto": veto,
+                "delta": delta
             }
         
         # Step 5: Hex calculates NECTAR accrual estimate
-        hex_agent = self.agents["hex"]
-        nectar_estimate = hex_agent.calculate_accrual_estimate({
-            "assignments": with_dependencies
-        })
+        if state is not None:
+            nectar_estimate = state.accrual_estimate(hex_agent)
+        else:
+            nectar_estimate = hex_agent.calculate_accrual_estimate({
+                "assignments": with_dependencies
+            })
         
+        # Published list: plan_state replaces assignment dicts instead of
+        # changing them, so patching it on the next briefing cannot change
+        # a record (or a proposal issued from it) after the fact
         self.deliberation_record = {
             "status": "complete",
-            "assignments": with_dependencies,
-            "timeline": optimized["timeline"],
+            "assignments": list(with_dependencies),
+            "timeline": timeline,
             "wellness_approved": True,
-            "nectar_estimate": nectar_estimate
+            "nectar_estimate": nectar_estimate,
+            "solver": solver,
+            "solver_report": solver_report
         }
         
         logger.info("🏛️ Deliberation complete - awaiting proposal generation")
@@ -197,9 +692,11 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         return {
             "phase": "deliberated",
             "assignments": len(with_dependencies),
-            "timeline": optimized["timeline"],
+            "timeline": timeline,
             "nectar_estimate": nectar_estimate,
-            "wellness_status": "approved_by_aura"
+            "wellness_status": "approved_by_aura",
+            "solver_report": solver_report,
+            "delta": delta
         }
     
     async def generate_proposal(self) -> Dict[str, Any]:
@@ -220,12 +717,15 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         # Tess prepares the proposal
         tess = self.agents["tess"]
         
+        self.proposals_issued += 1
         proposal = {
+            "proposal_id": f"{self.session_id}-{self.proposals_issued}",
+            "session_id": self.session_id,
             "status": "proposed",
             "timestamp": datetime.utcnow().isoformat(),
             "council_plan": {
                 "objective": self._extract_objective(),
-                "assignments": self.deliberation_record["assignments"],
+                "assignments": list(self.deliberation_record["assignments"]),
                 "total_timeline": self.deliberation_record["timeline"],
                 "total_diligence_accrual": self.deliberation_record["nectar_estimate"],
                 "wellness_validation": "approved_by_aura",
@@ -247,12 +747,19 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         
         self.current_proposal = proposal
         self.phase = ConveningPhase.AWAITING_AUTHORIZATION
+        if self.meeting is not None:
+            self.meeting["phase"] = "awaiting_authorization"
         
         logger.info("🏛️ Proposal generated - awaiting Chief Architect authorization")
         
         return proposal
     
-    async def authorize(self, proposal_id: str, authorized: bool = True) -> Dict[str, Any]:
+    async def authorize(
+        self,
+        proposal_id: str,
+        authorized: bool = True,
+        authorized_by: str = "chief_architect"
+    ) -> Dict[str, Any]:
         """
         Phase 5: Authorization (User Decision)
         
@@ -261,6 +768,8 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         Args:
             proposal_id: ID of the proposal to authorize
             authorized: Whether to authorize (True) or reject (False)
+            authorized_by: Recorded on the proposal ("auto_policy" for
+                run() with auto-authorization)
             
         Returns:
             Authorization result
@@ -269,9 +778,11 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         
         if not self.current_proposal:
             return {"error": "No proposal to authorize"}
+        if proposal_id != self.current_proposal["proposal_id"]:
+            return {"error": f"Unknown proposal: {proposal_id}"}
         
         if authorized:
-            self.current_proposal["authorized_by"] = "chief_architect"
+            self.current_proposal["authorized_by"] = authorized_by
             self.current_proposal["authorized_at"] = datetime.utcnow().isoformat()
             self.current_proposal["awaiting_chief_architect_authorization"] = False
             
@@ -313,10 +824,13 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         
         deployment = await tess.execute_deployment(
             self.current_proposal["council_plan"],
-            self.agents
+            self.agents,
+            dispatcher=self.dispatcher
         )
         
         self.phase = ConveningPhase.COMPLETE
+        if self.meeting is not None:
+            self.meeting["phase"] = "deployed"
         
         logger.info("🏛️ DEPLOYMENT COMPLETE")
         logger.info(f"   Tasks assigned: {len(deployment['results'])}")
@@ -325,6 +839,8 @@ to deployment execution, with strict enforcement of sovereign boundaries.
             "status": "deployed",
             "deployment": deployment,
             "monitoring": {
+                "execution": "/council/status (execution)",
+                "queue": "/council/queue",
                 "standup_schedule": "daily",
                 "report_to": "sofie",
                 "pr_review": "aura + tess required"
@@ -332,37 +848,68 @@ to deployment execution, with strict enforcement of sovereign boundaries.
             "important": "NECTAR accrues post-completion, not spent"
         }
     
-    async def daily_standup(self) -> Dict[str, Any]:
+    async def run(
+        self,
+        sofie_briefing: Dict[str, Any],
+        auto_authorize: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Daily standup report from all agents.
+        Phases 1-4 (and 5-6 with auto_authorize) in one pass.
         
-        Returns:
-            Status report for Sofie
+        Yields each phase's result as it completes, then a final "done"
+        step. The caller holds the ceremony for the whole run, so no other
+        request can interleave with its phases. Stops at the first phase
+        that fails or is vetoed.
+        
+        Args:
+            sofie_briefing: The ecosystem observation from Sofie
+            auto_authorize: Authorize and deploy the proposal without the
+                Chief Architect (the caller checks the policy)
         """
-        logger.info("📋 Daily Standup Report")
+        convened = await self.receive_briefing(sofie_briefing)
+        yield {"step": "convene", "result": convened}
+        if "error" in convened:
+            yield self._run_done("error")
+            return
         
-        reports = []
-        for name, agent in self.agents.items():
-            report = {
-                "agent": name,
-                "status": agent.biometrics.current_status.value,
-                "current_task": agent.current_task.title if agent.current_task else None,
-                "tasks_completed_today": len([
-                    t for t in agent.task_history
-                    if t.completed_at and t.completed_at.startswith(datetime.utcnow().strftime("%Y-%m-%d"))
-                ]),
-                "biometrics": agent.biometrics.to_dict(),
-                "nectar_accrued": agent.total_nectar_accrued
-            }
-            reports.append(report)
+        deliberation = await self.deliberate()
+        yield {"step": "deliberate", "result": deliberation}
+        if deliberation.get("status") == "blocked":
+            yield self._run_done("blocked")
+            return
         
+        proposal = await self.generate_proposal()
+        yield {"step": "propose", "result": proposal}
+        if "error" in proposal:
+            yield self._run_done("error")
+            return
+        if not auto_authorize:
+            yield self._run_done("awaiting_authorization")
+            return
+        
+        authorization = await self.authorize(proposal["proposal_id"], authorized_by="auto_policy")
+        yield {"step": "authorize", "result": authorization}
+        if authorization.get("status") != "authorized":
+            yield self._run_done("error")
+            return
+        
+        deployment = await self.deploy()
+        yield {"step": "deploy", "result": deployment}
+        yield self._run_done(deployment.get("status", "error"))
+    
+    def _run_done(self, status: str) -> Dict[str, Any]:
         return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "standup_reports": reports,
-            "council_health": self._assess_council_health(),
-            "blockers": self._identify_blockers()
+            "step": "done",
+            "status": status,
+            "session_id": self.session_id,
+            "phase": self.phase.value,
+            "proposal_id": (self.current_proposal or {}).get("proposal_id")
         }
     
+    async def daily_standup(self) -> Dict[str, Any]:
+        """Daily standup report from all agents (shared by every ceremony)"""
+        return await self.resources.daily_standup()
+    
     async def record_task_completion(
         self,
         agent_name: str,
@@ -370,58 +917,44 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         hours_worked: float,
         quality_score: float = 1.0
     ) -> Dict[str, Any]:
-        """
-        Record task completion and accrue NECTAR.
-        
-        This is called after work is done - purely accrual.
-        """
-        if agent_name not in self.agents:
-            return {"error": f"Unknown agent: {agent_name}"}
-        
-        agent = self.agents[agent_name]
-        
-        # Get task
-        task = agent.tasks.get(task_id)
-        if not task:
-            return {"error": f"Task not found: {task_id}"}
-        
-        # Complete task
-        result = await agent.complete_task(task_id, {}, quality_score)
-        
-        # Record in ledger
-        accrual = self.ledger.record_completion(
-            agent_name=agent_name,
-            task=task,
-            hours_worked=hours_worked,
-            quality_score=quality_score
+        """Record task completion and accrue NECTAR"""
+        return await self.resources.record_task_completion(
+            agent_name, task_id, hours_worked, quality_score
         )
-        
-        return {
-            "status": "completed",
-            "task": task_id,
-            "agent": agent_name,
-            "nectar_accrued": accrual["nectar_accrued"],
-            "total_accrued": accrual["total_accrued"]
-        }
+    
+    async def record_task_completions(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Complete many tasks with one ledger write (see CouncilResources)"""
+        return await self.resources.record_task_completions(completions)
+    
+    def cancel_task(self, task_id: str) -> Dict[str, Any]:
+        """Cancel a deployed task that is queued, waiting or executing"""
+        return self.resources.cancel_task(task_id)
     
     async def _validate_deliberation_wellness(self, assignments: List[Dict]) -> Dict[str, Any]:
         """Validate that deliberation results meet wellness standards"""
+        agent_counts = Counter(assignment["agent"] for assignment in assignments)
+        total_hours = sum(a.get("estimated_hours", 4) for a in assignments)
+        return self._wellness_from_totals(agent_counts, total_hours)
+    
+    def _wellness_from_totals(self, agent_counts: Dict[str, int], total_hours: float) -> Dict[str, Any]:
+        """Wellness verdict from per-agent assignment counts and total hours"""
         concerns = []
         
-        # Check for overloaded agents
-        for assignment in assignments:
-            agent_name = assignment["agent"]
+        # Check for overloaded agents (one concern per assignment they hold)
+        for agent_name, count in agent_counts.items():
             agent = self.agents.get(agent_name)
             
-            if agent and not agent.biometrics.can_accept_task():
-                concerns.append({
-                    "type": "agent_overload",
-                    "agent": agent_name,
-                    "message": f"{agent_name} already at capacity"
-                })
+            if count > 0 and agent and not agent.biometrics.can_accept_task():
+                concerns.extend(
+                    {
+                        "type": "agent_overload",
+                        "agent": agent_name,
+                        "message": f"{agent_name} already at capacity"
+                    }
+                    for _ in range(count)
+                )
         
         # Check timeline reasonableness
-        total_hours = sum(a.get("estimated_hours", 4) for a in assignments)
         if total_hours > 40:  # More than a week of work
             concerns.append({
                 "type": "heavy_workload",
@@ -442,39 +975,50 @@ to deployment execution, with strict enforcement of sovereign boundaries.
         stage = self.current_briefing.get("ecosystem_state", {}).get("build_stage", "development")
         return f"Ecosystem {stage.replace('_', ' ').title()}"
     
-    def _assess_council_health(self) -> str:
-        """Assess overall health of the council"""
-        stressed_agents = [
-            name for name, agent in self.agents.items()
-            if agent.biometrics.stress_level > 0.6
-        ]
-        
-        if len(stressed_agents) > 3:
-            return "critical - multiple agents stressed"
-        elif stressed_agents:
-            return "caution - some agents need rest"
-        else:
-            return "healthy - all agents operational"
-    
-    def _identify_blockers(self) -> List[str]:
-        """Identify any blockers in current work"""
-        blockers = []
-        
-        for name, agent in self.agents.items():
-            if agent.biometrics.current_status.value == "recovery":
-                blockers.append(f"{name} in recovery")
-        
-        return blockers
-    
     def get_status(self) -> Dict[str, Any]:
         """Get current convening status"""
         return {
+            "session_id": self.session_id,
             "phase": self.phase.value,
-            "chair": "tess",
-            "agents": list(self.agents.keys()),
             "meeting_start": self.meeting_start,
             "has_briefing": self.current_briefing is not None,
             "has_proposal": self.current_proposal is not None,
+            "proposal_id": self.current_proposal.get("proposal_id") if self.current_proposal else None,
             "proposal_authorized": self.current_proposal.get("authorized_by") if self.current_proposal else None,
-            "sovereign_protection": "ACTIVE"
+            **self.resources.get_status()
         }
+    
+    def get_meeting_minutes(self) -> Optional[Dict[str, Any]]:
+        """Minutes of this ceremony's meeting"""
+        return self.agents["tess"].get_meeting_minutes(self.meeting)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Ceremony state as JSON-safe data (the patchable plan is not kept)"""
+        return {
+            "session_id": self.session_id,
+            "phase": self.phase.value,
+            "current_briefing": self.current_briefing,
+            "current_proposal": self.current_proposal,
+            "deliberation_record": self.deliberation_record,
+            "meeting": self.meeting,
+            "meeting_start": self.meeting_start,
+            "proposals_issued": self.proposals_issued
+        }
+    
+    @classmethod
+    def restore(cls, snapshot: Dict[str, Any], resources: CouncilResources) -> 'CouncilConvening':
+        """Rebuild a ceremony from snapshot() on shared resources"""
+        convening = cls(resources, snapshot["session_id"])
+        convening.apply_snapshot(snapshot)
+        return convening
+    
+    def apply_snapshot(self, snapshot: Dict[str, Any]):
+        """Replace this ceremony's state with snapshot() data (drops the patchable plan)"""
+        self._phase = ConveningPhase(snapshot["phase"])  # Restored, not a transition
+        self.current_briefing = snapshot.get("current_briefing")
+        self.current_proposal = snapshot.get("current_proposal")
+        self.deliberation_record = snapshot.get("deliberation_record")
+        self.meeting = snapshot.get("meeting")
+        self.meeting_start = snapshot.get("meeting_start")
+        self.proposals_issued = snapshot.get("proposals_issued", 0)
+        self.plan_state = None
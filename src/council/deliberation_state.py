@@ -0,0 +1,304 @@
+"""
+Deliberation State - Incremental re-deliberation for changed briefings
+
+Sofie often re-sends a briefing that differs from the last one by a
+task or two. Instead of re-routing, re-distributing and re-estimating
+the whole critical path, the council keeps the previous plan and patches
+it with the difference:
+
+- Diff: critical-path entries are keyed by (text, occurrence) so repeated
+  tasks are tracked individually; added/removed entries are the delta
+- Routing: only descriptions the council has not seen are routed
+- Distribution: removed tasks release their agent's slot, queued tasks
+  are promoted into freed slots, added tasks are placed with the greedy
+  chair rule (preferred agent, hex neighbor, else queued). Unchanged
+  assignments are kept as-is (same dicts, same task_ids)
+- Totals: hours, per-agent counts and the NECTAR estimate are adjusted
+  by the delta rather than re-summed
+- Assignment dicts are never changed in place once stored: promotions
+  and new dependency timings replace the dict, so published plans can
+  share every assignment that did not change
+
+The patched plan is a valid greedy plan but may differ from a
+from-scratch deliberation in which of several waiting tasks got a freed
+slot. Anything that invalidates it - different agents, scoring rules,
+solver, or agent capacity - forces a full deliberation.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
+
+from .agents import BaseAgent, ScoringEngine, TaskGraph, route_tasks
+
+logger = logging.getLogger(__name__)
+
+
+TaskKey = Tuple[str, int]  # (task description, occurrence in the critical path)
+
+
+def path_keys(critical_path: List[str]) -> List[TaskKey]:
+    """Key every critical-path entry, numbering repeats"""
+    seen: Counter = Counter()
+    keys = []
+    for task in critical_path:
+        keys.append((task, seen[task]))
+        seen[task] += 1
+    return keys
+
+
+def plan_fingerprint(agents: Dict[str, BaseAgent], solver: str) -> Tuple:
+    """Everything besides the critical path that a plan depends on"""
+    return (
+        solver,
+        ScoringEngine.for_agents(agents).version,
+        tuple(
+            (name, agent.biometrics.MAX_CONCURRENT_TASKS, agent.biometrics.concurrent_tasks)
+            for name, agent in agents.items()
+        )
+    )
+
+
+class DeliberationState:
+    """
+    The last deliberated plan, kept for patching.
+
+    Build from a full deliberation with from_plan(); apply a new critical
+    path with patch().
+    """
+
+    def __init__(self, agents: Dict[str, BaseAgent], solver: str):
+        self.fingerprint = plan_fingerprint(agents, solver)
+        self.keys: List[TaskKey] = []
+        self.proposals: Dict[str, Dict[str, Any]] = {}  # By task description
+        self.assignments: Dict[TaskKey, Dict[str, Any]] = {}
+        self.agent_loads: Dict[str, Dict[str, Any]] = {}
+        self.queued: Dict[str, Dict[TaskKey, None]] = {}  # Preferred agent -> waiting keys, in order
+
+        # Running totals
+        self.total_hours = 0.0
+        self.agent_counts: Counter = Counter()
+        self.accrual: Dict[str, Dict[str, float]] = {}
+        self.makespan_hours: Optional[float] = None
+        self._next_id = 1
+
+    @classmethod
+    def from_plan(
+        cls,
+        critical_path: List[str],
+        proposals: List[Dict[str, Any]],
+        assignments: List[Dict[str, Any]],
+        agent_loads: Dict[str, Dict[str, Any]],
+        agents: Dict[str, BaseAgent],
+        solver: str
+    ) -> 'DeliberationState':
+        """Capture a full deliberation (one assignment per critical-path entry)"""
+        state = cls(agents, solver)
+        state.keys = path_keys(critical_path)
+        state.agent_loads = agent_loads
+        state.proposals = {proposal["task"]: proposal for proposal in proposals}
+
+        for key, assignment in zip(state.keys, assignments):
+            state._store(key, assignment, agents)
+
+        state._next_id = len(assignments) + 1
+        return state
+
+    def matches(self, agents: Dict[str, BaseAgent], solver: str) -> bool:
+        """Whether the plan can be patched (nothing but the briefing changed)"""
+        return self.fingerprint == plan_fingerprint(agents, solver)
+
+    def ordered_assignments(self) -> List[Dict[str, Any]]:
+        """Assignments in critical-path order"""
+        return [self.assignments[key] for key in self.keys]
+
+    def apply_schedule(self, graph: TaskGraph, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Record task ids, dependencies and start hours from a schedule of
+        ordered_assignments(), like Tess's coordinate_dependencies.
+
+        Only assignments whose values change are copied.
+
+        Returns:
+            Assignments in dependency order
+        """
+        ordered = []
+        for index, key in enumerate(self.keys):
+            assignment = self.assignments[key]
+            scheduled = {
+                "task_id": graph.task_ids[index],
+                "depends_on": graph.depends_on[index],
+                "earliest_start_hours": plan["earliest_start"][index],
+                "scheduled_start_hours": plan["scheduled_start"][index]
+            }
+            if any(assignment.get(field) != value for field, value in scheduled.items()):
+                assignment = self.assignments[key] = {**assignment, **scheduled}
+            ordered.append(assignment)
+
+        return [ordered[index] for index in plan["order"]]
+
+    async def patch(
+        self,
+        critical_path: List[str],
+        tess: Any,
+        agents: Dict[str, BaseAgent]
+    ) -> Dict[str, Any]:
+        """
+        Apply a new critical path to the plan.
+
+        Returns:
+            Delta: added / removed / changed tasks, placements, promotions
+        """
+        new_keys = path_keys(critical_path)
+        new_set = set(new_keys)
+        old_set = set(self.keys)
+        added = [key for key in new_keys if key not in old_set]
+        removed = [key for key in self.keys if key not in new_set]
+
+        logger.info(
+            f"🏛️ Re-deliberating incrementally: +{len(added)} -{len(removed)} "
+            f"({len(new_keys) - len(added)} unchanged)"
+        )
+
+        # Release the slots of dropped tasks
+        freed = []
+        for key in removed:
+            assignment = self._discard(key, agents)
+            if assignment.get("status") != "queued":
+                self.agent_loads[assignment["agent"]]["available_capacity"] += 1
+                freed.append(assignment["agent"])
+
+        # Route only descriptions the council has not deliberated yet
+        unseen = list(dict.fromkeys(task for task, _ in added if task not in self.proposals))
+        routed = route_tasks(unseen, agents) if unseen else {"proposals": [], "conflicts": []}
+        for proposal in routed["proposals"]:
+            self.proposals[proposal["task"]] = proposal
+        for task in {task for task, _ in removed} - {task for task, _ in new_keys}:
+            self.proposals.pop(task, None)
+
+        promoted = await self._promote(freed, tess, agents)
+
+        placed = []
+        for key in added:
+            assignment = await tess.place_greedy(self.proposals[key[0]], agents, self.agent_loads)
+            assignment["task_id"] = f"plan-{self._next_id:05d}"
+            self._next_id += 1
+            self._store(key, assignment, agents)
+            placed.append({
+                "task": key[0],
+                "task_id": assignment["task_id"],
+                "agent": assignment["agent"],
+                "status": assignment.get("status", "assigned")
+            })
+
+        self.keys = new_keys
+
+        if routed["proposals"]:
+            tess.record_deliberation(
+                "Sofie's Briefing (revised)", agents, routed["proposals"], routed["conflicts"]
+            )
+
+        added_tasks = [task for task, _ in added]
+        removed_tasks = [task for task, _ in removed]
+        pairs = min(len(added_tasks), len(removed_tasks))
+        return {
+            "mode": "incremental",
+            "added": added_tasks[pairs:],
+            "removed": removed_tasks[pairs:],
+            "changed": [
+                {"from": before, "to": after}
+                for before, after in zip(removed_tasks[:pairs], added_tasks[:pairs])
+            ],
+            "unchanged": len(new_keys) - len(added),
+            "rerouted": len(unseen),
+            "placed": placed,
+            "promoted": promoted,
+            "conflicts": routed["conflicts"]
+        }
+
+    async def _promote(
+        self,
+        freed: List[str],
+        tess: Any,
+        agents: Dict[str, BaseAgent]
+    ) -> List[Dict[str, Any]]:
+        """Move queued tasks into freed slots (own agent first, then a hex neighbor's)"""
+        promoted = []
+
+        for agent_name in freed:
+            while self.agent_loads[agent_name]["available_capacity"] > 0:
+                key = next(iter(self.queued.get(agent_name, {})), None)
+                if key is None:
+                    key = self._queued_for_neighbor(agent_name, tess, agents)
+                if key is None:
+                    break
+
+                queued = self._discard(key, agents)
+                preferred = queued["agent"]
+                task = queued["task"]
+                assignment = {
+                    field: value for field, value in queued.items()
+                    if field not in ("status", "reason")
+                }
+                assignment.update({
+                    "agent": agent_name,
+                    "estimated_hours": tess._estimate_hours(task),
+                    "repo": tess._determine_repo(task)
+                })
+                if agent_name != preferred:
+                    assignment["redistributed_from"] = preferred
+                    assignment["reason"] = "capacity_freed"
+
+                self.agent_loads[agent_name]["available_capacity"] -= 1
+                self._store(key, assignment, agents)
+                promoted.append({"task": task, "task_id": assignment.get("task_id"), "agent": agent_name})
+
+        return promoted
+
+    def _queued_for_neighbor(
+        self,
+        agent_name: str,
+        tess: Any,
+        agents: Dict[str, BaseAgent]
+    ) -> Optional[TaskKey]:
+        """First task queued on a neighbor that this agent can take over"""
+        for neighbor in tess.HEX_NEIGHBORS.get(agent_name, []):
+            for key in self.queued.get(neighbor, {}):
+                if agents[agent_name].can_handle_task(key[0]) > 0.3:
+                    return key
+        return None
+
+    def _store(self, key: TaskKey, assignment: Dict[str, Any], agents: Dict[str, BaseAgent]):
+        self.assignments[key] = assignment
+        if assignment.get("status") == "queued":
+            self.queued.setdefault(assignment["agent"], {})[key] = None
+        self._account(assignment, 1, agents)
+
+    def _discard(self, key: TaskKey, agents: Dict[str, BaseAgent]) -> Dict[str, Any]:
+        assignment = self.assignments.pop(key)
+        if assignment.get("status") == "queued":
+            self.queued.get(assignment["agent"], {}).pop(key, None)
+        self._account(assignment, -1, agents)
+        return assignment
+
+    def _account(self, assignment: Dict[str, Any], sign: int, agents: Dict[str, BaseAgent]):
+        """Adjust running totals by one assignment"""
+        self.total_hours += sign * assignment.get("estimated_hours", 4)
+        self.agent_counts[assignment["agent"]] += sign
+
+        hex_agent = agents.get("hex")
+        if hex_agent is None:
+            return
+        estimate = hex_agent.calculate_accrual_estimate({"assignments": [assignment]})
+        for agent_name, amounts in estimate["by_agent"].items():
+            totals = self.accrual.setdefault(agent_name, {"hours": 0, "nectar": 0})
+            totals["hours"] += sign * amounts["hours"]
+            totals["nectar"] += sign * amounts["nectar"]
+
+    def accrual_estimate(self, hex_agent: Any) -> Dict[str, Any]:
+        """NECTAR estimate for the current plan (same shape as Hex's)"""
+        return hex_agent.summarize_accrual_estimate({
+            agent_name: dict(totals)
+            for agent_name, totals in self.accrual.items()
+            if self.agent_counts[agent_name] > 0
+        })
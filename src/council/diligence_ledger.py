@@ -2,32 +2,45 @@
 Diligence Ledger - NECTAR Proof-of-Diligence Tracking
 
 Persistent storage for NECTAR accrual records.
-Separate from the HexAgent's runtime tracking - this is the durable ledger.
+Writes through the shared LedgerStore, the same engine HexAgent uses,
+so each completion is indexed and persisted exactly once.
+
+Storage modes:
+- Full-file JSON (default): versioned ledger document rewritten on each accrual
+- Journaled: append-only log + periodic checkpoint of agent totals
+- SQLite: indexed history with materialized totals (backend="sqlite")
+
+With columnar=True (requires numpy), get_analytics() reports per-agent,
+per-repo and per-day totals from a memory-mapped columnar archive.
+With merkle=True, genesis snapshots carry a Merkle root over every
+accrual and a per-agent inclusion proof of the allocation.
+
+record_completions() writes many accruals with one store write (one
+SQLite transaction / one file rewrite) for bulk task completion.
+
+History is read page by page (page_records, cursor = record seq) or
+streamed as NDJSON (export_records_ndjson, export_genesis_ndjson) straight
+from storage, so memory stays flat however long the ledger gets.
+
+Async callers (the council API) use the a* methods, which run
+serialization and disk I/O on a dedicated ledger thread so the event
+loop keeps serving other requests.
 """
 
+import asyncio
+import functools
 import json
 import logging
-from pathlib import Path
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
-from dataclasses import dataclass, asdict
 
-logger = logging.getLogger(__name__)
+from .ledger_store import LedgerStore, NectarAccrualRecord, DEFAULT_LEDGER_PATH
+from .events import EventType
 
+logger = logging.getLogger(__name__)
 
-@dataclass
-class NectarAccrualRecord:
-    """Single NECTAR accrual record"""
-    agent_name: str
-    task_id: str
-    task_title: str
-    repo: str
-    hours_worked: float
-    base_rate: float
-    quality_multiplier: float
-    nectar_accrued: float
-    timestamp: str
-    blockchain_eligible: bool = True
+EXPORT_CHUNK_SIZE = 500  # NDJSON lines per streamed chunk
 
 
 class DiligenceLedger:
@@ -44,21 +57,65 @@ class DiligenceLedger:
     - Append-only (accrual model)
     - No spending/deletion
     - Pure proof-of-diligence accumulation
+    
+    With journaled=True, each accrual is a constant-cost append and
+    `records` only holds the journal tail loaded since the last checkpoint.
+    With backend="sqlite", history stays on disk and summaries are
+    indexed lookups. With group_commit=True, concurrent accruals are
+    flushed together and acknowledged once durable.
     """
     
-    def __init__(self, ledger_path: str = "./data/diligence_ledger.json"):
-        self.ledger_path = Path(ledger_path)
-        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        ledger_path: str = DEFAULT_LEDGER_PATH,
+        journaled: bool = False,
+        checkpoint_interval: int = 500,
+        backend: str = "json",
+        group_commit: bool = False,
+        max_batch_size: int = 64,
+        max_batch_latency: float = 0.005,
+        columnar: bool = False,
+        merkle: bool = False
+    ):
+        self.store = LedgerStore.shared(ledger_path, journaled, checkpoint_interval, backend)
+        self.ledger_path = self.store.ledger_path
+        
+        # Batch concurrent accruals into one durable write
+        if group_commit:
+            self.store.start_group_commit(max_batch_size, max_batch_latency)
+        
+        # Columnar archive for analytics over long histories
+        if columnar:
+            try:
+                self.store.attach_columnar_archive()
+            except ImportError as e:
+                logger.warning(f"Columnar ledger analytics disabled: {e}")
         
-        # In-memory cache
-        self.records: List[NectarAccrualRecord] = []
-        self.agent_totals: Dict[str, Dict[str, float]] = {}
+        # Incremental Merkle tree committing to every accrual
+        if merkle:
+            self.store.attach_merkle_log()
         
-        # Load existing
-        self._load()
+        # Accruals are published here once durable (events.EventBus)
+        self.event_bus: Optional[Any] = None
+        
+        # Single worker: async calls run in submission order
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="ledger-io"
+        )
         
         logger.info(f"📊 DiligenceLedger initialized: {self.ledger_path}")
     
+    @property
+    def agent_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of per-agent totals from the shared store"""
+        return self.store.all_totals()
+    
+    @property
+    def records(self) -> List[NectarAccrualRecord]:
+        """Records held in memory by the shared store"""
+        return self.store.records
+    
     def record_completion(
         self,
         agent_name: str,
@@ -68,13 +125,100 @@ class DiligenceLedger:
         tested: bool = False,
         wellness_approved: bool = False,
         cross_repo: bool = False,
-        documented: bool = False
+        documented: bool = False,
+        stolen_from: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Record task completion and NECTAR accrual.
         
         Called AFTER work is complete - purely accrual.
+        Blocks until the record is persisted.
+        
+        stolen_from attributes work a hex neighbor stole from the agent
+        it was planned for. A failed write is raised and nothing accrues.
+        """
+        return self.submit_completion(
+            agent_name, task, hours_worked, quality_score,
+            tested, wellness_approved, cross_repo, documented, stolen_from
+        ).result()
+    
+    def submit_completion(
+        self,
+        agent_name: str,
+        task: Any,  # Task object
+        hours_worked: float,
+        quality_score: float = 1.0,
+        tested: bool = False,
+        wellness_approved: bool = False,
+        cross_repo: bool = False,
+        documented: bool = False,
+        stolen_from: Optional[str] = None
+    ) -> Future:
+        """
+        Submit a completion without waiting for it to be persisted.
+        
+        With group commit enabled the returned future resolves once the
+        record's batch is durable; await it via asyncio.wrap_future().
+        
+        Returns:
+            Future resolving to the accrual result dict
         """
+        record = self._accrual_record(
+            agent_name, task, hours_worked, quality_score,
+            tested, wellness_approved, cross_repo, documented, stolen_from
+        )
+        
+        # Store and persist through the shared write path
+        result: Future = Future()
+        
+        def on_persisted(persisted: Future):
+            error = persisted.exception()
+            if error is not None:
+                result.set_exception(error)
+                return
+            result.set_result(self._accrued(record, persisted.result()))
+        
+        self.store.submit(record).add_done_callback(on_persisted)
+        return result
+    
+    def record_completions(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Record many completions with a single ledger write.
+        
+        All records go to the store in one append_batch: one SQLite
+        transaction, or one journal append / atomic file replace. If the
+        write fails the store rolls its totals, records and Merkle leaves
+        back, so either every accrual is persisted and counted or none is.
+        
+        Args:
+            completions: record_completion keyword arguments, one dict
+                per completion (agent_name, task, hours_worked, ...)
+        
+        Returns:
+            Accrual result dicts, in order
+        
+        Raises:
+            OSError / sqlite3.Error: If the batch could not be persisted
+        """
+        records = [self._accrual_record(**completion) for completion in completions]
+        if not records:
+            return []
+        all_totals = self.store.append_batch(records, sync=self.store.writer is not None)
+        logger.info(f"📊 Batch of {len(records)} accruals persisted in one write")
+        return [self._accrued(record, totals) for record, totals in zip(records, all_totals)]
+    
+    def _accrual_record(
+        self,
+        agent_name: str,
+        task: Any,  # Task object
+        hours_worked: float,
+        quality_score: float = 1.0,
+        tested: bool = False,
+        wellness_approved: bool = False,
+        cross_repo: bool = False,
+        documented: bool = False,
+        stolen_from: Optional[str] = None
+    ) -> NectarAccrualRecord:
         # Calculate multiplier
         multiplier = quality_score
         if tested:
@@ -90,8 +234,7 @@ class DiligenceLedger:
         base_rate = 10.0
         nectar = hours_worked * base_rate * multiplier
         
-        # Create record
-        record = NectarAccrualRecord(
+        return NectarAccrualRecord(
             agent_name=agent_name,
             task_id=task.id if hasattr(task, 'id') else str(task),
             task_title=task.title if hasattr(task, 'title') else str(task),
@@ -100,42 +243,103 @@ class DiligenceLedger:
             base_rate=base_rate,
             quality_multiplier=multiplier,
             nectar_accrued=nectar,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=datetime.utcnow().isoformat(),
+            stolen_from=stolen_from
         )
-        
-        # Store
-        self.records.append(record)
-        
-        # Update totals
-        if agent_name not in self.agent_totals:
-            self.agent_totals[agent_name] = {
-                "total_nectar": 0.0,
-                "total_hours": 0.0,
-                "tasks_completed": 0
-            }
-        
-        self.agent_totals[agent_name]["total_nectar"] += nectar
-        self.agent_totals[agent_name]["total_hours"] += hours_worked
-        self.agent_totals[agent_name]["tasks_completed"] += 1
-        
-        # Persist
-        self._save()
-        
+    
+    def _accrued(self, record: NectarAccrualRecord, totals: Dict[str, Any]) -> Dict[str, Any]:
+        """Accrual result for a persisted record (logged and published)"""
         logger.info(
-            f"📊 NECTAR Accrual: {agent_name} +{nectar:.2f} for '{record.task_title}'"
+            f"📊 NECTAR Accrual: {record.agent_name} +{record.nectar_accrued:.2f} for '{record.task_title}'"
         )
-        
-        return {
-            "agent": agent_name,
+        accrual = {
+            "agent": record.agent_name,
             "task": record.task_title,
-            "nectar_accrued": round(nectar, 2),
-            "multiplier": round(multiplier, 2),
-            "total_accrued": round(self.agent_totals[agent_name]["total_nectar"], 2)
+            "nectar_accrued": round(record.nectar_accrued, 2),
+            "multiplier": round(record.quality_multiplier, 2),
+            "total_accrued": round(totals["total_nectar"], 2)
         }
+        if record.stolen_from:
+            accrual["stolen_from"] = record.stolen_from
+        if self.event_bus is not None:
+            self.event_bus.publish(
+                EventType.ACCRUAL, {"task_id": record.task_id, **accrual}, agent=record.agent_name
+            )
+        return accrual
+    
+    async def arecord_completion(
+        self,
+        agent_name: str,
+        task: Any,  # Task object
+        hours_worked: float,
+        quality_score: float = 1.0,
+        tested: bool = False,
+        wellness_approved: bool = False,
+        cross_repo: bool = False,
+        documented: bool = False,
+        stolen_from: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async record_completion - persistence never blocks the event loop.
+        
+        Completions are persisted in the order they were awaited.
+        """
+        if self.store.writer is not None:
+            # Group-commit writer thread already does the I/O in order
+            return await asyncio.wrap_future(self.submit_completion(
+                agent_name, task, hours_worked, quality_score,
+                tested, wellness_approved, cross_repo, documented, stolen_from
+            ))
+        
+        return await self._run(
+            self.record_completion,
+            agent_name, task, hours_worked, quality_score,
+            tested, wellness_approved, cross_repo, documented, stolen_from
+        )
+    
+    async def arecord_completions(self, completions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async record_completions (one write, on the ledger thread)"""
+        return await self._run(self.record_completions, completions)
+    
+    async def aget_agent_summary(self, agent_name: str) -> Dict[str, Any]:
+        """Async get_agent_summary"""
+        return await self._run(self.get_agent_summary, agent_name)
+    
+    async def aget_genesis_snapshot(self) -> Dict[str, Any]:
+        """Async get_genesis_snapshot"""
+        return await self._run(self.get_genesis_snapshot)
+    
+    async def aget_council_summary(self) -> Dict[str, Any]:
+        """Async get_council_summary"""
+        return await self._run(self.get_council_summary)
+    
+    async def aget_analytics(self, bins: int = 10) -> Dict[str, Any]:
+        """Async get_analytics"""
+        return await self._run(self.get_analytics, bins)
+    
+    async def apage_records(self, cursor: int = 0, limit: int = 100, **filters) -> Dict[str, Any]:
+        """Async page_records"""
+        return await self._run(functools.partial(self.page_records, cursor, limit, **filters))
+    
+    async def _run(self, fn, *args):
+        """Run a ledger call on the dedicated ledger thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+    
+    def close(self):
+        """Drain pending ledger work, then close the store and release its lock"""
+        self._executor.shutdown(wait=True)
+        self.store.close()
+    
+    def get_writer_stats(self) -> Optional[Dict[str, Any]]:
+        """Group-commit batching metrics (None when disabled)"""
+        writer = self.store.writer
+        return writer.stats() if writer else None
     
     def get_agent_summary(self, agent_name: str) -> Dict[str, Any]:
         """Get summary for an agent"""
-        if agent_name not in self.agent_totals:
+        totals = self.store.get_totals(agent_name)
+        if totals is None:
             return {
                 "agent": agent_name,
                 "total_nectar": 0.0,
@@ -143,11 +347,7 @@ class DiligenceLedger:
                 "tasks_completed": 0
             }
         
-        totals = self.agent_totals[agent_name]
-        recent_records = [
-            r for r in self.records
-            if r.agent_name == agent_name
-        ][-10:]  # Last 10
+        recent_records = self.store.get_recent(agent_name)
         
         return {
             "agent": agent_name,
@@ -158,78 +358,153 @@ class DiligenceLedger:
                 {
                     "task": r.task_title,
                     "nectar": round(r.nectar_accrued, 2),
-                    "date": r.timestamp
+                    "date": r.timestamp,
+                    **({"stolen_from": r.stolen_from} if r.stolen_from else {})
                 }
                 for r in recent_records
             ]
         }
     
     def get_genesis_snapshot(self) -> Dict[str, Any]:
-        """Get snapshot for blockchain genesis"""
-        allocations = {}
-        for agent_name, totals in self.agent_totals.items():
-            allocations[agent_name] = {
-                "address": f"0x{agent_name}_genesis",  # Placeholder
-                "amount": round(totals["total_nectar"], 2),
-                "hours_contributed": round(totals["total_hours"], 2),
-                "tasks_completed": int(totals["tasks_completed"])
-            }
+        """
+        Get snapshot for blockchain genesis
         
-        return {
+        With the Merkle log attached, allocations are taken from each
+        agent's latest committed leaf and carry its inclusion proof
+        against the snapshot root.
+        """
+        if self.store.merkle is None:
+            allocations = {}
+            for agent_name, totals in self.agent_totals.items():
+                allocations[agent_name] = {
+                    "address": f"0x{agent_name}_genesis",  # Placeholder
+                    "amount": round(totals["total_nectar"], 2),
+                    "hours_contributed": round(totals["total_hours"], 2),
+                    "tasks_completed": int(totals["tasks_completed"])
+                }
+            merkle = None
+        else:
+            commitment = self.store.genesis_commitment()
+            allocations = {}
+            for agent_name, proof in commitment.pop("proofs").items():
+                totals = proof["leaf"]["totals"]
+                allocations[agent_name] = {
+                    "address": f"0x{agent_name}_genesis",  # Placeholder
+                    "amount": round(totals["total_nectar"], 2),
+                    "hours_contributed": round(totals["total_hours"], 2),
+                    "tasks_completed": int(totals["tasks_completed"]),
+                    "proof": proof
+                }
+            merkle = commitment
+        
+        snapshot = {
             "snapshot_timestamp": datetime.utcnow().isoformat(),
             "total_supply": round(sum(a["amount"] for a in allocations.values()), 2),
             "allocations": allocations,
             "note": "Genesis snapshot for future blockchain bridge"
         }
+        if merkle is not None:
+            snapshot["merkle"] = merkle
+        return snapshot
+    
+    def get_analytics(self, bins: int = 10) -> Dict[str, Any]:
+        """
+        Per-agent, per-repo and per-day totals plus histograms of
+        hours, NECTAR and quality multipliers over the full history.
+        """
+        return self.store.analytics(bins)
+    
+    def page_records(
+        self,
+        cursor: int = 0,
+        limit: int = 100,
+        agent_name: Optional[str] = None,
+        repo: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        One page of accrual records, oldest first.
+        
+        Args:
+            cursor: Resume after this record seq (0 = from the start)
+            limit: Maximum records in the page
+            agent_name, repo: Exact-match filters
+            since, until: ISO timestamp range [since, until)
+        
+        Returns:
+            {"records": [...each with its seq...], "next_cursor": int or None}
+        """
+        return self.store.page_records(
+            cursor, limit,
+            agent_name=agent_name, repo=repo, since=since, until=until
+        )
+    
+    def export_records_ndjson(
+        self,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        **filters: Optional[str]
+    ) -> Iterator[str]:
+        """
+        Stream accrual records as NDJSON, one record (with seq) per line.
+        
+        Yields chunks of chunk_size lines read lazily from storage.
+        """
+        lines = []
+        for seq, record in self.store.iter_records(**filters):
+            lines.append(json.dumps(dict(record.to_dict(), seq=seq)) + "\n")
+            if len(lines) >= chunk_size:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+    
+    def export_genesis_ndjson(self, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+        """
+        Stream the genesis snapshot as NDJSON.
+        
+        Lines: one "snapshot" header, one "allocation" per agent, then
+        (with the Merkle log attached) one "leaf" per accrual up to the
+        snapshot's tree size, so the root can be rebuilt independently.
+        """
+        snapshot = self.get_genesis_snapshot()
+        allocations = snapshot.pop("allocations")
+        
+        yield json.dumps(dict(snapshot, type="snapshot")) + "\n"
+        for agent_name, allocation in allocations.items():
+            yield json.dumps(dict(allocation, type="allocation", agent=agent_name)) + "\n"
+        
+        merkle = snapshot.get("merkle")
+        if merkle is None:
+            return
+        
+        lines = []
+        leaves = self.store.merkle.iter_leaves(merkle["tree_size"])
+        for index, leaf in enumerate(leaves):
+            lines.append(json.dumps({"type": "leaf", "index": index, "hash": leaf.hex()}) + "\n")
+            if len(lines) >= chunk_size:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
     
     def get_council_summary(self) -> Dict[str, Any]:
         """Get summary for entire council"""
-        total_nectar = sum(t["total_nectar"] for t in self.agent_totals.values())
-        total_hours = sum(t["total_hours"] for t in self.agent_totals.values())
-        total_tasks = sum(t["tasks_completed"] for t in self.agent_totals.values())
+        agent_totals = self.agent_totals
+        total_nectar = sum(t["total_nectar"] for t in agent_totals.values())
+        total_hours = sum(t["total_hours"] for t in agent_totals.values())
+        total_tasks = sum(t["tasks_completed"] for t in agent_totals.values())
         
         return {
             "total_nectar_accrued": round(total_nectar, 2),
             "total_hours_worked": round(total_hours, 2),
             "total_tasks_completed": total_tasks,
-            "agent_count": len(self.agent_totals),
+            "agent_count": len(agent_totals),
             "agents": {
                 name: {
                     "nectar": round(t["total_nectar"], 2),
                     "hours": round(t["total_hours"], 2)
                 }
-                for name, t in self.agent_totals.items()
+                for name, t in agent_totals.items()
             }
         }
-    
-    def _load(self):
-        """Load ledger from disk"""
-        if self.ledger_path.exists():
-            try:
-                with open(self.ledger_path, 'r') as f:
-                    data = json.load(f)
-                    
-                    self.records = [
-                        NectarAccrualRecord(**r) for r in data.get("records", [])
-                    ]
-                    self.agent_totals = data.get("totals", {})
-                    
-                logger.info(f"Loaded {len(self.records)} accrual records")
-            except Exception as e:
-                logger.error(f"Failed to load ledger: {e}")
-                self.records = []
-                self.agent_totals = {}
-    
-    def _save(self):
-        """Save ledger to disk"""
-        try:
-            data = {
-                "records": [asdict(r) for r in self.records],
-                "totals": self.agent_totals,
-                "last_updated": datetime.utcnow().isoformat()
-            }
-            
-            with open(self.ledger_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save ledger: {e}")
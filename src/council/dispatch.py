@@ -0,0 +1,322 @@
+"""
+Dispatch Queue - Priority queues for capacity-blocked council work
+
+A task deployed to an agent at capacity used to be marked "queued" and
+forgotten. The dispatch queue keeps it and starts it as soon as there is
+room:
+
+- One heap per agent, ordered by TaskPriority (critical first) then age
+- Dispatch is event driven: agents call on_capacity_freed when
+  complete_task / release_task free a slot or take_break / rest end
+- Work stealing: an agent with a free slot and an empty queue steals
+  not-yet-started work queued on its neighbors in the council ring
+  (BaseAgent.get_neighbor_agents), best priority first, provided its
+  can_handle_task clears STEAL_THRESHOLD. Work queued on a full agent is
+  offered to idle neighbors the same way, so one overloaded specialty no
+  longer sets the tail of a deployment
+- Stolen tasks carry stolen_from (the planned agent) into the ledger
+- An agent that needs rest and has nothing running is sent to rest so
+  its queue drains afterwards
+- Queue depth, oldest wait and dispatch wait times for /council/status
+
+Dispatched tasks are assigned synchronously (no await between the
+capacity check and assign_task) and, when an ExecutionEngine is
+attached, handed to it to run to completion.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+from .agents import BaseAgent, Task, TaskPriority
+
+logger = logging.getLogger(__name__)
+
+
+STEAL_THRESHOLD = 0.3  # Same bar Tess uses for hex redistribution
+STEAL_SCAN = 16        # Queued tasks a thief looks at per neighbor
+
+PRIORITY_RANK = {
+    TaskPriority.CRITICAL: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.NORMAL: 2,
+    TaskPriority.LOW: 3
+}
+
+
+@dataclass
+class QueuedTask:
+    """A task waiting for an agent slot"""
+    task: Task
+    agent: str  # Agent whose queue holds it
+    enqueued_at: float = field(default_factory=time.monotonic)
+    removed: bool = False  # Lazily deleted (dispatched elsewhere or cancelled)
+
+
+HeapEntry = Tuple[int, float, int, QueuedTask]  # (priority rank, enqueued_at, seq, item)
+
+
+def ring_neighbors(agents: Dict[str, BaseAgent]) -> Dict[str, List[str]]:
+    """Each agent's two neighbors in the council hexagon"""
+    members = list(agents.values())
+    return {
+        name: [neighbor.name for neighbor in agent.get_neighbor_agents(members)]
+        for name, agent in agents.items()
+    }
+
+
+class DispatchQueue:
+    """
+    Per-agent priority queues with automatic dispatch.
+
+    Usage:
+        dispatcher = DispatchQueue(agents, engine)
+        placement = await dispatcher.submit("veda", task)
+        # placement["status"]: "executing" / "deployed" / "queued"
+    """
+
+    def __init__(
+        self,
+        agents: Dict[str, BaseAgent],
+        engine: Optional[Any] = None,  # ExecutionEngine
+        neighbors: Optional[Dict[str, List[str]]] = None,  # Default: the council ring ({} disables stealing)
+        steal_threshold: float = STEAL_THRESHOLD
+    ):
+        self.agents = agents
+        self.engine = engine
+        self.neighbors = ring_neighbors(agents) if neighbors is None else neighbors
+        self.steal_threshold = steal_threshold
+
+        self._heaps: Dict[str, List[HeapEntry]] = {name: [] for name in agents}
+        self._depth: Dict[str, int] = {name: 0 for name in agents}
+        self._queued: Dict[str, QueuedTask] = {}  # By task id
+        self._seq = itertools.count()
+        self._resting: set = set()
+
+        # Metrics
+        self.enqueued = 0
+        self.dispatched = 0
+        self.stolen = 0
+        self.stolen_by: Dict[str, int] = {name: 0 for name in agents}
+        self.cancelled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+        for agent in agents.values():
+            agent.on_capacity_freed = self._on_capacity_freed
+
+    async def submit(self, agent_name: str, task: Task) -> Dict[str, Any]:
+        """
+        Start a task on an agent, or queue it until a slot frees up.
+
+        Returns:
+            Placement: status (executing / deployed / queued), agent, and
+            queue position when queued
+        """
+        if agent_name not in self.agents:
+            raise ValueError(f"Unknown agent: {agent_name}")
+        if task.id in self._queued:
+            raise ValueError(f"Task already queued: {task.id}")
+
+        self._push(QueuedTask(task=task, agent=agent_name))
+        self.enqueued += 1
+
+        await self.dispatch(agent_name)
+
+        if self.is_queued(task.id):
+            logger.info(
+                f"📥 Queued '{task.title}' for {agent_name} "
+                f"({task.priority.value}, depth {self._depth[agent_name]})"
+            )
+            return {"status": "queued", "agent": agent_name, "queue_depth": self._depth[agent_name]}
+
+        placement = {
+            "status": "executing" if self.engine is not None else "deployed",
+            "agent": self._placed_on(task)
+        }
+        if placement["agent"] != agent_name:
+            placement["redistributed_from"] = agent_name
+        return placement
+
+    async def dispatch(self, agent_name: str) -> int:
+        """
+        Fill an agent's free slots (own queue first, then steal from its
+        neighbors), then let idle neighbors steal what is left in its queue.
+
+        Returns:
+            Number of tasks started
+        """
+        started = await self._fill(agent_name)
+
+        if self._depth[agent_name]:
+            for neighbor in self.neighbors.get(agent_name, []):
+                if neighbor in self.agents:
+                    started += await self._fill(neighbor, own_queue=False)
+            self._rest_if_needed(agent_name)
+
+        return started
+
+    def cancel(self, task_id: str) -> bool:
+        """Remove a task that is still waiting in a queue"""
+        item = self._queued.pop(task_id, None)
+        if item is None:
+            return False
+        item.removed = True
+        item.task.status = "cancelled"
+        self._depth[item.agent] -= 1
+        self.cancelled += 1
+        self._compact(item.agent)
+        return True
+
+    def is_queued(self, task_id: str) -> bool:
+        return task_id in self._queued
+
+    async def _on_capacity_freed(self, agent: BaseAgent):
+        """Agent callback: a slot freed up or a break/rest ended"""
+        if agent.name in self._heaps:
+            await self.dispatch(agent.name)
+
+    async def _fill(self, agent_name: str, own_queue: bool = True) -> int:
+        agent = self.agents[agent_name]
+        started = 0
+
+        while agent.biometrics.can_accept_task():
+            item = self._pop(agent_name) if own_queue else None
+            if item is None:
+                item = self._steal(agent_name)
+            if item is None:
+                break
+            if not await self._start(agent_name, item):
+                self._push(QueuedTask(task=item.task, agent=item.agent, enqueued_at=item.enqueued_at))
+                break
+            started += 1
+
+        return started
+
+    async def _start(self, agent_name: str, item: QueuedTask) -> bool:
+        agent = self.agents[agent_name]
+        task = item.task
+
+        # can_accept_task was checked with no await in between
+        if not await agent.assign_task(task):
+            return False
+
+        waited = time.monotonic() - item.enqueued_at
+        self.dispatched += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if agent_name != item.agent:
+            task.stolen_from = item.agent
+            self.stolen += 1
+            self.stolen_by[agent_name] += 1
+            logger.info(f"⬡ {agent_name} stole '{task.title}' from {item.agent}")
+
+        if self.engine is not None:
+            self.engine.submit(agent_name, task, assigned=True)
+        else:
+            await agent.start_task(task.id)
+        return True
+
+    def _push(self, item: QueuedTask):
+        rank = PRIORITY_RANK.get(item.task.priority, len(PRIORITY_RANK))
+        heapq.heappush(self._heaps[item.agent], (rank, item.enqueued_at, next(self._seq), item))
+        self._queued[item.task.id] = item
+        self._depth[item.agent] += 1
+
+    def _take(self, item: QueuedTask) -> QueuedTask:
+        item.removed = True
+        self._queued.pop(item.task.id, None)
+        self._depth[item.agent] -= 1
+        return item
+
+    def _pop(self, agent_name: str) -> Optional[QueuedTask]:
+        """Highest-priority, oldest live task in an agent's own queue"""
+        heap = self._heaps[agent_name]
+        while heap:
+            item = heapq.heappop(heap)[3]
+            if not item.removed:
+                return self._take(item)
+        return None
+
+    def _steal(self, agent_name: str) -> Optional[QueuedTask]:
+        """Best not-yet-started task queued on a neighbor that this agent can handle"""
+        best: Optional[HeapEntry] = None
+        for neighbor in self.neighbors.get(agent_name, []):
+            heap = self._heaps.get(neighbor)
+            if not heap:
+                continue
+            stale = len(heap) - self._depth[neighbor]
+            for entry in heapq.nsmallest(STEAL_SCAN + stale, heap):
+                item = entry[3]
+                if item.removed:
+                    continue
+                if best is not None and entry >= best:
+                    break
+                if self.agents[agent_name].can_handle_task(item.task.description) > self.steal_threshold:
+                    best = entry
+                    break
+
+        if best is None:
+            return None
+        item = self._take(best[3])
+        self._compact(item.agent)
+        return item
+
+    def _compact(self, agent_name: str):
+        """Drop lazily deleted entries once they outnumber the live ones"""
+        heap = self._heaps[agent_name]
+        if len(heap) - self._depth[agent_name] > max(STEAL_SCAN, self._depth[agent_name]):
+            heap[:] = [entry for entry in heap if not entry[3].removed]
+            heapq.heapify(heap)
+
+    def _placed_on(self, task: Task) -> Optional[str]:
+        for name, agent in self.agents.items():
+            if agent.tasks.get(task.id) is task:
+                return name
+        return None
+
+    def _rest_if_needed(self, agent_name: str):
+        """Send an idle agent that needs rest to rest (its queue drains afterwards)"""
+        agent = self.agents[agent_name]
+        if (
+            agent_name in self._resting
+            or agent.biometrics.concurrent_tasks > 0
+            or not agent.biometrics.needs_rest()
+        ):
+            return
+
+        self._resting.add(agent_name)
+        rest = asyncio.create_task(agent.rest(), name=f"council-rest-{agent_name}")
+        rest.add_done_callback(lambda _: self._resting.discard(agent_name))
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and wait times"""
+        now = time.monotonic()
+        oldest: Dict[str, Optional[float]] = {name: None for name in self.agents}
+        for item in self._queued.values():
+            waited = now - item.enqueued_at
+            if oldest[item.agent] is None or waited > oldest[item.agent]:
+                oldest[item.agent] = waited
+
+        return {
+            "queued": len(self._queued),
+            "by_agent": {
+                name: {
+                    "depth": self._depth[name],
+                    "oldest_wait_s": round(oldest[name], 3) if oldest[name] is not None else None
+                }
+                for name in self.agents
+            },
+            "enqueued": self.enqueued,
+            "dispatched": self.dispatched,
+            "stolen": self.stolen,
+            "stolen_by": dict(self.stolen_by),
+            "cancelled": self.cancelled,
+            "avg_wait_s": round(self.total_wait / self.dispatched, 3) if self.dispatched else 0.0,
+            "max_wait_s": round(self.max_wait, 3),
+            "resting": sorted(self._resting)
+        }
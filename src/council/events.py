@@ -0,0 +1,290 @@
+"""
+Council Events - In-process pub/sub bus for council activity
+
+Dashboards and Sofie used to poll /council/status, /council/agents and
+/council/meeting. The event bus pushes every change instead:
+
+- Typed events (EventType): phase transitions, task assignment / start /
+  completion / release, Aura vetoes, ledger accruals and agent biometrics
+- Every event gets a sequence number; the last HISTORY_SIZE events are
+  kept so a client can resume after `since` (SSE Last-Event-ID, WebSocket
+  ?since=) without missing anything
+- A client that falls further behind than the history (or whose queue
+  overflows) gets a stream.gap event and should re-read /council/status
+- publish() never blocks and is safe to call from any thread; delivery
+  happens on each subscriber's event loop
+
+Served by the API as Server-Sent Events (GET /council/events) and over a
+WebSocket (/council/events/ws). Sequence numbers are per process: under
+the cluster router, subscribe with ?session_id to follow that session's
+worker.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Any, AsyncIterator, Deque, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+HISTORY_SIZE = 10_000       # Events kept for resuming subscribers
+SUBSCRIBER_QUEUE_SIZE = 1_000
+
+
+class EventType(Enum):
+    """Council activity published on the bus"""
+    PHASE_CHANGED = "phase.changed"
+    TASK_ASSIGNED = "task.assigned"
+    TASK_STARTED = "task.started"
+    TASK_COMPLETED = "task.completed"
+    TASK_RELEASED = "task.released"  # Failed, timed out or cancelled
+    VETO = "council.veto"
+    ACCRUAL = "ledger.accrual"
+    BIOMETRICS = "agent.biometrics"
+    GAP = "stream.gap"  # Events were missed; re-read state
+
+
+@dataclass
+class CouncilEvent:
+    """One published event"""
+    seq: int
+    type: EventType
+    data: Dict[str, Any]
+    session_id: Optional[str] = None
+    agent: Optional[str] = None
+    timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        event = {
+            "seq": self.seq,
+            "type": self.type.value,
+            "timestamp": self.timestamp,
+            "data": self.data
+        }
+        if self.session_id is not None:
+            event["session_id"] = self.session_id
+        if self.agent is not None:
+            event["agent"] = self.agent
+        return event
+
+
+class Subscription:
+    """
+    One subscriber's filtered view of the bus (async iterator of events).
+
+    Created by EventBus.subscribe(); close() when done.
+    """
+
+    def __init__(
+        self,
+        bus: 'EventBus',
+        types: Optional[Set[EventType]] = None,
+        session_id: Optional[str] = None
+    ):
+        self.bus = bus
+        self.types = types
+        self.session_id = session_id
+        self.loop = asyncio.get_running_loop()
+        self._queue: "asyncio.Queue[CouncilEvent]" = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        self._backlog: Deque[CouncilEvent] = deque()  # Replayed history, sent first
+        self.last_seq = 0
+        self.overflowed = False
+        self.closed = False
+
+    def matches(self, event: CouncilEvent) -> bool:
+        if event.type is EventType.GAP:
+            return True
+        if self.types is not None and event.type not in self.types:
+            return False
+        # Session filter: that session's events plus council-wide ones
+        if self.session_id is not None and event.session_id not in (None, self.session_id):
+            return False
+        return True
+
+    def offer(self, event: CouncilEvent):
+        """Called by the bus from any thread"""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            self._deliver(event)
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: CouncilEvent):
+        if self.closed or self.overflowed or not self.matches(event):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow: stop delivering; the consumer gets a gap event and resumes
+            self.overflowed = True
+
+    def replay(self, events: Iterable[CouncilEvent]):
+        """Queue retained history ahead of live events (called by the bus)"""
+        self._backlog.extend(event for event in events if self.matches(event))
+
+    @property
+    def finished(self) -> bool:
+        return self.closed and not self._backlog and self._queue.empty()
+
+    async def next(self, timeout: Optional[float] = None) -> Optional[CouncilEvent]:
+        """
+        Next event, or None on timeout (use for keep-alives) or once finished.
+
+        After an overflow the queued events are drained, then a single
+        stream.gap event ends the subscription.
+        """
+        if self._backlog:
+            event = self._backlog.popleft()
+        elif self._queue.empty() and self.overflowed and not self.closed:
+            self.close()
+            return self.bus.gap_event(self.last_seq, "subscriber_queue_overflow", self.last_seq + 1)
+        elif self.finished:
+            return None
+        else:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        if event.type is not EventType.GAP:
+            self.last_seq = event.seq
+        return event
+
+    def __aiter__(self) -> AsyncIterator[CouncilEvent]:
+        return self
+
+    async def __anext__(self) -> CouncilEvent:
+        event = await self.next()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.bus._unsubscribe(self)
+
+
+class EventBus:
+    """
+    Sequence-numbered pub/sub with bounded history.
+
+    Usage:
+        bus = EventBus()
+        bus.publish(EventType.TASK_STARTED, {"task_id": task.id}, agent="veda")
+
+        subscription = bus.subscribe(since=last_seen)
+        async for event in subscription:
+            send(event.to_dict())
+    """
+
+    def __init__(self, history_size: int = HISTORY_SIZE):
+        self._history: Deque[CouncilEvent] = deque(maxlen=history_size)
+        self._subscribers: List[Subscription] = []
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.published = 0
+        self.by_type: Dict[str, int] = {}
+        self.overflows = 0
+
+    @property
+    def last_seq(self) -> int:
+        with self._lock:
+            return self._history[-1].seq if self._history else 0
+
+    def publish(
+        self,
+        type: EventType,
+        data: Dict[str, Any],
+        session_id: Optional[str] = None,
+        agent: Optional[str] = None
+    ) -> CouncilEvent:
+        """Publish an event (never blocks; safe from any thread)"""
+        with self._lock:
+            event = CouncilEvent(
+                seq=next(self._seq), type=type, data=data,
+                session_id=session_id, agent=agent
+            )
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+            self.published += 1
+            self.by_type[type.value] = self.by_type.get(type.value, 0) + 1
+
+        for subscription in subscribers:
+            subscription.offer(event)
+        return event
+
+    def subscribe(
+        self,
+        since: Optional[int] = None,
+        types: Optional[Iterable[str]] = None,
+        session_id: Optional[str] = None
+    ) -> Subscription:
+        """
+        Subscribe on the running event loop.
+
+        Args:
+            since: Replay retained events with seq > since first (None:
+                only new events)
+            types: EventType values to receive (None: all)
+            session_id: Only this session's events (plus council-wide ones)
+
+        Raises:
+            ValueError: Unknown event type
+        """
+        wanted = {EventType(value) for value in types} if types else None
+        subscription = Subscription(self, wanted, session_id)
+
+        with self._lock:
+            # Registered and replayed under the lock: no event is missed or doubled
+            self._subscribers.append(subscription)
+            if since is not None:
+                oldest = self._history[0].seq if self._history else self._next_seq_locked()
+                missed = [self.gap_event(since, "history_exceeded", oldest)] if since + 1 < oldest else []
+                subscription.replay(missed + [event for event in self._history if event.seq > since])
+                subscription.last_seq = since
+
+        return subscription
+
+    def gap_event(self, after: int, reason: str, resume_from: Optional[int] = None) -> CouncilEvent:
+        """Tell a subscriber it missed events after `after`"""
+        if reason == "subscriber_queue_overflow":
+            self.overflows += 1
+        return CouncilEvent(
+            seq=after, type=EventType.GAP,
+            data={"after": after, "reason": reason, "resume_from": resume_from}
+        )
+
+    def _next_seq_locked(self) -> int:
+        return (self._history[-1].seq + 1) if self._history else 1
+
+    def _unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def stats(self) -> Dict[str, Any]:
+        """Bus counters"""
+        with self._lock:
+            oldest = self._history[0].seq if self._history else None
+            subscribers = len(self._subscribers)
+        return {
+            "last_seq": self.last_seq,
+            "oldest_retained_seq": oldest,
+            "retained": len(self._history),
+            "subscribers": subscribers,
+            "published": self.published,
+            "by_type": dict(self.by_type),
+            "overflows": self.overflows
+        }
@@ -0,0 +1,274 @@
+"""
+Execution Engine - Runs deployed council work to completion
+
+Deployment used to stop at assign + start; nothing ran the agents. The
+engine drives every deployed task through its whole lifecycle on the
+event loop:
+
+1. Wait for a slot: one asyncio.Semaphore per agent, sized to the
+   agent's MAX_CONCURRENT_TASKS, so all six agents work in parallel and
+   none exceeds its limit
+2. assign_task + start_task (an agent that needs rest rests first)
+3. execute_task, bounded by a per-task timeout
+4. ledger accrual, then complete_task once it is durable
+
+Failures, timeouts and cancellations release the agent's slot without
+accruing NECTAR. Counters and wall-clock throughput are reported by
+stats() (surfaced in /council/status).
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from .agents import BaseAgent, Task
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_TASK_TIMEOUT = 300.0  # Seconds per execute_task call
+MAX_OUTCOMES = 10_000         # Finished task outcomes kept for inspection
+
+
+class ExecutionEngine:
+    """
+    Concurrent executor for deployed tasks.
+
+    Usage:
+        engine = ExecutionEngine(agents, ledger)
+        engine.submit("veda", task)
+        ...
+        await engine.drain()
+    """
+
+    def __init__(
+        self,
+        agents: Dict[str, BaseAgent],
+        ledger: Any,  # DiligenceLedger
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        default_quality: float = 1.0
+    ):
+        self.agents = agents
+        self.ledger = ledger
+        self.task_timeout = task_timeout
+        self.default_quality = default_quality
+
+        self._slots = {
+            name: asyncio.Semaphore(agent.biometrics.MAX_CONCURRENT_TASKS)
+            for name, agent in agents.items()
+        }
+        self._rest_locks = {name: asyncio.Lock() for name in agents}
+        self._running: Dict[str, asyncio.Task] = {}
+        self.outcomes: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Metrics
+        self.counts = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+            "rejected": 0
+        }
+        self.active_by_agent = {name: 0 for name in agents}
+        self.peak_by_agent = {name: 0 for name in agents}
+        self.peak_active = 0
+        self._first_submit: Optional[float] = None
+        self._last_finish: Optional[float] = None
+
+    def submit(
+        self,
+        agent_name: str,
+        task: Task,
+        timeout: Optional[float] = None,
+        assigned: bool = False
+    ) -> asyncio.Task:
+        """
+        Schedule a task for execution (returns immediately).
+
+        Args:
+            agent_name: Agent to run the task
+            task: The task (its id must be unique)
+            timeout: Seconds allowed for execute_task (default: engine's)
+            assigned: The task is already assigned to the agent (the
+                dispatch queue assigns before handing work over)
+
+        Returns:
+            asyncio.Task resolving to the task's outcome dict
+        """
+        if agent_name not in self.agents:
+            raise ValueError(f"Unknown agent: {agent_name}")
+        if task.id in self._running:
+            raise ValueError(f"Task already running: {task.id}")
+
+        self.counts["submitted"] += 1
+        if self._first_submit is None:
+            self._first_submit = time.monotonic()
+
+        run = asyncio.create_task(
+            self._run(agent_name, task, self.task_timeout if timeout is None else timeout, assigned),
+            name=f"council-task-{task.id}"
+        )
+        self._running[task.id] = run
+        run.add_done_callback(lambda _: self._running.pop(task.id, None))
+        return run
+
+    def is_running(self, task_id: str) -> bool:
+        """Whether a task is waiting for a slot or executing"""
+        run = self._running.get(task_id)
+        return run is not None and not run.done()
+
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a queued or running task"""
+        run = self._running.get(task_id)
+        if run is None or run.done():
+            return False
+        return run.cancel()
+
+    async def drain(self) -> List[Dict[str, Any]]:
+        """Wait for every submitted task to finish; returns their outcomes"""
+        runs = list(self._running.values())
+        if not runs:
+            return []
+        results = await asyncio.gather(*runs, return_exceptions=True)
+        return [result for result in results if isinstance(result, dict)]
+
+    async def _run(
+        self,
+        agent_name: str,
+        task: Task,
+        timeout: float,
+        assigned: bool = False
+    ) -> Dict[str, Any]:
+        agent = self.agents[agent_name]
+        outcome: Dict[str, Any] = {
+            "task_id": task.id,
+            "agent": agent_name,
+            "title": task.title,
+            "submitted_at": datetime.utcnow().isoformat()
+        }
+        started = 0.0
+
+        try:
+            async with self._slots[agent_name]:
+                if not assigned:
+                    assigned = await self._assign(agent, task)
+                if not assigned:
+                    return self._finish(outcome, "rejected", error="agent_at_capacity")
+
+                await agent.start_task(task.id)
+                self._track(agent_name, 1)
+                started = time.monotonic()
+
+                try:
+                    result = await asyncio.wait_for(agent.execute_task(task), timeout)
+                finally:
+                    self._track(agent_name, -1)
+
+                if task.status == "completed":
+                    # Completed (and accrued) by someone else meanwhile: never pay twice
+                    logger.warning(f"⚠️ '{task.title}' was already completed; skipping accrual")
+                    return self._finish(
+                        outcome, "completed",
+                        duration_s=time.monotonic() - started,
+                        already_completed=True
+                    )
+
+                quality = result.get("quality_score", self.default_quality)
+                hours = result.get("hours_worked", task.estimated_hours)
+
+                # Accrue first, complete once it is durable: a failed ledger
+                # write releases the task (below) so it can be completed again
+                accrual = await self.ledger.arecord_completion(
+                    agent_name=agent_name,
+                    task=task,
+                    hours_worked=hours,
+                    quality_score=quality,
+                    stolen_from=task.stolen_from
+                )
+                completion = await agent.complete_task(task.id, result, quality)
+                assigned = False
+
+            return self._finish(
+                outcome, "completed",
+                duration_s=time.monotonic() - started,
+                hours_worked=hours,
+                nectar_accrued=accrual["nectar_accrued"],
+                stolen_from=task.stolen_from,
+                result_status=completion.get("result", {}).get("status")
+            )
+
+        except asyncio.TimeoutError:
+            await self._release(agent, task, assigned, "timed_out")
+            logger.warning(f"⏱️ {agent_name} timed out on '{task.title}' after {timeout}s")
+            return self._finish(outcome, "timed_out", error=f"timeout after {timeout}s")
+
+        except asyncio.CancelledError:
+            await self._release(agent, task, assigned, "cancelled")
+            self._finish(outcome, "cancelled")
+            raise
+
+        except Exception as e:
+            await self._release(agent, task, assigned, "failed")
+            logger.error(f"❌ {agent_name} failed '{task.title}': {e}")
+            return self._finish(outcome, "failed", error=str(e))
+
+    async def _assign(self, agent: BaseAgent, task: Task) -> bool:
+        """Assign, resting the agent first if its biometrics demand it"""
+        if await agent.assign_task(task):
+            return True
+
+        if agent.biometrics.needs_rest():
+            async with self._rest_locks[agent.name]:
+                if agent.biometrics.needs_rest():
+                    await agent.rest()
+            return await agent.assign_task(task)
+
+        return False
+
+    async def _release(self, agent: BaseAgent, task: Task, assigned: bool, status: str):
+        if assigned:
+            await agent.release_task(task.id, status)
+
+    def _track(self, agent_name: str, delta: int):
+        self.active_by_agent[agent_name] += delta
+        if delta > 0:
+            self.peak_by_agent[agent_name] = max(
+                self.peak_by_agent[agent_name], self.active_by_agent[agent_name]
+            )
+            self.peak_active = max(self.peak_active, sum(self.active_by_agent.values()))
+
+    def _finish(self, outcome: Dict[str, Any], status: str, **fields) -> Dict[str, Any]:
+        outcome.update(fields)
+        outcome["status"] = status
+        outcome["finished_at"] = datetime.utcnow().isoformat()
+
+        self.counts[status] += 1
+        self._last_finish = time.monotonic()
+
+        self.outcomes[outcome["task_id"]] = outcome
+        while len(self.outcomes) > MAX_OUTCOMES:
+            self.outcomes.popitem(last=False)
+        return outcome
+
+    def stats(self) -> Dict[str, Any]:
+        """Execution counters and throughput"""
+        finished = sum(count for key, count in self.counts.items() if key != "submitted")
+        elapsed = (
+            self._last_finish - self._first_submit
+            if self._first_submit is not None and self._last_finish is not None
+            else 0.0
+        )
+        return {
+            **self.counts,
+            "in_flight": len(self._running),
+            "active_by_agent": dict(self.active_by_agent),
+            "peak_by_agent": dict(self.peak_by_agent),
+            "peak_active": self.peak_active,
+            "task_timeout_s": self.task_timeout,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_per_s": round(finished / elapsed, 2) if elapsed > 0 else None
+        }
@@ -0,0 +1,376 @@
+"""
+Columnar Ledger Archive - Memory-mapped accrual columns for analytics
+
+Archived ledger history stored column-wise as fixed-width binary arrays
+that are memory-mapped for reading, with agent and repo names
+dictionary-encoded as small integer ids. Aggregations (per-agent,
+per-repo, per-day totals and histograms) are NumPy-vectorized, so
+reporting over hundreds of thousands of accruals never materializes a
+Python object per record.
+
+Layout (<ledger>.columns/):
+- hours_worked.f8, nectar_accrued.f8, quality_multiplier.f8
+- timestamp.i8       Epoch seconds (UTC)
+- agent_id.i4, repo_id.i4
+- dictionary.json    Agent/repo names, committed row count, ingested segments
+
+NumPy is an optional dependency; without it the archive is unavailable
+and the ledger works as before.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # Analytics are optional
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+# Column name -> NumPy dtype
+COLUMNS = {
+    "hours_worked": "<f8",
+    "nectar_accrued": "<f8",
+    "quality_multiplier": "<f8",
+    "timestamp": "<i8",
+    "agent_id": "<i4",
+    "repo_id": "<i4",
+}
+
+NUMERIC_COLUMNS = ("hours_worked", "nectar_accrued", "quality_multiplier")
+
+SECONDS_PER_DAY = 86400
+INGEST_CHUNK = 65536
+
+
+def columnar_available() -> bool:
+    """Whether NumPy is installed so the archive can be used"""
+    return np is not None
+
+
+def _epoch_seconds(timestamp: str) -> int:
+    """ISO timestamp (naive = UTC, as written by the ledger) to epoch seconds"""
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+class ColumnarArchive:
+    """
+    Append-only columnar archive of accrual records.
+
+    The committed row count in dictionary.json is the source of truth:
+    bytes past it (from a crash mid-append) are truncated on open.
+    """
+
+    def __init__(self, directory: Path):
+        if np is None:
+            raise ImportError("ColumnarArchive requires numpy (pip install numpy)")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dictionary_path = self.directory / "dictionary.json"
+
+        self.agents: List[str] = []
+        self.repos: List[str] = []
+        self.rows = 0
+        self.ingested_segments: List[str] = []
+
+        self._agent_ids: Dict[str, int] = {}
+        self._repo_ids: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+        self._load_dictionary()
+        self._repair_columns()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, records: Iterable[Any]) -> int:
+        """
+        Append accrual records (NectarAccrualRecord or dicts).
+
+        Returns:
+            Number of rows appended
+        """
+        with self._lock:
+            try:
+                appended = self._append_records(records)
+                if appended:
+                    self._save_dictionary()
+            except BaseException:
+                self._rollback()
+                raise
+        return appended
+
+    def ingest(self, source: str, records: Iterable[Any]) -> int:
+        """
+        Append the records of a named source (e.g. a journal segment), once.
+
+        Returns:
+            Number of rows appended (0 if the source was already ingested)
+        """
+        with self._lock:
+            if source in self.ingested_segments:
+                return 0
+
+            try:
+                appended = self._append_records(records)
+                # Rows and the source marker commit together
+                self.ingested_segments.append(source)
+                self._save_dictionary()
+            except BaseException:
+                self._rollback()
+                raise
+
+        logger.info(f"📊 Columnar archive ingested {source} ({appended} rows)")
+        return appended
+
+    def ingest_segment(self, segment_path: Path) -> int:
+        """Ingest an archived NDJSON journal segment, once"""
+        def read_lines():
+            with open(segment_path, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+
+        return self.ingest(segment_path.name, read_lines())
+
+    def _append_records(self, records: Iterable[Any]) -> int:
+        """Write rows to the column files; committed by _save_dictionary"""
+        appended = 0
+        chunk: List[Any] = []
+
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= INGEST_CHUNK:
+                appended += self._append_chunk(chunk)
+                chunk = []
+        if chunk:
+            appended += self._append_chunk(chunk)
+
+        return appended
+
+    def _append_chunk(self, chunk: List[Any]) -> int:
+        n = len(chunk)
+        columns = {name: np.empty(n, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+        for i, record in enumerate(chunk):
+            get = record.get if isinstance(record, dict) else record.__getattribute__
+            columns["hours_worked"][i] = get("hours_worked")
+            columns["nectar_accrued"][i] = get("nectar_accrued")
+            columns["quality_multiplier"][i] = get("quality_multiplier")
+            columns["timestamp"][i] = _epoch_seconds(get("timestamp"))
+            columns["agent_id"][i] = self._encode(get("agent_name"), self.agents, self._agent_ids)
+            columns["repo_id"][i] = self._encode(get("repo"), self.repos, self._repo_ids)
+
+        for name, values in columns.items():
+            with open(self._column_path(name), 'ab') as f:
+                values.tofile(f)
+                f.flush()
+                os.fsync(f.fileno())
+
+        self.rows += n
+        return n
+
+    @staticmethod
+    def _encode(value: str, names: List[str], ids: Dict[str, int]) -> int:
+        value = value or ""
+        code = ids.get(value)
+        if code is None:
+            code = len(names)
+            names.append(value)
+            ids[value] = code
+        return code
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> "np.ndarray":
+        """Memory-mapped view of a column's committed rows"""
+        if self.rows == 0:
+            return np.empty(0, dtype=COLUMNS[name])
+        return np.memmap(self._column_path(name), dtype=COLUMNS[name], mode="r", shape=(self.rows,))
+
+    def totals_by_agent(self, tail: Iterable[Any] = ()) -> Dict[str, Dict[str, float]]:
+        """Per-agent nectar/hours/tasks/average quality"""
+        return self._group_totals("agent_id", "agents", tail)
+
+    def totals_by_repo(self, tail: Iterable[Any] = ()) -> Dict[str, Dict[str, float]]:
+        """Per-repo nectar/hours/tasks/average quality"""
+        return self._group_totals("repo_id", "repos", tail)
+
+    def totals_by_day(self, tail: Iterable[Any] = ()) -> Dict[str, Dict[str, float]]:
+        """Per-UTC-day nectar/hours/tasks/average quality"""
+        with self._lock:
+            cols, _, _ = self._columns_with_tail(tail)
+
+        days = cols["timestamp"] // SECONDS_PER_DAY
+        unique_days, inverse = np.unique(days, return_inverse=True)
+        grouped = self._bincount_totals(cols, inverse, len(unique_days))
+
+        return {
+            datetime.fromtimestamp(int(day) * SECONDS_PER_DAY, tz=timezone.utc).strftime("%Y-%m-%d"): grouped[i]
+            for i, day in enumerate(unique_days)
+        }
+
+    def histogram(
+        self,
+        column: str,
+        bins: int = 10,
+        tail: Iterable[Any] = ()
+    ) -> Dict[str, Any]:
+        """Histogram of hours_worked, nectar_accrued or quality_multiplier"""
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"Not a numeric ledger column: {column}")
+
+        with self._lock:
+            cols, _, _ = self._columns_with_tail(tail)
+
+        values = cols[column]
+        if values.size == 0:
+            return {"column": column, "edges": [], "counts": []}
+
+        counts, edges = np.histogram(values, bins=bins)
+        return {
+            "column": column,
+            "edges": [round(float(e), 4) for e in edges],
+            "counts": [int(c) for c in counts],
+            "mean": round(float(values.mean()), 4),
+            "sum": round(float(values.sum()), 4)
+        }
+
+    def summary(self, tail: Iterable[Any] = (), bins: int = 10) -> Dict[str, Any]:
+        """All aggregations in one report"""
+        tail = list(tail)
+        return {
+            "rows": self.rows + len(tail),
+            "by_agent": self.totals_by_agent(tail),
+            "by_repo": self.totals_by_repo(tail),
+            "by_day": self.totals_by_day(tail),
+            "histograms": {
+                name: self.histogram(name, bins, tail) for name in NUMERIC_COLUMNS
+            }
+        }
+
+    def _group_totals(self, key: str, names_attr: str, tail: Iterable[Any]) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            cols, agents, repos = self._columns_with_tail(tail)
+
+        names = agents if names_attr == "agents" else repos
+        grouped = self._bincount_totals(cols, cols[key], len(names))
+        return {
+            name: grouped[i] for i, name in enumerate(names) if grouped[i]["tasks"]
+        }
+
+    @staticmethod
+    def _bincount_totals(cols: Dict[str, "np.ndarray"], keys: "np.ndarray", size: int) -> List[Dict[str, float]]:
+        tasks = np.bincount(keys, minlength=size)
+        nectar = np.bincount(keys, weights=cols["nectar_accrued"], minlength=size)
+        hours = np.bincount(keys, weights=cols["hours_worked"], minlength=size)
+        quality = np.bincount(keys, weights=cols["quality_multiplier"], minlength=size)
+
+        return [
+            {
+                "nectar": round(float(nectar[i]), 2),
+                "hours": round(float(hours[i]), 2),
+                "tasks": int(tasks[i]),
+                "quality_avg": round(float(quality[i] / tasks[i]), 2) if tasks[i] else 0.0
+            }
+            for i in range(size)
+        ]
+
+    def _columns_with_tail(self, tail: Iterable[Any]):
+        """Archived columns plus not-yet-archived records, with dictionaries"""
+        tail = list(tail)
+        cols = {name: self.column(name) for name in COLUMNS}
+        agents, repos = list(self.agents), list(self.repos)
+
+        if not tail:
+            return cols, agents, repos
+
+        agent_ids = dict(self._agent_ids)
+        repo_ids = dict(self._repo_ids)
+        extra = {
+            "hours_worked": np.fromiter((r.hours_worked for r in tail), dtype=COLUMNS["hours_worked"], count=len(tail)),
+            "nectar_accrued": np.fromiter((r.nectar_accrued for r in tail), dtype=COLUMNS["nectar_accrued"], count=len(tail)),
+            "quality_multiplier": np.fromiter((r.quality_multiplier for r in tail), dtype=COLUMNS["quality_multiplier"], count=len(tail)),
+            "timestamp": np.fromiter((_epoch_seconds(r.timestamp) for r in tail), dtype=COLUMNS["timestamp"], count=len(tail)),
+            "agent_id": np.fromiter((self._encode(r.agent_name, agents, agent_ids) for r in tail), dtype=COLUMNS["agent_id"], count=len(tail)),
+            "repo_id": np.fromiter((self._encode(r.repo, repos, repo_ids) for r in tail), dtype=COLUMNS["repo_id"], count=len(tail)),
+        }
+
+        return (
+            {name: np.concatenate([cols[name], extra[name]]) for name in COLUMNS},
+            agents,
+            repos
+        )
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _column_path(self, name: str) -> Path:
+        suffix = COLUMNS[name][1:]  # "f8" / "i8" / "i4"
+        return self.directory / f"{name}.{suffix}"
+
+    def _load_dictionary(self):
+        if not self.dictionary_path.exists():
+            return
+
+        with open(self.dictionary_path, 'r') as f:
+            data = json.load(f)
+
+        self.agents = data.get("agents", [])
+        self.repos = data.get("repos", [])
+        self.rows = data.get("rows", 0)
+        self.ingested_segments = data.get("ingested_segments", [])
+        self._agent_ids = {name: i for i, name in enumerate(self.agents)}
+        self._repo_ids = {name: i for i, name in enumerate(self.repos)}
+
+    def _save_dictionary(self):
+        data = {
+            "agents": self.agents,
+            "repos": self.repos,
+            "rows": self.rows,
+            "ingested_segments": self.ingested_segments,
+            "updated_at": datetime.utcnow().isoformat()
+        }
+
+        tmp_path = self.dictionary_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.dictionary_path)
+
+    def _rollback(self):
+        """Back to the committed dictionary after a failed write: drop its rows and names"""
+        self.agents, self.repos, self.rows, self.ingested_segments = [], [], 0, []
+        self._agent_ids, self._repo_ids = {}, {}
+        self._load_dictionary()
+        self._repair_columns()
+
+    def _repair_columns(self):
+        """Drop bytes past the committed row count (torn appends)"""
+        for name, dtype in COLUMNS.items():
+            path = self._column_path(name)
+            expected = self.rows * np.dtype(dtype).itemsize
+            if not path.exists():
+                if self.rows:
+                    raise ValueError(f"Columnar archive is missing {path.name}")
+                continue
+            if path.stat().st_size > expected:
+                logger.warning(f"Truncating torn column {path.name}")
+                with open(path, 'r+b') as f:
+                    f.truncate(expected)
@@ -0,0 +1,85 @@
+"""
+Ledger Compaction - Periodic snapshot + segment archival
+
+Runs alongside the council API. Every interval it asks the ledger store
+to compact: write a snapshot of agent totals, genesis allocations,
+per-agent recent windows and the record count, then archive the active
+journal segment. Cold start then loads the snapshot and replays only
+records written since, so boot time tracks recent activity rather than
+lifetime history.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerCompactor:
+    """
+    Background compaction job for a LedgerStore.
+
+    Compaction itself runs in a worker thread so the event loop is
+    never blocked by snapshot writes.
+    """
+
+    def __init__(
+        self,
+        store: Any,  # LedgerStore
+        interval_seconds: float = 300.0,
+        min_records: int = 1
+    ):
+        self.store = store
+        self.interval_seconds = interval_seconds
+        self.min_records = max(1, min_records)
+
+        self.compactions = 0
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the periodic job on the running event loop"""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"📊 Ledger compaction every {self.interval_seconds:.0f}s")
+
+    async def stop(self):
+        """Stop the periodic job"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def compact_now(self) -> Dict[str, Any]:
+        """Run one compaction pass off the event loop"""
+        loop = asyncio.get_running_loop()
+        report = await loop.run_in_executor(None, self.store.compact)
+
+        self.compactions += 1
+        self.last_report = report
+        logger.info(f"📊 Ledger compaction: {report}")
+        return report
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+
+            if self.store.pending_compaction() < self.min_records:
+                continue
+
+            try:
+                await self.compact_now()
+            except Exception as e:
+                logger.error(f"Ledger compaction failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "compactions": self.compactions,
+            "pending_records": self.store.pending_compaction(),
+            "last_report": self.last_report
+        }
@@ -0,0 +1,258 @@
+"""
+Ledger Journal - Append-only storage for NECTAR accrual records
+
+Each accrual is appended as a single JSON line, so recording a completion
+costs the same no matter how long the history is. Agent totals are
+checkpointed every N records together with the journal offset they cover;
+startup loads the latest checkpoint and replays only the journal tail.
+
+Compaction (rotate) snapshots the aggregate state and moves the active
+journal into the segment archive, so the live journal only ever holds
+recent activity.
+
+Files (next to the ledger path):
+- <ledger>.journal          Line-delimited accrual records (active segment)
+- <ledger>.checkpoint.json  Latest snapshot + active segment/offset
+- <ledger>.segments/        Archived journal segments (segment-NNNNNN.jsonl)
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class LedgerJournal:
+    """
+    Append-only journal with periodic checkpoints.
+
+    The journal itself is never rewritten; checkpoints are written to a
+    temporary file and atomically swapped in so a crash mid-checkpoint
+    leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, ledger_path: Path, checkpoint_interval: int = 500):
+        self.journal_path = ledger_path.with_suffix(".journal")
+        self.checkpoint_path = ledger_path.with_suffix(".checkpoint.json")
+        self.segments_dir = ledger_path.with_suffix(".segments")
+        self.checkpoint_interval = max(1, checkpoint_interval)
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Records appended since the last checkpoint / compaction
+        self.pending_since_checkpoint = 0
+        self.pending_since_compaction = 0
+        self.segment = 1  # Number the active journal will archive as
+        self._handle = None
+
+    def exists(self) -> bool:
+        """Whether any journal state has been written yet"""
+        return self.journal_path.exists() or self.checkpoint_path.exists()
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Load the latest checkpoint and the journal tail written after it.
+
+        Returns:
+            (checkpoint or None, list of record dicts from the tail)
+        """
+        checkpoint = None
+        if self.checkpoint_path.exists():
+            try:
+                with open(self.checkpoint_path, 'r') as f:
+                    checkpoint = json.load(f)
+            except Exception as e:
+                logger.error(f"Failed to load ledger checkpoint: {e}")
+                checkpoint = None
+
+        offset = checkpoint.get("journal_offset", 0) if checkpoint else 0
+        self.segment = checkpoint.get("segment", 1) if checkpoint else 1
+
+        if self.segment_path(self.segment).exists():
+            # Crashed after archiving but before the post-rotation
+            # checkpoint: the snapshot already covers the archived
+            # segment and the active journal is a fresh one
+            self.segment += 1
+            offset = 0
+
+        tail = self._replay(offset)
+        self.pending_since_checkpoint = len(tail)
+        self.pending_since_compaction = len(tail)
+
+        return checkpoint, tail
+
+    def segment_path(self, segment: int) -> Path:
+        """Path of an archived journal segment"""
+        return self.segments_dir / f"segment-{segment:06d}.jsonl"
+
+    def archived_segments(self) -> List[Path]:
+        """Archived segments, oldest first"""
+        if not self.segments_dir.exists():
+            return []
+        return sorted(self.segments_dir.glob("segment-*.jsonl"))
+
+    def _replay(self, offset: int) -> List[Dict[str, Any]]:
+        """Read records from the journal starting at a byte offset"""
+        if not self.journal_path.exists():
+            return []
+
+        records = []
+        good_offset = offset
+
+        with open(self.journal_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Torn write from a crash - drop the partial record
+                    break
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+                good_offset += len(line)
+
+        if good_offset < self.journal_path.stat().st_size:
+            logger.warning(
+                f"Truncating torn journal tail at offset {good_offset}"
+            )
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(good_offset)
+
+        return records
+
+    def iter_active(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily read every complete record in the active journal (read-only).
+
+        The file is opened immediately, so the iterator keeps reading the
+        same segment even if the journal is rotated meanwhile.
+        """
+        if self._handle is not None:
+            self._handle.flush()
+        if not self.journal_path.exists():
+            return iter(())
+        return self._iter_lines(open(self.journal_path, 'rb'))
+
+    @staticmethod
+    def _iter_lines(f) -> Iterator[Dict[str, Any]]:
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Append in progress
+                yield json.loads(line)
+
+    @staticmethod
+    def iter_segment(segment: Path) -> Iterator[Dict[str, Any]]:
+        """Lazily read the records of an archived segment"""
+        with open(segment, 'r') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def append(self, record: Dict[str, Any]):
+        """Append a single record to the journal"""
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]], sync: bool = False):
+        """
+        Append records to the journal in a single write.
+
+        Args:
+            records: Record dicts to append, in order
+            sync: fsync before returning so the records are durable
+        """
+        if self._handle is None:
+            self._handle = open(self.journal_path, 'ab')
+
+        payload = "".join(
+            json.dumps(record, separators=(",", ":")) + "\n" for record in records
+        )
+        offset = self._handle.tell()
+        try:
+            self._handle.write(payload.encode("utf-8"))
+            self._handle.flush()
+            if sync:
+                os.fsync(self._handle.fileno())
+        except OSError:
+            # Cut off whatever part of the batch reached the file
+            self._handle.close()
+            self._handle = None
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(offset)
+            raise
+
+        self.pending_since_checkpoint += len(records)
+        self.pending_since_compaction += len(records)
+
+    def needs_checkpoint(self) -> bool:
+        """Whether enough records have accumulated to checkpoint"""
+        return self.pending_since_checkpoint >= self.checkpoint_interval
+
+    def checkpoint(self, state: Dict[str, Any]):
+        """
+        Write a checkpoint covering everything appended so far.
+
+        Args:
+            state: Aggregate state to persist (totals, recent windows, counts)
+        """
+        if self._handle is not None:
+            self._handle.flush()
+
+        offset = self.journal_path.stat().st_size if self.journal_path.exists() else 0
+
+        data = dict(state)
+        data["journal_offset"] = offset
+        data["segment"] = self.segment
+        data["checkpointed_at"] = datetime.utcnow().isoformat()
+
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+        self.pending_since_checkpoint = 0
+        logger.debug(f"Ledger checkpoint written at offset {offset}")
+
+    def rotate(self, state: Dict[str, Any]) -> Optional[Path]:
+        """
+        Snapshot state and archive the active journal as a segment.
+
+        Order matters for crash safety: the snapshot covering the whole
+        active journal is written first, then the journal is archived,
+        then a snapshot pointing at the fresh journal is written.
+
+        Args:
+            state: Aggregate state covering every record appended so far
+
+        Returns:
+            Path of the archived segment (None if the journal was empty)
+        """
+        self.checkpoint(state)
+
+        if not self.journal_path.exists() or self.journal_path.stat().st_size == 0:
+            self.pending_since_compaction = 0
+            return None
+
+        self.close()
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        archived = self.segment_path(self.segment)
+        os.replace(self.journal_path, archived)
+
+        self.segment += 1
+        self.checkpoint(state)
+        self.pending_since_compaction = 0
+
+        logger.info(f"Archived ledger journal segment {archived.name}")
+        return archived
+
+    def close(self):
+        """Close the journal file handle"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
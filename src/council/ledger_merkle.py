@@ -0,0 +1,316 @@
+"""
+Ledger Merkle Log - Incremental Merkle tree over NECTAR accruals
+
+Every accrual appends one leaf, so the genesis snapshot can carry a
+single root committing to the whole history plus short per-agent
+inclusion proofs, instead of the chain bridge re-hashing every record.
+
+Tree shape and hashing follow RFC 6962 / RFC 9162 (Certificate
+Transparency):
+- leaf hash:  SHA-256(0x00 || canonical JSON of {record, running totals})
+- node hash:  SHA-256(0x01 || left || right)
+
+Only complete (power-of-two) subtrees are stored, level by level, so an
+append costs O(log n) hashes and an inclusion proof is O(log n).
+
+File (next to the ledger path):
+- <ledger>.merkle   One line per leaf: "<hex leaf hash>\\t<agent name>"
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+HASH_SIZE = 32
+EMPTY_ROOT = hashlib.sha256(b"").digest()
+
+# Record fields hashed as floats whatever type the backend returns
+NUMERIC_FIELDS = ("hours_worked", "base_rate", "quality_multiplier", "nectar_accrued")
+
+
+def leaf_payload(record: Any, totals: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    What a leaf commits to: the accrual record and the agent's running
+    totals after it. Totals are rounded so every backend hashes the same.
+    """
+    committed = record.to_dict()
+    for field in NUMERIC_FIELDS:
+        committed[field] = float(committed[field])
+
+    return {
+        "record": committed,
+        "totals": {
+            "total_nectar": round(totals["total_nectar"], 6),
+            "total_hours": round(totals["total_hours"], 6),
+            "tasks_completed": int(totals["tasks_completed"])
+        }
+    }
+
+
+def leaf_hash(payload: Dict[str, Any]) -> bytes:
+    """RFC 6962 leaf hash of a leaf payload"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(b"\x00" + canonical.encode("utf-8")).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    """RFC 6962 interior node hash"""
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def verify_inclusion(
+    leaf: bytes,
+    index: int,
+    size: int,
+    audit_path: List[bytes],
+    root: bytes
+) -> bool:
+    """
+    Verify an inclusion proof (RFC 9162 section 2.1.3.2).
+
+    Args:
+        leaf: Leaf hash
+        index: Leaf index
+        size: Tree size the root was computed at
+        audit_path: Sibling hashes, leaf level first
+        root: Expected root hash
+    """
+    if index >= size:
+        return False
+
+    fn, sn, r = index, size - 1, leaf
+    for p in audit_path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+
+    return sn == 0 and r == root
+
+
+class MerkleLog:
+    """
+    Append-only Merkle tree persisted as a leaf-hash log.
+
+    levels[k] holds the hashes of every complete subtree of 2**k leaves,
+    packed into a bytearray (32 bytes per node). The root and the
+    right-edge subtrees are folded from the "peaks" - the last node of
+    each level with an odd node count.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.levels: List[bytearray] = [bytearray()]
+        self.latest: Dict[str, int] = {}  # Agent -> index of its latest leaf
+        self._handle = None
+        self._lock = threading.RLock()
+
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Number of leaves"""
+        return len(self.levels[0]) // HASH_SIZE
+
+    def append(self, leaf: bytes, agent_name: str) -> int:
+        """Add a leaf hash and return its index"""
+        return self.append_many([(leaf, agent_name)])[0]
+
+    def append_many(
+        self,
+        leaves: List[Tuple[bytes, str]],
+        sync: bool = False
+    ) -> List[int]:
+        """
+        Add leaf hashes with a single write.
+
+        Args:
+            leaves: (leaf hash, agent name) pairs in order
+            sync: fsync before returning
+
+        Returns:
+            Index of each leaf
+        """
+        with self._lock:
+            if self._handle is None:
+                self._handle = open(self.path, 'ab')
+
+            payload = "".join(f"{leaf.hex()}\t{agent}\n" for leaf, agent in leaves)
+            self._handle.write(payload.encode("utf-8"))
+            self._handle.flush()
+            if sync:
+                os.fsync(self._handle.fileno())
+
+            return [self._push(leaf, agent) for leaf, agent in leaves]
+
+    def root(self) -> bytes:
+        """Root hash of the current tree"""
+        with self._lock:
+            if self.size == 0:
+                return EMPTY_ROOT
+            return self._right_edges()[0]
+
+    def leaf(self, index: int) -> bytes:
+        """Stored leaf hash"""
+        return self._node(0, index)
+
+    def iter_leaves(self, size: int, chunk: int = 1024) -> Iterator[bytes]:
+        """Leaf hashes 0..size-1, copied out a chunk at a time"""
+        for start in range(0, size, chunk):
+            with self._lock:
+                end = min(start + chunk, size)
+                block = bytes(self.levels[0][start * HASH_SIZE:end * HASH_SIZE])
+            for i in range(0, len(block), HASH_SIZE):
+                yield block[i:i + HASH_SIZE]
+
+    def inclusion_proof(self, index: int) -> List[bytes]:
+        """Audit path for one leaf against the current tree"""
+        with self._lock:
+            return self.inclusion_proofs([index])[index]
+
+    def inclusion_proofs(self, indexes: List[int]) -> Dict[int, List[bytes]]:
+        """
+        Audit paths for several leaves against the same tree size.
+
+        The right-edge subtree hashes are folded once and shared, so each
+        proof costs O(log n).
+        """
+        with self._lock:
+            n = self.size
+            edges = self._right_edges()
+            return {index: self._path(index, n, edges) for index in indexes}
+
+    def truncate(self, size: int):
+        """Drop leaves past size (leaves for records that never committed)"""
+        with self._lock:
+            if size >= self.size:
+                return
+
+            self.close()
+            with open(self.path, 'rb') as f:
+                lines = f.readlines()[:size]
+
+            tmp_path = self.path.with_suffix(".merkle.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+            logger.warning(f"Truncated Merkle log to {size} leaves")
+            self._load()
+
+    def close(self):
+        """Close the log file handle"""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+    def _push(self, leaf: bytes, agent_name: str) -> int:
+        """Add a leaf in memory, hashing each subtree it completes"""
+        index = self.size
+        self.levels[0] += leaf
+        self.latest[agent_name] = index
+
+        k = 0
+        while (len(self.levels[k]) // HASH_SIZE) % 2 == 0:
+            level = self.levels[k]
+            parent = node_hash(level[-2 * HASH_SIZE:-HASH_SIZE], level[-HASH_SIZE:])
+            if len(self.levels) == k + 1:
+                self.levels.append(bytearray())
+            self.levels[k + 1] += parent
+            k += 1
+
+        return index
+
+    def _node(self, level: int, position: int) -> bytes:
+        start = position * HASH_SIZE
+        return bytes(self.levels[level][start:start + HASH_SIZE])
+
+    def _right_edges(self) -> Dict[int, bytes]:
+        """
+        Hash of the subtree covering [start, size) for each peak start.
+
+        These are the only incomplete subtrees an RFC 6962 tree has.
+        """
+        peaks = []  # (start, level), left to right
+        start = 0
+        for level in range(len(self.levels) - 1, -1, -1):
+            count = len(self.levels[level]) // HASH_SIZE
+            if count % 2:
+                peaks.append((start, level))
+                start += 1 << level
+
+        edges: Dict[int, bytes] = {}
+        acc: Optional[bytes] = None
+        for start, level in reversed(peaks):
+            peak = self._node(level, start >> level)
+            acc = peak if acc is None else node_hash(peak, acc)
+            edges[start] = acc
+        return edges
+
+    def _subtree(self, start: int, size: int, n: int, edges: Dict[int, bytes]) -> bytes:
+        if start + size == n and start in edges:
+            return edges[start]
+        level = size.bit_length() - 1  # Complete, aligned subtree
+        return self._node(level, start >> level)
+
+    def _path(self, index: int, n: int, edges: Dict[int, bytes]) -> List[bytes]:
+        """RFC 6962 PATH(index, D[0:n]), leaf level first"""
+        if index >= n:
+            raise IndexError(f"Leaf {index} not in tree of size {n}")
+
+        path = []
+        start, size, m = 0, n, index
+        while size > 1:
+            k = 1 << ((size - 1).bit_length() - 1)  # Largest power of two < size
+            if m < k:
+                path.append(self._subtree(start + k, size - k, n, edges))
+                size = k
+            else:
+                path.append(self._subtree(start, k, n, edges))
+                start, m, size = start + k, m - k, size - k
+
+        path.reverse()
+        return path
+
+    def _load(self):
+        """Rebuild the tree from the leaf log"""
+        self.levels = [bytearray()]
+        self.latest = {}
+
+        if not self.path.exists():
+            return
+
+        good_offset = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn write
+                leaf_hex, _, agent = line.decode("utf-8").rstrip("\n").partition("\t")
+                self._push(bytes.fromhex(leaf_hex), agent)
+                good_offset += len(line)
+
+        if good_offset < self.path.stat().st_size:
+            logger.warning(f"Truncating torn Merkle log tail at offset {good_offset}")
+            with open(self.path, 'r+b') as f:
+                f.truncate(good_offset)
+
+        logger.info(f"📊 Merkle log loaded: {self.size} leaves")
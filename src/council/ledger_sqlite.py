@@ -0,0 +1,431 @@
+"""
+SQLite Ledger Store - Indexed NECTAR accrual storage
+
+Drop-in LedgerStore backend on the stdlib sqlite3 module (WAL mode).
+History lives on disk only; per-agent totals are kept in a materialized
+table updated in the same transaction as each accrual, so summaries,
+genesis snapshots and recent-accrual lookups are indexed queries and
+startup does not parse the history at all.
+
+Schema:
+- accruals:     one row per record, indexed on (agent_name, timestamp),
+                repo and task_id
+- agent_totals: materialized per-agent totals
+- ledger_meta:  format version
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from .ledger_store import (
+    LedgerStore, NectarAccrualRecord, migrate_ledger_data,
+    LEDGER_FORMAT_VERSION, DEFAULT_LEDGER_PATH
+)
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accruals (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_name TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    task_title TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    hours_worked REAL NOT NULL,
+    base_rate REAL NOT NULL,
+    quality_multiplier REAL NOT NULL,
+    nectar_accrued REAL NOT NULL,
+    timestamp TEXT NOT NULL,
+    blockchain_eligible INTEGER NOT NULL DEFAULT 1,
+    stolen_from TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_accruals_agent_time ON accruals (agent_name, timestamp);
+CREATE INDEX IF NOT EXISTS idx_accruals_repo ON accruals (repo);
+CREATE INDEX IF NOT EXISTS idx_accruals_task ON accruals (task_id);
+
+CREATE TABLE IF NOT EXISTS agent_totals (
+    agent_name TEXT PRIMARY KEY,
+    total_nectar REAL NOT NULL DEFAULT 0,
+    total_hours REAL NOT NULL DEFAULT 0,
+    tasks_completed INTEGER NOT NULL DEFAULT 0,
+    quality_avg REAL NOT NULL DEFAULT 0,
+    last_accrual TEXT NOT NULL DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS ledger_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+RECORD_COLUMNS = (
+    "agent_name", "task_id", "task_title", "repo", "hours_worked",
+    "base_rate", "quality_multiplier", "nectar_accrued", "timestamp",
+    "blockchain_eligible", "stolen_from"
+)
+
+INSERT_ACCRUAL = (
+    f"INSERT INTO accruals ({', '.join(RECORD_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in RECORD_COLUMNS)})"
+)
+
+HISTORY_PAGE_SIZE = 1000
+
+UPSERT_TOTALS = """
+INSERT INTO agent_totals
+    (agent_name, total_nectar, total_hours, tasks_completed, quality_avg, last_accrual)
+VALUES (?, ?, ?, 1, ?, ?)
+ON CONFLICT (agent_name) DO UPDATE SET
+    total_nectar = total_nectar + excluded.total_nectar,
+    total_hours = total_hours + excluded.total_hours,
+    quality_avg = (quality_avg * tasks_completed + excluded.quality_avg) / (tasks_completed + 1),
+    tasks_completed = tasks_completed + 1,
+    last_accrual = excluded.last_accrual
+"""
+
+
+class SQLiteLedgerStore(LedgerStore):
+    """
+    LedgerStore backed by SQLite in WAL mode.
+
+    Same public interface as LedgerStore; nothing but the materialized
+    totals table is consulted for summaries, and history queries go
+    through the accruals indexes.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, ledger_path: str = DEFAULT_LEDGER_PATH):
+        self.ledger_path = Path(ledger_path)
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.ledger_path.with_suffix(".db")
+
+        # History is not held in memory for this backend
+        self.records: List[NectarAccrualRecord] = []
+        self.journal = None
+
+        self._lock = threading.RLock()
+        self.writer = None  # GroupCommitWriter, when enabled
+        self.archive = None  # ColumnarArchive, when attached
+        self.merkle = None  # MerkleLog, when attached
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None  # Explicit transactions below
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._add_missing_columns()
+
+        self._migrate_legacy_file()
+
+        logger.info(f"📊 SQLiteLedgerStore opened: {self.db_path}")
+
+    def append_batch(
+        self,
+        records: List[NectarAccrualRecord],
+        sync: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Insert records and update materialized totals in one transaction.
+
+        Args:
+            records: Records in order
+            sync: Commit with synchronous=FULL so the batch is durable
+
+        Returns:
+            Snapshot of the agent's totals after each record
+        """
+        with self._lock:
+            if sync:
+                self._conn.execute("PRAGMA synchronous=FULL")
+            merkle_size = self.merkle.size if self.merkle is not None else None
+            try:
+                results = []
+                with self._transaction() as conn:
+                    for record in records:
+                        self._insert(conn, record)
+                        row = conn.execute(
+                            "SELECT * FROM agent_totals WHERE agent_name = ?",
+                            (record.agent_name,)
+                        ).fetchone()
+                        results.append(self._totals_from_row(row))
+                    if self.merkle is not None:
+                        # Leaves are written before COMMIT; extras are dropped on attach
+                        self._append_merkle(records, results, sync)
+                return results
+            except BaseException:
+                if merkle_size is not None:
+                    # Rolled back: drop leaves for records that never committed
+                    self.merkle.truncate(merkle_size)
+                raise
+            finally:
+                if sync:
+                    self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    @property
+    def totals(self) -> Dict[str, Dict[str, Any]]:
+        """All per-agent totals from the materialized table"""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM agent_totals").fetchall()
+        return {row["agent_name"]: self._totals_from_row(row) for row in rows}
+
+    def all_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Get every agent's totals"""
+        return self.totals
+
+    @property
+    def record_count(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM accruals").fetchone()
+        return row[0] or 0
+
+    def get_totals(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Get an agent's totals (None if no accruals)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM agent_totals WHERE agent_name = ?", (agent_name,)
+            ).fetchone()
+        return self._totals_from_row(row) if row else None
+
+    def get_recent(self, agent_name: str) -> List[NectarAccrualRecord]:
+        """Get an agent's most recent accruals, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM accruals WHERE agent_name = ? "
+                "ORDER BY timestamp DESC, seq DESC LIMIT ?",
+                (agent_name, self.RECENT_WINDOW)
+            ).fetchall()
+        return [self._record_from_row(row) for row in reversed(rows)]
+
+    def query_records(
+        self,
+        agent_name: Optional[str] = None,
+        repo: Optional[str] = None,
+        task_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[NectarAccrualRecord]:
+        """
+        Indexed lookup of accrual records.
+
+        Args:
+            agent_name: Filter by agent
+            repo: Filter by repo
+            task_id: Filter by task
+            since: ISO timestamp lower bound (inclusive)
+            until: ISO timestamp upper bound (exclusive)
+            limit: Maximum records to return
+
+        Returns:
+            Matching records in append order
+        """
+        clauses, params = self._filters(agent_name, repo, task_id, since, until)
+
+        sql = "SELECT * FROM accruals"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._record_from_row(row) for row in rows]
+
+    @staticmethod
+    def _filters(
+        agent_name: Optional[str],
+        repo: Optional[str],
+        task_id: Optional[str],
+        since: Optional[str],
+        until: Optional[str]
+    ) -> Tuple[List[str], List[Any]]:
+        """WHERE clauses and parameters for record filters"""
+        clauses, params = [], []
+        for column, value in (("agent_name", agent_name), ("repo", repo), ("task_id", task_id)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        return clauses, params
+
+    def pending_compaction(self) -> int:
+        """WAL frames are checkpointed on every compaction pass"""
+        return 1
+
+    def compact(self) -> Dict[str, Any]:
+        """Checkpoint and truncate the WAL so reopening stays cheap"""
+        with self._lock:
+            busy, log_frames, checkpointed = self._conn.execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+            archived_rows = self._archive_backfill() if self.archive is not None else 0
+        return {
+            "status": "compacted" if not busy else "busy",
+            "record_count": self.record_count,
+            "wal_frames_checkpointed": checkpointed,
+            "columnar_rows": archived_rows
+        }
+
+    def iter_records(
+        self,
+        after_seq: int = 0,
+        agent_name: Optional[str] = None,
+        repo: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Iterator[Tuple[int, NectarAccrualRecord]]:
+        """Lazily yield (seq, record) pairs, fetched in indexed pages"""
+        clauses, params = self._filters(agent_name, repo, None, since, until)
+        sql = "SELECT * FROM accruals WHERE " + " AND ".join(["seq > ?"] + clauses)
+        sql += " ORDER BY seq LIMIT ?"
+
+        seq = after_seq
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, [seq] + params + [HISTORY_PAGE_SIZE]).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row["seq"], self._record_from_row(row)
+            seq = rows[-1]["seq"]
+
+    def _archive_backfill(self) -> int:
+        """Copy accruals past the archive's row count into the archive (seq order)"""
+        return self.archive.append(self._records_after(self.archive.rows))
+
+    def _analytics_tail(self) -> List[NectarAccrualRecord]:
+        """Accruals not yet copied into the columnar archive"""
+        return self._records_after(self.archive.rows)
+
+    def _records_after(self, seq: int) -> List[NectarAccrualRecord]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM accruals WHERE seq > ? ORDER BY seq", (seq,)
+            ).fetchall()
+        return [self._record_from_row(row) for row in rows]
+
+    def close(self):
+        """Flush queued records and close the database connection"""
+        self.stop_group_commit()
+        with self._lock:
+            if self.merkle is not None:
+                self.merkle.close()
+            self._conn.close()
+        self._forget()
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, record: NectarAccrualRecord):
+        conn.execute(INSERT_ACCRUAL, (
+            record.agent_name, record.task_id, record.task_title, record.repo,
+            record.hours_worked, record.base_rate, record.quality_multiplier,
+            record.nectar_accrued, record.timestamp, int(record.blockchain_eligible),
+            record.stolen_from
+        ))
+        conn.execute(UPSERT_TOTALS, (
+            record.agent_name, record.nectar_accrued, record.hours_worked,
+            record.quality_multiplier, record.timestamp
+        ))
+
+    @staticmethod
+    def _totals_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            "total_nectar": row["total_nectar"],
+            "total_hours": row["total_hours"],
+            "tasks_completed": row["tasks_completed"],
+            "quality_avg": row["quality_avg"],
+            "last_accrual": row["last_accrual"]
+        }
+
+    @staticmethod
+    def _record_from_row(row: sqlite3.Row) -> NectarAccrualRecord:
+        return NectarAccrualRecord(
+            agent_name=row["agent_name"],
+            task_id=row["task_id"],
+            task_title=row["task_title"],
+            repo=row["repo"],
+            hours_worked=row["hours_worked"],
+            base_rate=row["base_rate"],
+            quality_multiplier=row["quality_multiplier"],
+            nectar_accrued=row["nectar_accrued"],
+            timestamp=row["timestamp"],
+            blockchain_eligible=bool(row["blockchain_eligible"]),
+            stolen_from=row["stolen_from"]
+        )
+
+    def _add_missing_columns(self):
+        """Bring databases created before a column existed up to SCHEMA"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(accruals)")}
+        if "stolen_from" not in columns:
+            try:
+                self._conn.execute("ALTER TABLE accruals ADD COLUMN stolen_from TEXT")
+            except sqlite3.OperationalError as e:
+                if "duplicate column" not in str(e):
+                    raise  # Otherwise another process added it first
+
+    def _migrate_legacy_file(self):
+        """Import an existing JSON ledger the first time the database is created"""
+        version = self._conn.execute(
+            "SELECT value FROM ledger_meta WHERE key = 'version'"
+        ).fetchone()
+        if version is not None:
+            return
+
+        records: List[NectarAccrualRecord] = []
+        if self.ledger_path.exists():
+            try:
+                with open(self.ledger_path, 'r') as f:
+                    records = migrate_ledger_data(json.load(f))
+            except Exception as e:
+                logger.error(f"Failed to read legacy ledger for migration: {e}")
+                records = []
+
+        with self._transaction() as conn:
+            # Another process opening the same database may have migrated first
+            if conn.execute("SELECT 1 FROM ledger_meta WHERE key = 'version'").fetchone():
+                return
+            for record in records:
+                self._insert(conn, record)
+            conn.execute(
+                "INSERT INTO ledger_meta (key, value) VALUES ('version', ?)",
+                (str(LEDGER_FORMAT_VERSION),)
+            )
+
+        if records:
+            logger.info(f"Migrated {len(records)} accrual records into SQLite ledger")
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK context manager"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
@@ -0,0 +1,1031 @@
+"""
+Ledger Store - Single storage engine for NECTAR accrual records
+
+Both HexAgent and DiligenceLedger write through one LedgerStore per ledger
+path, so every completion is indexed once and persisted once.
+
+On-disk format (version 2):
+    {"version": 2, "records": [...], "totals": {...}, "last_updated": "..."}
+
+Legacy layouts are migrated on load:
+- DiligenceLedger v1: {"records": [...], "totals": {...}}
+- HexAgent v1:        {"ledger": {...}, "history": [...]}
+
+Backends (see LedgerStore.shared):
+- "json":   in-memory index, full-file or journaled persistence
+- "sqlite": indexed on-disk history (ledger_sqlite.SQLiteLedgerStore)
+
+Writes go through LedgerStore.submit(); with group commit enabled
+(start_group_commit) concurrent accruals are batched into one durable
+write by ledger_writer.GroupCommitWriter.
+
+Analytics and summaries over long histories use an optional columnar
+archive (attach_columnar_archive, ledger_columnar.ColumnarArchive) that
+compaction keeps up to date with archived history.
+
+Genesis snapshots are committed to by an optional incremental Merkle
+tree over every accrual (attach_merkle_log, ledger_merkle.MerkleLog).
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Any, Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .ledger_journal import LedgerJournal
+
+try:
+    import fcntl
+except ImportError:  # No advisory file locks (Windows)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+LEDGER_FORMAT_VERSION = 2
+DEFAULT_LEDGER_PATH = "./data/diligence_ledger.json"
+
+
+class LedgerLockedError(RuntimeError):
+    """Raised when a json ledger is already open in another process"""
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_timestamp(timestamp: str) -> Union[int, str]:
+    """
+    Naive ISO timestamp (as written by the ledger) to epoch microseconds.
+
+    Anything that would not round-trip to the exact same string (offsets,
+    other formats) is kept as the string itself.
+    """
+    try:
+        micros = (datetime.fromisoformat(timestamp) - _EPOCH) // _MICROSECOND
+    except (TypeError, ValueError):
+        return timestamp
+    return micros if _decode_timestamp(micros) == timestamp else timestamp
+
+
+def _decode_timestamp(value: Union[int, str]) -> str:
+    if isinstance(value, str):
+        return value
+    return (_EPOCH + timedelta(microseconds=value)).isoformat()
+
+
+class NectarAccrualRecord:
+    """
+    Single NECTAR accrual record
+
+    Compact in-memory form: slotted (no per-instance __dict__), agent,
+    repo and stolen_from strings interned (a handful of distinct values;
+    task titles are free text and are not), and the timestamp held as
+    integer epoch microseconds. The `timestamp` attribute still reads and writes the ISO string, and
+    to_dict() gives the on-disk/API dict shape.
+
+    stolen_from names the agent a task was planned for when a hex
+    neighbor stole and completed it; it only appears in to_dict() when
+    set, so records (and their Merkle leaves) without it are unchanged.
+    """
+
+    __slots__ = (
+        "agent_name", "task_id", "task_title", "repo", "hours_worked",
+        "base_rate", "quality_multiplier", "nectar_accrued", "_timestamp",
+        "blockchain_eligible", "stolen_from"
+    )
+
+    FIELDS = (
+        "agent_name", "task_id", "task_title", "repo", "hours_worked",
+        "base_rate", "quality_multiplier", "nectar_accrued", "timestamp",
+        "blockchain_eligible"
+    )
+
+    def __init__(
+        self,
+        agent_name: str,
+        task_id: str,
+        task_title: str,
+        repo: str,
+        hours_worked: float,
+        base_rate: float,
+        quality_multiplier: float,
+        nectar_accrued: float,
+        timestamp: str,
+        blockchain_eligible: bool = True,
+        stolen_from: Optional[str] = None
+    ):
+        self.agent_name = sys.intern(agent_name)
+        self.task_id = task_id
+        self.task_title = task_title
+        self.repo = sys.intern(repo)
+        self.hours_worked = hours_worked
+        self.base_rate = base_rate
+        self.quality_multiplier = quality_multiplier
+        self.nectar_accrued = nectar_accrued
+        self._timestamp = _encode_timestamp(timestamp)
+        self.blockchain_eligible = blockchain_eligible
+        self.stolen_from = sys.intern(stolen_from) if stolen_from else None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp (naive UTC)"""
+        return _decode_timestamp(self._timestamp)
+
+    @timestamp.setter
+    def timestamp(self, value: str):
+        self._timestamp = _encode_timestamp(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Record as the plain dict stored on disk and returned by the API"""
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        if self.stolen_from:
+            data["stolen_from"] = self.stolen_from
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NectarAccrualRecord):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"NectarAccrualRecord({fields})"
+
+
+def migrate_ledger_data(data: Dict[str, Any]) -> List[NectarAccrualRecord]:
+    """
+    Extract accrual records from any known on-disk ledger layout.
+
+    Totals are always rebuilt from the records, so a file last written by
+    either legacy writer produces the same index.
+
+    Returns:
+        Records in append order
+    """
+    version = data.get("version")
+
+    if version == LEDGER_FORMAT_VERSION:
+        raw = data.get("records", [])
+    elif version is not None:
+        raise ValueError(f"Unsupported ledger format version: {version}")
+    elif "history" in data or "ledger" in data:
+        # HexAgent v1 layout
+        raw = data.get("history", [])
+        logger.info(f"Migrating HexAgent ledger layout ({len(raw)} records)")
+    else:
+        # DiligenceLedger v1 layout
+        raw = data.get("records", [])
+        logger.info(f"Migrating DiligenceLedger layout ({len(raw)} records)")
+
+    return [
+        NectarAccrualRecord(
+            agent_name=r["agent_name"],
+            task_id=r["task_id"],
+            task_title=r["task_title"],
+            repo=r.get("repo", ""),
+            hours_worked=r["hours_worked"],
+            base_rate=r.get("base_rate", 10.0),
+            quality_multiplier=r.get("quality_multiplier", 1.0),
+            nectar_accrued=r["nectar_accrued"],
+            timestamp=r["timestamp"],
+            blockchain_eligible=r.get("blockchain_eligible", True),
+            stolen_from=r.get("stolen_from")
+        )
+        for r in raw
+    ]
+
+
+class LedgerStore:
+    """
+    Storage engine shared by every ledger writer for a given path.
+
+    Maintains a single in-memory index (per-agent totals and recent
+    windows) and a single write path. Persistence is either the
+    versioned full-file JSON document or the append-only journal.
+
+    Use LedgerStore.shared() so writers opening the same path share
+    one instance instead of clobbering each other's files.
+    """
+
+    RECENT_WINDOW = 10  # Accruals kept per agent for summaries
+    backend = "json"
+
+    _instances: Dict[Path, 'LedgerStore'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        ledger_path: str = DEFAULT_LEDGER_PATH,
+        journaled: bool = False,
+        checkpoint_interval: int = 500
+    ):
+        self.ledger_path = Path(ledger_path)
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # In-memory index
+        self.records: List[NectarAccrualRecord] = []
+        self.totals: Dict[str, Dict[str, Any]] = {}
+        self.recent: Dict[str, Deque[NectarAccrualRecord]] = {}
+        self.record_count = 0
+
+        # Journaled storage (append-only log + checkpoints)
+        self.journal: Optional[LedgerJournal] = (
+            LedgerJournal(self.ledger_path, checkpoint_interval) if journaled else None
+        )
+
+        self._lock = threading.RLock()
+        self.writer = None  # GroupCommitWriter, when enabled
+        self.archive = None  # ColumnarArchive, when attached
+        self.merkle = None  # MerkleLog, when attached
+        self._source_counts: Dict[str, int] = {}  # Immutable history source -> records
+
+        self._lock_file = self._claim_ledger_file()
+        self._load()
+
+        logger.info(f"📊 LedgerStore opened: {self.ledger_path}")
+
+    def _claim_ledger_file(self):
+        """
+        Hold an exclusive lock on <ledger>.lock for this process's lifetime.
+
+        The json backend rewrites the whole file from its in-memory index,
+        so a second process (e.g. another uvicorn worker) would silently
+        clobber accruals. Multiple workers need the sqlite backend, which
+        COUNCIL_SHARED_STATE selects.
+        """
+        if fcntl is None:
+            return None
+        lock_file = open(self.ledger_path.with_suffix(".lock"), "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise LedgerLockedError(
+                f"Ledger {self.ledger_path} is open in another process; "
+                f"run multiple workers with COUNCIL_SHARED_STATE (sqlite ledger)"
+            )
+        return lock_file
+
+    @classmethod
+    def shared(
+        cls,
+        ledger_path: str = DEFAULT_LEDGER_PATH,
+        journaled: Optional[bool] = None,
+        checkpoint_interval: int = 500,
+        backend: Optional[str] = None
+    ) -> 'LedgerStore':
+        """
+        Get the store for a ledger path, opening it on first use.
+
+        Options left as None accept whatever store is already open.
+        The first opener's options win; later openers asking for
+        different options get the existing store and a warning.
+
+        Args:
+            ledger_path: Ledger file path (the sqlite backend stores <path>.db)
+            journaled: Use the append-only journal (json backend only)
+            checkpoint_interval: Records between journal checkpoints
+            backend: "json" (default) or "sqlite"
+        """
+        key = Path(ledger_path).resolve()
+
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                backend = backend or "json"
+                if backend == "sqlite":
+                    from .ledger_sqlite import SQLiteLedgerStore
+                    store = SQLiteLedgerStore(ledger_path)
+                elif backend == "json":
+                    store = LedgerStore(ledger_path, bool(journaled), checkpoint_interval)
+                else:
+                    raise ValueError(f"Unknown ledger backend: {backend}")
+                cls._instances[key] = store
+            elif (
+                (backend is not None and backend != store.backend) or
+                (journaled is not None and journaled != (store.journal is not None))
+            ):
+                logger.warning(
+                    f"LedgerStore for {ledger_path} already open "
+                    f"(backend={store.backend}, journaled={store.journal is not None}) - reusing"
+                )
+            return store
+
+    def append(self, record: NectarAccrualRecord) -> Dict[str, Any]:
+        """
+        Append an accrual record immediately.
+
+        Returns:
+            The agent's updated totals
+
+        Raises:
+            OSError (or sqlite3.Error): The record could not be persisted;
+                it is not counted in the totals
+        """
+        with self._lock:
+            return self.append_batch([record])[0]
+
+    def append_batch(
+        self,
+        records: List[NectarAccrualRecord],
+        sync: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Append several accrual records with a single write.
+
+        All or nothing: if the write fails, in-memory totals, records and
+        Merkle leaves are rolled back to what is on disk.
+
+        Args:
+            records: Records in order
+            sync: fsync before returning so the batch is durable
+
+        Returns:
+            Snapshot of the agent's totals after each record
+
+        Raises:
+            OSError: If the batch could not be persisted
+        """
+        with self._lock:
+            rollback = self._rollback_point({record.agent_name for record in records})
+            try:
+                results = []
+                for record in records:
+                    self._apply(record)
+                    self.records.append(record)
+                    results.append(dict(self.totals[record.agent_name]))
+
+                if self.merkle is not None:
+                    self._append_merkle(records, results, sync)
+
+                if self.journal:
+                    self.journal.append_many([r.to_dict() for r in records], sync)
+                else:
+                    self._save(sync)
+            except BaseException:
+                self._roll_back(rollback)
+                raise
+
+            if self.journal:
+                self._checkpoint_if_due()
+            return results
+
+    def submit(self, record: NectarAccrualRecord) -> Future:
+        """
+        Submit a record through the single write path.
+
+        Returns:
+            Future resolving to the agent's totals once the record is
+            persisted (durable, when group commit is enabled), or to the
+            persistence error
+        """
+        if self.writer is not None:
+            return self.writer.submit(record)
+
+        future: Future = Future()
+        try:
+            future.set_result(self.append(record))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def start_group_commit(
+        self,
+        max_batch_size: int = 64,
+        max_batch_latency: float = 0.005
+    ):
+        """
+        Route submitted records through a group-commit writer.
+
+        Args:
+            max_batch_size: Flush as soon as this many records are queued
+            max_batch_latency: Seconds the oldest queued record may wait
+        """
+        from .ledger_writer import GroupCommitWriter
+
+        with self._lock:
+            if self.writer is None:
+                self.writer = GroupCommitWriter(self, max_batch_size, max_batch_latency)
+        return self.writer
+
+    def stop_group_commit(self):
+        """Flush queued records and stop the group-commit writer"""
+        with self._lock:
+            writer, self.writer = self.writer, None
+        if writer is not None:
+            writer.close()
+
+    def close(self):
+        """
+        Flush queued records, close file handles and release the ledger lock.
+
+        The store is dropped from LedgerStore.shared(), so the path can be
+        opened again (in this process or another) afterwards.
+        """
+        self.stop_group_commit()
+        with self._lock:
+            if self.journal is not None:
+                self.journal.close()
+            if self.merkle is not None:
+                self.merkle.close()
+            if self._lock_file is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                self._lock_file.close()
+                self._lock_file = None
+        self._forget()
+
+    def _forget(self):
+        """Drop this store from the shared instances"""
+        with LedgerStore._instances_lock:
+            for key, store in list(LedgerStore._instances.items()):
+                if store is self:
+                    del LedgerStore._instances[key]
+
+    def get_totals(self, agent_name: str) -> Optional[Dict[str, Any]]:
+        """Get a copy of an agent's totals (None if no accruals)"""
+        with self._lock:
+            totals = self.totals.get(agent_name)
+            return dict(totals) if totals is not None else None
+
+    def all_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Get a consistent copy of every agent's totals"""
+        with self._lock:
+            return {name: dict(t) for name, t in self.totals.items()}
+
+    def get_recent(self, agent_name: str) -> List[NectarAccrualRecord]:
+        """Get an agent's most recent accruals, oldest first"""
+        with self._lock:
+            return list(self.recent.get(agent_name, ()))
+
+    def pending_compaction(self) -> int:
+        """Records written since the last compaction (or not yet in the columnar archive)"""
+        if self.journal:
+            return self.journal.pending_since_compaction
+        if self.archive is not None:
+            return max(0, len(self.records) - self.archive.rows)
+        return 0
+
+    def compact(self) -> Dict[str, Any]:
+        """
+        Snapshot aggregate state and archive the active journal segment.
+
+        After compaction, startup loads the snapshot and replays only
+        what was written since. Only the journaled backend compacts;
+        the full-file ledger has no log to archive, so it only copies
+        new records into the columnar archive (when attached).
+
+        Returns:
+            Compaction report
+        """
+        if not self.journal:
+            if self.archive is None:
+                return {"status": "skipped", "reason": "ledger is not journaled"}
+            with self._lock:
+                archived_rows = self._archive_backfill()
+            return {
+                "status": "archived",
+                "record_count": self.record_count,
+                "columnar_rows": archived_rows
+            }
+
+        with self._lock:
+            archived = self.journal.rotate(self._checkpoint_state())
+            # Everything in memory is now covered by the snapshot
+            self.records = []
+
+            archived_rows = 0
+            if archived and self.archive is not None:
+                archived_rows = self.archive.ingest_segment(archived)
+
+            return {
+                "status": "compacted",
+                "record_count": self.record_count,
+                "archived_segment": archived.name if archived else None,
+                "segments": len(self.journal.archived_segments()),
+                "columnar_rows": archived_rows
+            }
+
+    def attach_columnar_archive(self):
+        """
+        Open the columnar archive (<ledger>.columns/) for analytics.
+
+        History already archived before the archive existed is ingested
+        now; afterwards each compaction ingests the segment it archives
+        (the full-file ledger copies the records written since).
+
+        Returns:
+            The ColumnarArchive
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        from .ledger_columnar import ColumnarArchive
+
+        with self._lock:
+            if self.archive is None:
+                self.archive = ColumnarArchive(self.ledger_path.with_suffix(".columns"))
+                self._archive_backfill()
+                logger.info(f"📊 Columnar archive attached ({self.archive.rows} rows)")
+            return self.archive
+
+    def analytics(self, bins: int = 10) -> Dict[str, Any]:
+        """
+        Vectorized per-agent, per-repo and per-day totals plus histograms.
+
+        Combines the columnar archive with records not yet archived.
+        """
+        if self.archive is None:
+            return {"status": "unavailable", "reason": "columnar archive not attached"}
+
+        with self._lock:
+            tail = self._analytics_tail()
+
+        report = self.archive.summary(tail, bins)
+        report["archived_rows"] = self.archive.rows
+        return report
+
+    def attach_merkle_log(self):
+        """
+        Open the Merkle log (<ledger>.merkle) committing to every accrual.
+
+        Leaves missing for existing history are hashed now, from the
+        full record history; leaves for records that never committed
+        (crash between the two writes) are dropped.
+
+        Returns:
+            The MerkleLog
+        """
+        from .ledger_merkle import MerkleLog
+
+        with self._lock:
+            if self.merkle is None:
+                merkle = MerkleLog(self.ledger_path.with_suffix(".merkle"))
+                if merkle.size > self.record_count:
+                    merkle.truncate(self.record_count)
+                elif merkle.size < self.record_count:
+                    self._merkle_backfill(merkle)
+                self.merkle = merkle
+                logger.info(f"📊 Merkle log attached ({merkle.size} leaves)")
+            return self.merkle
+
+    def genesis_commitment(self) -> Dict[str, Any]:
+        """
+        Merkle root over all accruals plus, per agent, an inclusion proof
+        of its latest leaf (which commits to the agent's running totals).
+
+        Proofs are O(log n) each; nothing is re-hashed.
+        """
+        from .ledger_merkle import leaf_payload, leaf_hash
+
+        if self.merkle is None:
+            return {"status": "unavailable", "reason": "Merkle log not attached"}
+
+        with self._lock:
+            totals = self.all_totals()
+            leaves: Dict[str, Any] = {}
+            for agent_name, index in self.merkle.latest.items():
+                stored = self.merkle.leaf(index)
+                # The agent's latest leaf is its newest record in the recent window
+                for record in reversed(self.get_recent(agent_name)):
+                    payload = leaf_payload(record, totals[agent_name])
+                    if leaf_hash(payload) == stored:
+                        leaves[agent_name] = (index, payload)
+                        break
+                else:
+                    logger.warning(f"No committed leaf found for {agent_name}'s totals")
+
+            proofs = self.merkle.inclusion_proofs([index for index, _ in leaves.values()])
+            root = self.merkle.root()
+            size = self.merkle.size
+
+        return {
+            "tree_size": size,
+            "root": root.hex(),
+            "hashing": "RFC 6962: leaf=SHA256(0x00||canonical_json(leaf)), node=SHA256(0x01||left||right)",
+            "proofs": {
+                agent_name: {
+                    "leaf_index": index,
+                    "leaf": payload,
+                    "audit_path": [h.hex() for h in proofs[index]]
+                }
+                for agent_name, (index, payload) in leaves.items()
+            }
+        }
+
+    def iter_history(self) -> Iterator[NectarAccrualRecord]:
+        """Yield every accrual record ever appended, in append order"""
+        for _, record in self.iter_records():
+            yield record
+
+    def iter_records(
+        self,
+        after_seq: int = 0,
+        agent_name: Optional[str] = None,
+        repo: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Iterator[Tuple[int, NectarAccrualRecord]]:
+        """
+        Lazily yield (seq, record) pairs in append order.
+
+        seq is the record's 1-based position in the full history and is
+        stable across restarts and compactions, so it doubles as a
+        pagination cursor. Records are streamed from storage one at a
+        time; nothing is materialized up front.
+
+        Args:
+            after_seq: Only records with seq > after_seq
+            agent_name: Filter by agent
+            repo: Filter by repo
+            since: ISO timestamp lower bound (inclusive)
+            until: ISO timestamp upper bound (exclusive)
+        """
+        for seq, record in self._iter_from(after_seq):
+            if agent_name is not None and record.agent_name != agent_name:
+                continue
+            if repo is not None and record.repo != repo:
+                continue
+            if since is not None and record.timestamp < since:
+                continue
+            if until is not None and record.timestamp >= until:
+                continue
+            yield seq, record
+
+    def page_records(
+        self,
+        cursor: int = 0,
+        limit: int = 100,
+        **filters: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        One page of records after a cursor.
+
+        Returns:
+            {"records": [...], "next_cursor": seq to resume after, or None}
+        """
+        page = list(islice(self.iter_records(cursor, **filters), limit + 1))
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        return {
+            "records": [dict(record.to_dict(), seq=seq) for seq, record in page],
+            "next_cursor": page[-1][0] if has_more else None
+        }
+
+    def _iter_from(self, after_seq: int) -> Iterator[Tuple[int, NectarAccrualRecord]]:
+        """(seq, record) pairs after a seq, straight from storage"""
+        if not self.journal:
+            # Full-file ledger: every record is in memory, seq = index + 1
+            seq = after_seq
+            while True:
+                with self._lock:
+                    if seq >= len(self.records):
+                        return
+                    record = self.records[seq]
+                seq += 1
+                yield seq, record
+
+        # Journaled: adopted full-file ledger, archived segments, active journal.
+        # Whole sources before the cursor are skipped using cached record counts.
+        with self._lock:
+            segments = self.journal.archived_segments()
+            active = self.journal.iter_active()  # Opened now, before any rotation
+
+        base = 0
+        count = self._source_count("legacy", lambda: len(self._legacy_records()))
+        if base + count > after_seq:
+            yield from self._numbered(self._legacy_records(), base, after_seq)
+        base += count
+
+        for segment in segments:
+            count = self._source_count(
+                segment.name, lambda: sum(1 for _ in self.journal.iter_segment(segment))
+            )
+            if base + count > after_seq:
+                yield from self._numbered(
+                    (NectarAccrualRecord(**r) for r in self.journal.iter_segment(segment)),
+                    base, after_seq
+                )
+            base += count
+
+        yield from self._numbered(
+            (NectarAccrualRecord(**r) for r in active), base, after_seq
+        )
+
+    def _source_count(self, key: str, count: Callable[[], int]) -> int:
+        """Record count of an immutable history source (cached)"""
+        if key not in self._source_counts:
+            self._source_counts[key] = count()
+        return self._source_counts[key]
+
+    @staticmethod
+    def _numbered(
+        records: Iterable[NectarAccrualRecord],
+        base: int,
+        after_seq: int
+    ) -> Iterator[Tuple[int, NectarAccrualRecord]]:
+        """Number records from base + 1, skipping seqs up to after_seq"""
+        skip = max(0, after_seq - base)
+        return enumerate(islice(records, skip, None), base + skip + 1)
+
+    def _append_merkle(
+        self,
+        records: List[NectarAccrualRecord],
+        results: List[Dict[str, Any]],
+        sync: bool = False
+    ):
+        """Add one Merkle leaf per record, committing to its running totals"""
+        from .ledger_merkle import leaf_payload, leaf_hash
+
+        self.merkle.append_many([
+            (leaf_hash(leaf_payload(record, totals)), record.agent_name)
+            for record, totals in zip(records, results)
+        ], sync)
+
+    def _merkle_backfill(self, merkle):
+        """Hash leaves for history appended before the Merkle log existed"""
+        from .ledger_merkle import leaf_payload, leaf_hash
+
+        running: Dict[str, Dict[str, Any]] = {}
+        pending = []
+        index = 0
+        for record in self.iter_history():
+            totals = running.setdefault(record.agent_name, self._empty_totals())
+            totals["total_nectar"] += record.nectar_accrued
+            totals["total_hours"] += record.hours_worked
+            totals["tasks_completed"] += 1
+
+            if index >= merkle.size:
+                pending.append((leaf_hash(leaf_payload(record, totals)), record.agent_name))
+            index += 1
+
+        if index != self.record_count:
+            logger.warning(
+                f"Ledger history has {index} records but the index counts "
+                f"{self.record_count} - Merkle log may not match totals"
+            )
+
+        merkle.append_many(pending, sync=True)
+        logger.info(f"Hashed {len(pending)} existing records into the Merkle log")
+
+    def _legacy_records(self) -> List[NectarAccrualRecord]:
+        """Records adopted from the full-file ledger by a journaled store"""
+        if not self.journal or not self.ledger_path.exists():
+            return []
+        try:
+            with open(self.ledger_path, 'r') as f:
+                return migrate_ledger_data(json.load(f))
+        except Exception as e:
+            logger.error(f"Failed to read adopted full-file ledger: {e}")
+            return []
+
+    def _archive_backfill(self) -> int:
+        """Ingest history that is not in the archive yet"""
+        if not self.journal:
+            # Full-file ledger: every record is in memory, in seq order
+            if self.archive.rows > len(self.records):
+                logger.warning(
+                    f"Columnar archive has {self.archive.rows} rows but the ledger "
+                    f"holds {len(self.records)} records - analytics may not match totals"
+                )
+                return 0
+            return self.archive.append(self.records[self.archive.rows:])
+
+        # Records adopted from the full-file ledger never went through a segment
+        appended = 0
+        legacy = self._legacy_records()
+        if legacy:
+            appended += self.archive.ingest(f"legacy:{self.ledger_path.name}", legacy)
+
+        for segment in self.journal.archived_segments():
+            appended += self.archive.ingest_segment(segment)
+        return appended
+
+    def _analytics_tail(self) -> List[NectarAccrualRecord]:
+        """Records not yet in the columnar archive"""
+        if not self.journal:
+            return self.records[self.archive.rows:]
+        # The active journal holds everything since the last compaction
+        return [NectarAccrualRecord(**r) for r in self.journal.iter_active()]
+
+    def query_records(
+        self,
+        agent_name: Optional[str] = None,
+        repo: Optional[str] = None,
+        task_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[NectarAccrualRecord]:
+        """
+        Filter the records held in memory.
+
+        Linear scan; in journaled mode only the tail since the last
+        checkpoint is in memory. Use the sqlite backend for indexed
+        queries over the full history.
+        """
+        matches = []
+        for r in self.records:
+            if agent_name is not None and r.agent_name != agent_name:
+                continue
+            if repo is not None and r.repo != repo:
+                continue
+            if task_id is not None and r.task_id != task_id:
+                continue
+            if since is not None and r.timestamp < since:
+                continue
+            if until is not None and r.timestamp >= until:
+                continue
+            matches.append(r)
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+    def _apply(self, record: NectarAccrualRecord):
+        """Fold a record into totals and the per-agent recent window"""
+        totals = self.totals.get(record.agent_name)
+        if totals is None:
+            totals = self._empty_totals()
+            self.totals[record.agent_name] = totals
+
+        totals["total_nectar"] += record.nectar_accrued
+        totals["total_hours"] += record.hours_worked
+        totals["tasks_completed"] += 1
+        totals["last_accrual"] = record.timestamp
+
+        # Running quality average
+        count = totals["tasks_completed"]
+        totals["quality_avg"] = (
+            (totals["quality_avg"] * (count - 1) + record.quality_multiplier) / count
+        )
+
+        self._remember(record)
+        self.record_count += 1
+
+    def _remember(self, record: NectarAccrualRecord):
+        """Push a record into its agent's recent window"""
+        window = self.recent.get(record.agent_name)
+        if window is None:
+            window = deque(maxlen=self.RECENT_WINDOW)
+            self.recent[record.agent_name] = window
+        window.append(record)
+
+    @staticmethod
+    def _empty_totals() -> Dict[str, Any]:
+        return {
+            "total_nectar": 0.0,
+            "total_hours": 0.0,
+            "tasks_completed": 0,
+            "quality_avg": 0.0,
+            "last_accrual": ""
+        }
+
+    def _reset(self):
+        self.records = []
+        self.totals = {}
+        self.recent = {}
+        self.record_count = 0
+
+    def _load(self):
+        """Load ledger from disk"""
+        if self.journal:
+            self._load_journal()
+        elif self.ledger_path.exists():
+            self._load_full_file()
+
+    def _load_full_file(self):
+        """Load (and migrate) the full-file JSON ledger"""
+        try:
+            with open(self.ledger_path, 'r') as f:
+                data = json.load(f)
+
+            self._reset()
+            for record in migrate_ledger_data(data):
+                self.records.append(record)
+                self._apply(record)
+
+            logger.info(f"Loaded {len(self.records)} accrual records")
+        except Exception as e:
+            logger.error(f"Failed to load ledger: {e}")
+            self._reset()
+
+    def _load_journal(self):
+        """Load latest checkpoint and replay the journal tail"""
+        if not self.journal.exists() and self.ledger_path.exists():
+            # First journaled start - adopt the full-file ledger as checkpoint
+            self._load_full_file()
+            self.records = []
+            self.journal.checkpoint(self._checkpoint_state())
+            logger.info(f"Migrated {self.record_count} records into journal checkpoint")
+            return
+
+        try:
+            checkpoint, tail = self.journal.load()
+        except Exception as e:
+            logger.error(f"Failed to load ledger journal: {e}")
+            return
+
+        if checkpoint:
+            for agent_name, totals in checkpoint.get("totals", {}).items():
+                merged = self._empty_totals()
+                merged.update(totals)
+                self.totals[agent_name] = merged
+            self.record_count = checkpoint.get("record_count", 0)
+            for window in checkpoint.get("recent", {}).values():
+                for r in window:
+                    self._remember(NectarAccrualRecord(**r))
+
+        self.records = [NectarAccrualRecord(**r) for r in tail]
+        for record in self.records:
+            self._apply(record)
+
+        logger.info(
+            f"Loaded ledger checkpoint ({self.record_count} records), "
+            f"replayed {len(tail)} journal entries"
+        )
+
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        """Aggregate state captured by a journal checkpoint / snapshot"""
+        return {
+            "version": LEDGER_FORMAT_VERSION,
+            "totals": self.totals,
+            "genesis_allocations": {
+                name: {
+                    "amount": round(t["total_nectar"], 2),
+                    "hours_contributed": round(t["total_hours"], 2),
+                    "tasks_completed": int(t["tasks_completed"])
+                }
+                for name, t in self.totals.items()
+            },
+            "recent": {
+                name: [r.to_dict() for r in window]
+                for name, window in self.recent.items()
+            },
+            "record_count": self.record_count
+        }
+
+    def _checkpoint_if_due(self):
+        """Checkpoint every N journaled records (a failure is retried next time)"""
+        if not self.journal.needs_checkpoint():
+            return
+        try:
+            self.journal.checkpoint(self._checkpoint_state())
+        except OSError as e:
+            logger.error(f"Ledger checkpoint failed (journal still complete): {e}")
+            return
+        # Tail is now covered by the checkpoint
+        self.records = []
+
+    def _rollback_point(self, agent_names: Set[str]) -> Dict[str, Any]:
+        """In-memory state an append may change, for _roll_back"""
+        return {
+            "records": len(self.records),
+            "record_count": self.record_count,
+            "totals": {name: dict(self.totals[name]) for name in agent_names if name in self.totals},
+            "recent": {name: list(self.recent[name]) for name in agent_names if name in self.recent},
+            "agents": agent_names,
+            "merkle": self.merkle.size if self.merkle is not None else None
+        }
+
+    def _roll_back(self, point: Dict[str, Any]):
+        """Undo a failed append: memory and Merkle log match the disk again"""
+        del self.records[point["records"]:]
+        self.record_count = point["record_count"]
+        for name in point["agents"]:
+            if name in point["totals"]:
+                self.totals[name] = point["totals"][name]
+            else:
+                self.totals.pop(name, None)
+            if name in point["recent"]:
+                self.recent[name] = deque(point["recent"][name], maxlen=self.RECENT_WINDOW)
+            else:
+                self.recent.pop(name, None)
+        if self.merkle is not None and point["merkle"] is not None:
+            self.merkle.truncate(point["merkle"])
+        logger.error("Ledger append failed; in-memory state rolled back")
+
+    def _save(self, sync: bool = False):
+        """Save the versioned full-file ledger"""
+        data = {
+            "version": LEDGER_FORMAT_VERSION,
+            "records": [r.to_dict() for r in self.records],
+            "totals": self.totals,
+            "last_updated": datetime.utcnow().isoformat()
+        }
+
+        # Written aside and swapped in, so a failed write leaves the old file intact
+        tmp_path = self.ledger_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.ledger_path)
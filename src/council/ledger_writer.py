@@ -0,0 +1,167 @@
+"""
+Group-Commit Ledger Writer
+
+Batches concurrent NECTAR accruals into a single durable write.
+
+Submitted records queue in memory; a dedicated writer thread flushes
+them together when the batch is full or when the oldest record has
+waited max_batch_latency seconds. Each submitter's future resolves only
+after its batch has been fsynced, so throughput scales with concurrency
+instead of being capped by one disk round-trip per record.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Dict, Any, Deque, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitWriter:
+    """
+    Writer thread that group-commits records into a LedgerStore.
+
+    Records are flushed in submission order, so totals returned to each
+    submitter match what a sequential writer would have produced.
+    """
+
+    def __init__(
+        self,
+        store: Any,  # LedgerStore
+        max_batch_size: int = 64,
+        max_batch_latency: float = 0.005
+    ):
+        self.store = store
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_batch_latency = max(0.0, max_batch_latency)
+
+        self._cond = threading.Condition()
+        self._pending: Deque[Tuple[float, Any, Future]] = deque()  # (enqueued_at, record, future)
+        self._closed = False
+
+        # Metrics
+        self.batches_flushed = 0
+        self.records_flushed = 0
+        self.last_batch_size = 0
+        self.largest_batch_size = 0
+        self.last_flush_ms = 0.0
+        self.batch_size_histogram: Dict[str, int] = {}
+
+        self._thread = threading.Thread(
+            target=self._run,
+            name="ledger-group-commit",
+            daemon=True
+        )
+        self._thread.start()
+
+        logger.info(
+            f"📊 Group commit enabled: batch<={self.max_batch_size}, "
+            f"latency<={self.max_batch_latency * 1000:.1f}ms"
+        )
+
+    def submit(self, record: Any) -> Future:
+        """
+        Queue a record for the next group commit.
+
+        Returns:
+            Future resolving to the agent's totals once the batch is durable
+        """
+        future: Future = Future()
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Group-commit writer is closed")
+
+            self._pending.append((time.monotonic(), record, future))
+
+            # Wake the writer to start the latency timer or flush a full batch
+            if len(self._pending) == 1 or len(self._pending) >= self.max_batch_size:
+                self._cond.notify()
+
+        return future
+
+    def close(self):
+        """Flush everything queued and stop the writer thread"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Batching metrics"""
+        with self._cond:
+            queued = len(self._pending)
+
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_batch_latency_ms": round(self.max_batch_latency * 1000, 2),
+            "queued": queued,
+            "batches_flushed": self.batches_flushed,
+            "records_flushed": self.records_flushed,
+            "last_batch_size": self.last_batch_size,
+            "largest_batch_size": self.largest_batch_size,
+            "average_batch_size": round(
+                self.records_flushed / self.batches_flushed, 2
+            ) if self.batches_flushed else 0.0,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "batch_size_histogram": dict(self.batch_size_histogram)
+        }
+
+    def _run(self):
+        """Writer loop: collect a batch, flush it, repeat"""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+
+                if not self._pending:
+                    return  # Closed and drained
+
+                # Hold the batch open until it fills or the oldest record is due;
+                # leftovers from a full batch keep their own enqueue times
+                deadline = self._pending[0][0] + self.max_batch_latency
+                while len(self._pending) < self.max_batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = [
+                    self._pending.popleft()[1:]
+                    for _ in range(min(self.max_batch_size, len(self._pending)))
+                ]
+
+            self._flush(batch)
+
+    def _flush(self, batch: List[Tuple[Any, Future]]):
+        """Durably write one batch and resolve its futures"""
+        started = time.perf_counter()
+
+        try:
+            results = self.store.append_batch([record for record, _ in batch], sync=True)
+        except Exception as e:
+            logger.error(f"Group commit of {len(batch)} records failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        self._record_batch(len(batch))
+
+        for (_, future), totals in zip(batch, results):
+            future.set_result(totals)
+
+    def _record_batch(self, size: int):
+        """Update batch-size metrics"""
+        self.batches_flushed += 1
+        self.records_flushed += size
+        self.last_batch_size = size
+        self.largest_batch_size = max(self.largest_batch_size, size)
+
+        # Power-of-two buckets: "1", "2-3", "4-7", ...
+        low = 1 << (size.bit_length() - 1)
+        bucket = str(low) if low == 1 else f"{low}-{2 * low - 1}"
+        self.batch_size_histogram[bucket] = self.batch_size_histogram.get(bucket, 0) + 1
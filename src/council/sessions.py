@@ -0,0 +1,304 @@
+"""
+Session Registry - Concurrent convening ceremonies in one server
+
+The API used to hold a single CouncilConvening, so briefings from two
+Sofie sessions overwrote each other's briefing and proposal. The
+registry keeps one ceremony per session ID instead:
+
+- Every ceremony is built on the same CouncilResources, so they share
+  the six agents' capacity accounting, the ledger and the execution
+  engine; only ceremony state (briefing, plan, proposal, phase) is
+  per session
+- Requests to one session are serialized by its lock; different
+  sessions run concurrently
+- Proposal IDs are "<session_id>-<n>", so an authorization can be routed
+  by proposal ID alone
+- Idle sessions are evicted least recently used first, past max_sessions
+  or after idle_ttl seconds. Sessions with a request in flight are never
+  evicted
+- Optional persistence: with a session directory, evicted sessions are
+  written as JSON and restored on their next request (the patchable
+  plan is not kept; the next deliberation runs in full)
+- Multi-worker: when the resources carry shared state
+  (COUNCIL_SHARED_STATE), each request holds the session's cross-worker
+  lease, picks up a newer version written by another worker, and stores
+  the ceremony back when done; evicted sessions are reloaded from there
+"""
+
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from .convening import CouncilConvening, CouncilResources, DEFAULT_SESSION
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_SESSIONS = 256
+DEFAULT_IDLE_TTL = 3600.0  # Seconds
+
+SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class UnknownSessionError(KeyError):
+    """Raised when a request names a session that is neither live nor persisted"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(session_id)
+
+
+def validate_session_id(session_id: str) -> str:
+    """Session IDs double as file names, so keep them simple"""
+    if not SESSION_ID_PATTERN.match(session_id) or session_id.startswith("."):
+        raise ValueError(f"Invalid session ID: {session_id!r}")
+    return session_id
+
+
+def session_of_proposal(proposal_id: str) -> Optional[str]:
+    """Session ID encoded in a proposal ID ("<session_id>-<n>")"""
+    session_id, _, number = proposal_id.rpartition("-")
+    return session_id if session_id and number.isdigit() else None
+
+
+class SessionRegistry:
+    """
+    LRU registry of convening ceremonies over shared resources.
+
+    Usage:
+        registry = SessionRegistry(CouncilResources())
+        async with registry.session("sofie-42", create=True) as council:
+            await council.receive_briefing(briefing)
+    """
+
+    def __init__(
+        self,
+        resources: CouncilResources,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        session_dir: Optional[str] = None
+    ):
+        self.resources = resources
+        self.max_sessions = max(1, max_sessions)
+        self.idle_ttl = idle_ttl
+        self.session_dir = Path(session_dir) if session_dir else None
+        if self.session_dir:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+        self.shared = resources.shared_state  # SharedState across worker processes, or None
+
+        self._sessions: "OrderedDict[str, CouncilConvening]" = OrderedDict()  # LRU order
+        self._last_used: Dict[str, float] = {}
+        self._in_flight: Dict[str, int] = {}
+
+        # Metrics
+        self.created = 0
+        self.evicted = 0
+        self.persisted = 0
+        self.restored = 0
+        self.refreshed = 0  # Newer versions picked up from other workers
+
+    def resolve(self, session_id: Optional[str] = None, proposal_id: Optional[str] = None) -> str:
+        """Session for a request: explicit ID, else the proposal's, else the default"""
+        if session_id:
+            return validate_session_id(session_id)
+        if proposal_id:
+            owner = session_of_proposal(proposal_id)
+            if owner and SESSION_ID_PATTERN.match(owner):
+                return owner
+        return DEFAULT_SESSION
+
+    def get(self, session_id: str) -> Optional[CouncilConvening]:
+        """A live or persisted session (None if unknown)"""
+        convening = self._sessions.get(session_id)
+        if convening is None:
+            convening = self._load(session_id)
+            if convening is None:
+                return None
+            self._sessions[session_id] = convening
+            self.restored += 1
+            logger.info(f"🏛️ Session {session_id} restored")
+        else:
+            self._refresh(convening)
+
+        self._touch(session_id)
+        return convening
+
+    def get_or_create(self, session_id: str) -> CouncilConvening:
+        convening = self.get(session_id)
+        if convening is None:
+            convening = CouncilConvening(self.resources, validate_session_id(session_id))
+            self._sessions[session_id] = convening
+            self._touch(session_id)
+            self.created += 1
+            self.evict_idle()
+        return convening
+
+    @asynccontextmanager
+    async def session(
+        self,
+        session_id: Optional[str] = None,
+        create: bool = False
+    ) -> AsyncIterator[CouncilConvening]:
+        """
+        Hold a session for one request (serialized per session).
+
+        Raises:
+            UnknownSessionError: Unknown session and create is False
+            ValueError: Malformed session ID
+        """
+        session_id = validate_session_id(session_id or DEFAULT_SESSION)
+        self._in_flight[session_id] = self._in_flight.get(session_id, 0) + 1
+        try:
+            convening = self.get_or_create(session_id) if create else self.get(session_id)
+            if convening is None:
+                raise UnknownSessionError(session_id)
+
+            async with convening.lock:
+                if self.shared is None:
+                    yield convening
+                else:
+                    async with self.shared.lease(session_id):
+                        self._refresh(convening)
+                        try:
+                            yield convening
+                        finally:
+                            convening.state_version = self.shared.save_session(
+                                session_id, convening.snapshot()
+                            )
+        finally:
+            self._in_flight[session_id] -= 1
+            if not self._in_flight[session_id]:
+                del self._in_flight[session_id]
+            self._touch(session_id)
+            self.evict_idle()
+
+    def _refresh(self, convening: CouncilConvening):
+        """Pick up a newer version of the ceremony written by another worker"""
+        if self.shared is None:
+            return
+        if self.shared.session_version(convening.session_id) <= convening.state_version:
+            return
+        stored = self.shared.load_session(convening.session_id)
+        if stored is not None:
+            convening.state_version, snapshot = stored
+            convening.apply_snapshot(snapshot)
+            self.refreshed += 1
+
+    def _touch(self, session_id: str):
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+            self._last_used[session_id] = time.monotonic()
+
+    def evict_idle(self) -> List[str]:
+        """Evict expired sessions, then least recently used ones past max_sessions"""
+        now = time.monotonic()
+        evicted = []
+
+        for session_id in list(self._sessions):
+            if session_id in self._in_flight:
+                continue
+            expired = self.idle_ttl > 0 and now - self._last_used.get(session_id, now) > self.idle_ttl
+            if not expired and len(self._sessions) <= self.max_sessions:
+                break  # LRU order: everyone after this was used more recently
+            self._evict(session_id)
+            evicted.append(session_id)
+
+        return evicted
+
+    def _evict(self, session_id: str):
+        convening = self._sessions.pop(session_id)
+        self._last_used.pop(session_id, None)
+        self.evicted += 1
+        if self.session_dir and self.shared is None:
+            self._persist(convening)
+        kept = self.shared is not None or self.session_dir
+        logger.info(f"🏛️ Session {session_id} evicted ({'persisted' if kept else 'dropped'})")
+
+    def _path(self, session_id: str) -> Path:
+        return self.session_dir / f"{session_id}.json"
+
+    def _persist(self, convening: CouncilConvening):
+        path = self._path(convening.session_id)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(convening.snapshot(), f, default=str)
+        os.replace(tmp_path, path)
+        self.persisted += 1
+
+    def _load(self, session_id: str) -> Optional[CouncilConvening]:
+        if not SESSION_ID_PATTERN.match(session_id):
+            return None
+        if self.shared is not None:
+            stored = self.shared.load_session(session_id)
+            if stored is None:
+                return None
+            convening = CouncilConvening.restore(stored[1], self.resources)
+            convening.state_version = stored[0]
+            return convening
+        if not self.session_dir:
+            return None
+        path = self._path(session_id)
+        if not path.exists():
+            return None
+        try:
+            with open(path) as f:
+                return CouncilConvening.restore(json.load(f), self.resources)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Could not restore session {session_id}: {e}")
+            return None
+
+    def release(self, session_id: str) -> bool:
+        """
+        Persist a session and drop it from memory so another process can
+        take it over (cluster rebalancing). Needs a session directory.
+
+        Returns:
+            True if the session was live and has been handed off
+        """
+        if not self.session_dir and self.shared is None:
+            raise ValueError("Releasing sessions requires a session directory or shared state")
+        if session_id not in self._sessions or session_id in self._in_flight:
+            return False
+        self._evict(session_id)
+        return True
+
+    def close(self):
+        """Persist every live session (server shutdown)"""
+        if not self.session_dir or self.shared is not None:
+            return  # Shared state already holds every ceremony
+        for convening in self._sessions.values():
+            self._persist(convening)
+
+    def stats(self) -> Dict[str, Any]:
+        """Live sessions and registry counters"""
+        now = time.monotonic()
+        return {
+            "live": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_ttl_seconds": self.idle_ttl,
+            "persistence": (
+                str(self.shared.path) if self.shared is not None
+                else str(self.session_dir) if self.session_dir else None
+            ),
+            "created": self.created,
+            "evicted": self.evicted,
+            "persisted": self.persisted,
+            "restored": self.restored,
+            "refreshed": self.refreshed,
+            "sessions": [
+                {
+                    "session_id": session_id,
+                    "phase": convening.phase.value,
+                    "proposal_id": (convening.current_proposal or {}).get("proposal_id"),
+                    "idle_seconds": round(now - self._last_used.get(session_id, now), 1),
+                    "in_flight": self._in_flight.get(session_id, 0)
+                }
+                for session_id, convening in reversed(self._sessions.items())
+            ]
+        }
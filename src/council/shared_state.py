@@ -0,0 +1,425 @@
+"""
+Shared State - Council state that every API worker process agrees on
+
+Under `uvicorn --workers N` each worker builds its own CouncilResources,
+so agent capacity, ceremony phases and proposals used to diverge between
+workers. With COUNCIL_SHARED_STATE set, that state lives in one SQLite
+database (WAL mode, BEGIN IMMEDIATE transactions) that all workers read
+and update atomically:
+
+- Agent capacity: one row per occupied slot (agent, task_id, worker).
+  A slot is only taken if the agent's row count is below its
+  MAX_CONCURRENT_TASKS, checked in the same transaction, so the limit
+  holds council-wide. Slots held by worker processes that died are
+  reaped
+- Ceremony state: every session's snapshot with a version number. A
+  request holds the session's lease (one worker at a time; a heartbeat
+  renews it while held, and leases whose holder stopped renewing are
+  taken over), reloads the snapshot if another worker wrote a newer
+  version, and writes it back only if it still holds the lease
+- Ledger totals: the sqlite ledger backend, whose totals table is
+  already shared through its database (CouncilResources switches to it;
+  the json ledger refuses a second process)
+
+CapacitySync keeps each worker's view of agent load current and starts
+queued work when another worker frees a slot.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_SHARED_STATE_PATH = "./data/council_state.db"
+DEFAULT_LEASE_TTL = 30.0      # Seconds before another worker may take a session over
+DEFAULT_SYNC_INTERVAL = 1.0   # Seconds between capacity syncs
+LEASE_POLL_MIN = 0.005
+LEASE_POLL_MAX = 0.1
+LEASE_RENEWALS_PER_TTL = 3    # Heartbeats per lease_ttl while a lease is held
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agent_slots (
+    agent TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    worker TEXT NOT NULL,
+    acquired_at REAL NOT NULL,
+    PRIMARY KEY (agent, task_id)
+);
+CREATE INDEX IF NOT EXISTS idx_agent_slots_worker ON agent_slots (worker);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    snapshot TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS session_leases (
+    session_id TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class LeaseLostError(RuntimeError):
+    """Raised when a session lease expired and another worker took it over"""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(f"Lease on session {session_id} was lost to another worker")
+
+
+def worker_identity() -> str:
+    """This process, as recorded on slots and leases ("<host>:<pid>")"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedState:
+    """
+    Cross-process council state in one SQLite database.
+
+    Usage:
+        shared = SharedState("./data/council_state.db")
+        in_use = shared.acquire_slot("veda", task.id, limit=3)  # None: full
+        ...
+        shared.release_slot("veda", task.id)
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SHARED_STATE_PATH,
+        lease_ttl: float = DEFAULT_LEASE_TTL,
+        worker: Optional[str] = None
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lease_ttl = lease_ttl
+        self.worker = worker or worker_identity()
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=10.0,  # Wait out other workers' write transactions
+            check_same_thread=False,
+            isolation_level=None  # Explicit transactions below
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+        # Metrics
+        self.slots_denied = 0
+        self.lease_waits = 0
+        self.leases_lost = 0
+        self.reaped = 0
+        self.reap_dead_workers()
+
+        logger.info(f"🗄️ Shared council state: {self.path} (worker {self.worker})")
+
+    def acquire_slot(self, agent: str, task_id: str, limit: int) -> Optional[int]:
+        """
+        Take one of an agent's council-wide slots.
+
+        Taking a slot the task already holds changes nothing.
+
+        Returns:
+            Slots now in use for the agent, or None if all `limit` are taken
+        """
+        with self._transaction() as conn:
+            in_use = conn.execute(
+                "SELECT COUNT(*) FROM agent_slots WHERE agent = ?", (agent,)
+            ).fetchone()[0]
+            held = conn.execute(
+                "SELECT 1 FROM agent_slots WHERE agent = ? AND task_id = ?", (agent, task_id)
+            ).fetchone()
+            if held:
+                return in_use
+            if in_use >= limit:
+                self.slots_denied += 1
+                return None
+            conn.execute(
+                "INSERT INTO agent_slots VALUES (?, ?, ?, ?)",
+                (agent, task_id, self.worker, time.time())
+            )
+            return in_use + 1
+
+    def release_slot(self, agent: str, task_id: str) -> int:
+        """Free a slot; returns the slots still in use for the agent"""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM agent_slots WHERE agent = ? AND task_id = ?", (agent, task_id)
+            )
+            return conn.execute(
+                "SELECT COUNT(*) FROM agent_slots WHERE agent = ?", (agent,)
+            ).fetchone()[0]
+
+    def slot_counts(self) -> Dict[str, int]:
+        """Slots in use per agent, across all workers"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT agent, COUNT(*) FROM agent_slots GROUP BY agent"
+            ).fetchall()
+        return {agent: count for agent, count in rows}
+
+    def reap_dead_workers(self) -> int:
+        """Free slots and leases held by worker processes on this host that exited"""
+        host = self.worker.rpartition(":")[0]
+        with self._lock:
+            workers = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT worker FROM agent_slots "
+                "UNION SELECT DISTINCT owner FROM session_leases"
+            )]
+
+        dead = []
+        for worker in workers:
+            worker_host, _, pid = worker.rpartition(":")
+            if worker_host == host and pid.isdigit() and not _process_alive(int(pid)):
+                dead.append(worker)
+        if not dead:
+            return 0
+
+        reaped = 0
+        with self._transaction() as conn:
+            for worker in dead:
+                reaped += conn.execute("DELETE FROM agent_slots WHERE worker = ?", (worker,)).rowcount
+                conn.execute("DELETE FROM session_leases WHERE owner = ?", (worker,))
+        self.reaped += reaped
+        if reaped:
+            logger.warning(f"🗄️ Reaped {reaped} agent slots held by exited workers")
+        return reaped
+
+    def session_version(self, session_id: str) -> int:
+        """Latest stored version of a session (0 if never stored)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def load_session(self, session_id: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """(version, snapshot) of a stored session, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, snapshot FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def save_session(self, session_id: str, snapshot: Dict[str, Any]) -> int:
+        """
+        Store a session snapshot as its next version.
+
+        Raises:
+            LeaseLostError: This worker no longer holds the session's lease
+                (the snapshot is not written over the new holder's state)
+        """
+        payload = json.dumps(snapshot, default=str)
+        with self._transaction() as conn:
+            owner = conn.execute(
+                "SELECT owner FROM session_leases WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if owner is None or owner[0] != self.worker:
+                raise LeaseLostError(session_id)
+            conn.execute(
+                "INSERT INTO sessions VALUES (?, 1, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET "
+                "version = version + 1, snapshot = excluded.snapshot, updated_at = excluded.updated_at",
+                (session_id, payload, time.time())
+            )
+            return conn.execute(
+                "SELECT version FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+
+    @asynccontextmanager
+    async def lease(self, session_id: str) -> AsyncIterator[None]:
+        """
+        Hold a session exclusively across workers (waits for the current holder).
+
+        The lease is renewed in the background while held, so requests
+        longer than lease_ttl keep it; only a worker that stopped
+        renewing (hung or dead) loses it to another.
+        """
+        delay = LEASE_POLL_MIN
+        waited = False
+        while not self._try_lease(session_id):
+            waited = True
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, LEASE_POLL_MAX)
+        if waited:
+            self.lease_waits += 1
+
+        heartbeat = asyncio.get_running_loop().create_task(self._heartbeat(session_id))
+        try:
+            yield
+        finally:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+            with self._transaction() as conn:
+                released = conn.execute(
+                    "DELETE FROM session_leases WHERE session_id = ? AND owner = ?",
+                    (session_id, self.worker)
+                ).rowcount
+            if not released:
+                self.leases_lost += 1
+                logger.warning(f"🗄️ Lease on session {session_id} was lost while held")
+
+    async def _heartbeat(self, session_id: str):
+        """Renew a held lease every lease_ttl / LEASE_RENEWALS_PER_TTL seconds"""
+        while True:
+            await asyncio.sleep(self.lease_ttl / LEASE_RENEWALS_PER_TTL)
+            if not self._renew_lease(session_id):
+                logger.warning(f"🗄️ Lease on session {session_id} lost before renewal")
+                return
+
+    def _renew_lease(self, session_id: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE session_leases SET expires_at = ? WHERE session_id = ? AND owner = ?",
+                (time.time() + self.lease_ttl, session_id, self.worker)
+            )
+            return cursor.rowcount == 1
+
+    def _try_lease(self, session_id: str) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO session_leases VALUES (?, ?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET "
+                "owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE session_leases.expires_at < ?",
+                (session_id, self.worker, now + self.lease_ttl, now)
+            )
+            return cursor.rowcount == 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Council-wide slot usage and session counts"""
+        with self._lock:
+            sessions = self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+            leased = self._conn.execute("SELECT COUNT(*) FROM session_leases").fetchone()[0]
+            workers = self._conn.execute(
+                "SELECT COUNT(DISTINCT worker) FROM agent_slots"
+            ).fetchone()[0]
+        return {
+            "path": str(self.path),
+            "worker": self.worker,
+            "slots_in_use": self.slot_counts(),
+            "workers_holding_slots": workers,
+            "sessions": sessions,
+            "sessions_leased": leased,
+            "slots_denied": self.slots_denied,
+            "lease_waits": self.lease_waits,
+            "leases_lost": self.leases_lost,
+            "reaped_slots": self.reaped
+        }
+
+    def close(self):
+        """Free this worker's slots and leases, then close the database"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM agent_slots WHERE worker = ?", (self.worker,))
+            conn.execute("DELETE FROM session_leases WHERE owner = ?", (self.worker,))
+        with self._lock:
+            self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT/ROLLBACK under the connection lock"""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            self.lock.release()
+        return False
+
+
+class CapacitySync:
+    """
+    Periodically mirror council-wide slot usage into this worker's agents.
+
+    Another worker finishing a task frees a slot this worker cannot see
+    directly; each pass refreshes the agents' load, reaps slots of exited
+    workers and lets the dispatch queue start work that was waiting.
+    """
+
+    def __init__(self, resources: Any, interval_seconds: float = DEFAULT_SYNC_INTERVAL):
+        self.resources = resources  # CouncilResources
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the periodic sync on the running event loop"""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            logger.info(f"🗄️ Capacity sync every {self.interval_seconds:.1f}s")
+
+    async def stop(self):
+        """Stop the periodic sync"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def sync_now(self) -> int:
+        """One pass; returns the number of queued tasks started"""
+        shared = self.resources.shared_state
+        shared.reap_dead_workers()
+        self.resources.sync_capacity()
+
+        dispatcher = self.resources.dispatcher
+        started = 0
+        for name, queue in dispatcher.stats()["by_agent"].items():
+            if queue["depth"]:
+                started += await dispatcher.dispatch(name)
+        return started
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.sync_now()
+            except Exception as e:
+                logger.error(f"Capacity sync failed: {e}")
@@ -0,0 +1,74 @@
+"""
+Shared fixtures for the council test suite
+
+Every test gets its own ledger under tmp_path; nothing touches ./data.
+Async code is driven with asyncio.run() (no pytest plugins needed).
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def backend_task(task_id: str):
+    """A normal-priority, one-hour backend task (Veda's specialty)"""
+    from src.council.agents import Task, TaskPriority
+
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="backend api endpoint",
+        repo="sandironratio-node",
+        priority=TaskPriority.NORMAL,
+        estimated_hours=1.0
+    )
+
+
+def briefing(*tasks) -> dict:
+    """A Sofie convene briefing with the given critical path"""
+    return {
+        "command": "convene",
+        "timestamp": "2026-01-01T00:00:00",
+        "ecosystem_state": {},
+        "sofie_requirements": [],
+        "critical_path": list(tasks),
+        "protected_notice": "sofie-llama-backend is sovereign territory"
+    }
+
+
+@pytest.fixture
+def ledger_path(tmp_path) -> str:
+    return str(tmp_path / "diligence_ledger.json")
+
+
+@pytest.fixture
+def council(ledger_path):
+    """The six agents, sharing a scratch ledger"""
+    from src.council.agents import create_council
+
+    return create_council(ledger_path)
+
+
+@pytest.fixture
+def council_env(monkeypatch, ledger_path):
+    """COUNCIL_* environment for one test: defaults plus a scratch ledger"""
+    for name in list(os.environ):
+        if name.startswith("COUNCIL_"):
+            monkeypatch.delenv(name)
+    monkeypatch.setenv("COUNCIL_LEDGER_PATH", ledger_path)
+    return monkeypatch
+
+
+@pytest.fixture
+def resources(council_env):
+    from src.council.convening import CouncilResources
+
+    council = CouncilResources()
+    yield council
+    council.ledger.close()
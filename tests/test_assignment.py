@@ -0,0 +1,41 @@
+"""max_confidence_assignment: the optimal capacity-aware solver"""
+
+import itertools
+import random
+
+from src.council.agents.assignment import max_confidence_assignment
+
+
+def brute_force(confidences, capacities):
+    """(placed, total confidence) of the best capacity-respecting assignment"""
+    best = (0, 0.0)
+    options = [list(allowed) + [None] for allowed in confidences]
+    for choice in itertools.product(*options):
+        load = [0] * len(capacities)
+        for agent in choice:
+            if agent is not None:
+                load[agent] += 1
+        if any(l > c for l, c in zip(load, capacities)):
+            continue
+        placed = sum(agent is not None for agent in choice)
+        total = sum(confidences[t][a] for t, a in enumerate(choice) if a is not None)
+        best = max(best, (placed, round(total, 9)))
+    return best
+
+
+def test_optimal_solver_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(60):
+        agents = rng.randint(1, 3)
+        confidences = [
+            {a: round(rng.random(), 2) for a in range(agents) if rng.random() < 0.7}
+            for _ in range(rng.randint(1, 5))
+        ]
+        capacities = [rng.randint(0, 2) for _ in range(agents)]
+
+        result = max_confidence_assignment(confidences, capacities)
+        for agent in range(agents):
+            assert sum(r == agent for r in result) <= capacities[agent]
+        placed = sum(r is not None for r in result)
+        total = sum(confidences[t][a] for t, a in enumerate(result) if a is not None)
+        assert (placed, round(total, 9)) == brute_force(confidences, capacities)
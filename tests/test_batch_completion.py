@@ -0,0 +1,146 @@
+"""Batch completions: one ledger write, idempotency keys and failed writes"""
+
+import asyncio
+
+import pytest
+
+from conftest import backend_task
+
+
+def item(task_id: str, key: str = None, agent: str = "veda") -> dict:
+    completion = {"agent_name": agent, "task_id": task_id, "hours_worked": 1.0}
+    if key:
+        completion["idempotency_key"] = key
+    return completion
+
+
+async def assign(resources, *task_ids, agent: str = "veda"):
+    for task_id in task_ids:
+        assert await resources.agents[agent].assign_task(backend_task(task_id))
+
+
+def test_batch_accrues_every_task_in_one_write(resources, monkeypatch):
+    async def scenario():
+        await assign(resources, "a", "b", "c")
+        store = resources.ledger.store
+        writes = []
+        append_batch = store.append_batch
+        monkeypatch.setattr(store, "append_batch", lambda records, sync=False: (
+            writes.append(len(records)) or append_batch(records, sync)
+        ))
+
+        results = await resources.record_task_completions([item("a"), item("b"), item("c")])
+        assert [r["status"] for r in results] == ["completed"] * 3
+        assert writes == [3]
+        assert store.get_totals("veda")["tasks_completed"] == 3
+
+    asyncio.run(scenario())
+
+
+def test_idempotency_key_replays_the_first_result(resources):
+    async def scenario():
+        await assign(resources, "a")
+        first = await resources.record_task_completions([item("a", key="k1")])
+        again = await resources.record_task_completions([item("a", key="k1")])
+
+        assert again[0]["replayed"] is True
+        assert again[0]["nectar_accrued"] == first[0]["nectar_accrued"]
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 1
+
+        reused = await resources.record_task_completions([item("b", key="k1")])
+        assert reused[0]["status"] == "error"
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_items_in_one_batch_complete_once(resources):
+    async def scenario():
+        await assign(resources, "a")
+        results = await resources.record_task_completions([item("a"), item("a")])
+        assert [r["status"] for r in results] == ["completed", "error"]
+
+        keyed = await resources.record_task_completions([item("a", key="k"), item("a", key="k")])
+        assert keyed[0]["status"] == "error"  # Already completed above
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_ledger_write_completes_nothing_and_can_be_retried(resources, monkeypatch):
+    async def scenario():
+        await assign(resources, "a", "b")
+        store = resources.ledger.store
+
+        def fail(records, sync=False):
+            raise OSError("disk full")
+        monkeypatch.setattr(store, "append_batch", fail)
+
+        with pytest.raises(OSError):
+            await resources.record_task_completions([item("a", key="ka"), item("b", key="kb")])
+        veda = resources.agents["veda"]
+        assert veda.tasks["a"].status != "completed"
+        assert veda.tasks["b"].status != "completed"
+        assert "ka" not in resources._completion_keys
+        assert not resources._completing
+
+        monkeypatch.undo()
+        retry = await resources.record_task_completions([item("a", key="ka"), item("b", key="kb")])
+        assert [r["status"] for r in retry] == ["completed", "completed"]
+        assert "replayed" not in retry[0]
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_task_awaiting_its_ledger_write_cannot_be_completed_again(resources, monkeypatch):
+    async def scenario():
+        await assign(resources, "a")
+        gate = asyncio.Event()
+        arecord = resources.ledger.arecord_completions
+
+        async def slow(completions):
+            await gate.wait()
+            return await arecord(completions)
+        monkeypatch.setattr(resources.ledger, "arecord_completions", slow)
+
+        batch = asyncio.ensure_future(resources.record_task_completions([item("a")]))
+        await asyncio.sleep(0)
+        manual = await resources.record_task_completion("veda", "a", 1.0)
+        assert (manual["status"], manual["error"]) == ("error", "Task is being completed: a")
+
+        gate.set()
+        assert (await batch)[0]["status"] == "completed"
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_failed_task_completion_fails_only_its_item(resources, monkeypatch):
+    async def scenario():
+        await assign(resources, "a", "b", "c")
+        veda = resources.agents["veda"]
+        complete_task = veda.complete_task
+
+        async def fail_second(task_id, *args):
+            if task_id == "b":
+                raise RuntimeError("agent crashed")
+            return await complete_task(task_id, *args)
+        monkeypatch.setattr(veda, "complete_task", fail_second)
+
+        first = asyncio.ensure_future(
+            resources.record_task_completions(
+                [item("a", key="ka"), item("b", key="kb"), item("c", key="kc")]
+            )
+        )
+        retry = asyncio.ensure_future(resources.record_task_completions([item("b", key="kb")]))
+        results = await first
+        replayed = await asyncio.wait_for(retry, timeout=1)
+
+        assert [r["status"] for r in results] == ["completed", "error", "completed"]
+        assert "agent crashed" in results[1]["error"]
+        assert results[1]["nectar_accrued"] > 0
+        assert replayed[0]["status"] == "error" and replayed[0]["replayed"]
+        assert not resources._completing
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 3  # Not accrued twice
+
+    asyncio.run(scenario())
@@ -0,0 +1,83 @@
+"""Cluster routing: consistent hashing, session routing and rebalancing"""
+
+import asyncio
+import json
+
+from src.council import cluster
+from src.council.cluster import ClusterRouter, HashRing, ProxyRequest
+
+WORKERS = [f"127.0.0.1:{9001 + i}" for i in range(4)]
+SESSIONS = [f"sofie-{i}" for i in range(2000)]
+
+
+def test_adding_a_worker_only_moves_keys_to_it():
+    ring = HashRing(WORKERS)
+    before = {key: ring.node_for(key) for key in SESSIONS}
+    grown = ring.copy()
+    grown.add("127.0.0.1:9005")
+
+    moved = [key for key in SESSIONS if grown.node_for(key) != before[key]]
+    assert all(grown.node_for(key) == "127.0.0.1:9005" for key in moved)
+    assert 0 < len(moved) < len(SESSIONS) / 3
+    assert ring.nodes == WORKERS  # The copy did not touch the original
+
+
+def test_removing_a_worker_only_moves_its_keys():
+    ring = HashRing(WORKERS)
+    before = {key: ring.node_for(key) for key in SESSIONS}
+    ring.remove(WORKERS[0])
+
+    for key in SESSIONS:
+        if before[key] != WORKERS[0]:
+            assert ring.node_for(key) == before[key]
+        else:
+            assert ring.node_for(key) in WORKERS[1:]
+
+
+def request(method: str, target: str, body: dict = None) -> ProxyRequest:
+    return ProxyRequest(method, target, [], json.dumps(body).encode() if body else b"")
+
+
+def test_session_key_routing():
+    router = ClusterRouter(WORKERS)
+    assert router.session_key(request("GET", "/council/status?session_id=s1")) == "s1"
+    assert router.session_key(request("POST", "/council/authorize", {"proposal_id": "s7-3"})) == "s7"
+    assert router.session_key(request("POST", "/council/complete", {"task_id": "t1"})) is None
+    assert router.session_key(request("GET", "/council/execution?task_id=t1")) is None
+    assert router.session_key(request("GET", "/council/status")) == "default"
+
+
+def test_worker_dying_mid_rebalance_does_not_abort_it(monkeypatch):
+    router = ClusterRouter(WORKERS)
+    session = next(key for key in SESSIONS if router.ring.node_for(key) == WORKERS[0])
+
+    async def flaky(worker, method, path, body=None, timeout=30.0):
+        if path == "/council/sessions":
+            return 200, {"sessions": [{"session_id": session}] if worker == WORKERS[0] else []}
+        raise asyncio.TimeoutError()
+    monkeypatch.setattr(cluster, "http_request", flaky)
+
+    result = asyncio.run(router.remove_worker(WORKERS[0]))
+    assert result["moved_sessions"] == []
+    assert router.ring.nodes == WORKERS[1:]
+    assert router.errors == 2  # Release tried before and after the ring switch
+
+
+class Capture:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data: bytes):
+        self.data += data
+
+
+def test_failed_cluster_request_answers_502(monkeypatch):
+    router = ClusterRouter(WORKERS)
+
+    async def unreachable(address):
+        raise OSError("connection refused")
+    monkeypatch.setattr(router, "add_worker", unreachable)
+
+    writer = Capture()
+    asyncio.run(router._local(request("POST", "/cluster/workers", {"address": "127.0.0.1:9009"}), writer))
+    assert writer.data.startswith(b"HTTP/1.1 502 ")
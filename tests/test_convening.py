@@ -0,0 +1,52 @@
+"""Convening ceremony: pipelined run and the shared ledger store"""
+
+import asyncio
+
+from conftest import backend_task, briefing
+from src.council.convening import CouncilConvening
+from src.council.events import EventType
+
+
+async def steps(council, *tasks, auto_authorize: bool = False):
+    return [step async for step in council.run(briefing(*tasks), auto_authorize)]
+
+
+def test_run_stops_for_authorization_by_default(resources):
+    async def scenario():
+        council = CouncilConvening(resources, "pipeline")
+        run = await steps(council, "Build backend api")
+        assert [step["step"] for step in run] == ["convene", "deliberate", "propose", "done"]
+        assert run[-1]["status"] == "awaiting_authorization"
+        assert run[-1]["proposal_id"] == "pipeline-1"
+
+    asyncio.run(scenario())
+
+
+def test_auto_authorized_run_deploys_and_publishes_each_phase(resources):
+    async def scenario():
+        subscription = resources.events.subscribe(types=[EventType.PHASE_CHANGED.value])
+        council = CouncilConvening(resources, "pipeline")
+        run = await steps(council, "Build backend api", auto_authorize=True)
+
+        assert [step["step"] for step in run][-3:] == ["authorize", "deploy", "done"]
+        assert run[-2]["result"]["status"] == run[-1]["status"]
+        await resources.executor.drain()
+
+        phases = []
+        while (event := await subscription.next(timeout=0.01)) is not None:
+            phases.append(event.data["to"])
+        assert phases[-1] == run[-1]["phase"]
+        assert len(phases) >= 5
+
+    asyncio.run(scenario())
+
+
+def test_hex_and_the_ledger_share_one_store(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        assert await veda.assign_task(backend_task("t1"))
+        await resources.record_task_completion("veda", "t1", 2.0)
+        assert resources.agents["hex"].store is resources.ledger.store
+        assert resources.agents["hex"].store.get_totals("veda")["tasks_completed"] == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,71 @@
+"""Incremental re-deliberation (DeliberationState patching)"""
+
+import asyncio
+import copy
+
+from conftest import briefing
+from src.council.convening import CouncilConvening
+
+BACKEND = [f"Build backend service {i}" for i in range(5)]
+
+
+def test_patch_reuses_the_plan_and_promotes_queued_work(resources):
+    async def scenario():
+        council = CouncilConvening(resources, "patch")
+        await council.receive_briefing(briefing(*BACKEND))
+        first = await council.deliberate()
+        assert first["delta"]["mode"] == "full"
+
+        await council.receive_briefing(briefing(*BACKEND[1:]))
+        second = await council.deliberate()
+        delta = second["delta"]
+        assert delta["mode"] == "incremental"
+        assert delta["removed"] == [BACKEND[0]]
+        assert delta["rerouted"] == 0
+        assert delta["promoted"], "freed slot was not given to queued work"
+        assert second["assignments"] == len(BACKEND) - 1
+
+    asyncio.run(scenario())
+
+
+def test_issued_proposal_is_not_changed_by_a_later_patch(resources):
+    async def scenario():
+        council = CouncilConvening(resources, "frozen")
+        await council.receive_briefing(briefing(*BACKEND))
+        await council.deliberate()
+        proposal = await council.generate_proposal()
+        assert any(a.get("status") == "queued" for a in proposal["council_plan"]["assignments"])
+        issued = copy.deepcopy(proposal)
+
+        await council.authorize(proposal["proposal_id"])
+        authorized = copy.deepcopy(proposal["council_plan"])
+
+        await council.receive_briefing(briefing(*BACKEND[1:]))
+        assert (await council.deliberate())["delta"]["promoted"]
+
+        assert proposal["council_plan"] == issued["council_plan"] == authorized
+
+    asyncio.run(scenario())
+
+
+def test_patch_schedules_once_and_copies_only_changed_assignments(resources, monkeypatch):
+    from src.council.agents.planning import TaskGraph
+
+    async def scenario():
+        council = CouncilConvening(resources, "cheap")
+        tasks = BACKEND + ["Write docs"]
+        await council.receive_briefing(briefing(*tasks))
+        await council.deliberate()
+        before = council.deliberation_record["assignments"]
+
+        schedules = []
+        schedule = TaskGraph.schedule
+        monkeypatch.setattr(TaskGraph, "schedule", lambda graph: schedules.append(graph) or schedule(graph))
+        await council.receive_briefing(briefing(*tasks, "Write more docs"))
+        assert (await council.deliberate())["delta"]["mode"] == "incremental"
+        after = council.deliberation_record["assignments"]
+
+        assert len(schedules) == 1
+        assert [any(a is b for b in before) for a in after] == [True] * len(tasks) + [False]
+
+    asyncio.run(scenario())
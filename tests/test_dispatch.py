@@ -0,0 +1,91 @@
+"""DispatchQueue: priority order, dispatch on freed capacity and work stealing"""
+
+import asyncio
+
+from src.council.agents import Task, TaskPriority
+from src.council.dispatch import DispatchQueue
+
+COORDINATION = "Coordinate build of new feature"  # Spark's and Tess's specialty
+
+
+def queued_task(task_id: str, description: str, priority: TaskPriority = TaskPriority.NORMAL) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description=description,
+        repo="sandironratio-node",
+        priority=priority,
+        estimated_hours=1.0
+    )
+
+
+async def fill(dispatcher, agent, prefix: str, description: str):
+    limit = agent.biometrics.MAX_CONCURRENT_TASKS
+    for i in range(limit):
+        placement = await dispatcher.submit(agent.name, queued_task(f"{prefix}{i}", description))
+        assert placement["status"] == "deployed"
+    return [f"{prefix}{i}" for i in range(limit)]
+
+
+def test_freed_slot_starts_the_highest_priority_task(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        dispatcher = DispatchQueue(resources.agents, neighbors={})
+        running = await fill(dispatcher, veda, "run", "backend api")
+
+        low = queued_task("low", "backend api", TaskPriority.LOW)
+        critical = queued_task("critical", "backend api", TaskPriority.CRITICAL)
+        assert (await dispatcher.submit("veda", low))["status"] == "queued"
+        assert (await dispatcher.submit("veda", critical))["status"] == "queued"
+
+        await veda.complete_task(running[0], {}, 1.0)
+        assert veda.tasks["critical"].status == "in_progress"
+        assert dispatcher.is_queued("low")
+        assert dispatcher.stats()["queued"] == 1
+
+        assert dispatcher.cancel("low")
+        assert low.status == "cancelled"
+        assert dispatcher.stats()["queued"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_idle_neighbor_steals_work_it_can_handle(resources):
+    async def scenario():
+        spark, tess = resources.agents["spark"], resources.agents["tess"]
+        dispatcher = DispatchQueue(resources.agents)
+        await fill(dispatcher, spark, "spark", COORDINATION)
+
+        placement = await dispatcher.submit("spark", queued_task("extra", COORDINATION))
+        assert placement == {"status": "deployed", "agent": "tess", "redistributed_from": "spark"}
+        assert tess.tasks["extra"].stolen_from == "spark"
+        assert dispatcher.stolen_by["tess"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_work_nobody_nearby_can_handle_stays_queued(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        dispatcher = DispatchQueue(resources.agents)
+        await fill(dispatcher, veda, "veda", "backend api")
+
+        placement = await dispatcher.submit("veda", queued_task("extra", "backend database migration"))
+        assert placement["status"] == "queued"
+        assert dispatcher.stolen == 0
+
+    asyncio.run(scenario())
+
+
+def test_stolen_task_accrues_with_its_planned_agent(resources):
+    async def scenario():
+        dispatcher = DispatchQueue(resources.agents)
+        await fill(dispatcher, resources.agents["spark"], "spark", COORDINATION)
+        await dispatcher.submit("spark", queued_task("extra", COORDINATION))
+
+        result = await resources.record_task_completion("tess", "extra", 1.0)
+        assert result["status"] == "completed"
+        record = resources.ledger.store.get_recent("tess")[-1]
+        assert (record.task_id, record.stolen_from) == ("extra", "spark")
+
+    asyncio.run(scenario())
@@ -0,0 +1,91 @@
+"""EventBus: live delivery, resume from history, gaps and filtering"""
+
+import asyncio
+import threading
+
+from src.council import events
+from src.council.events import EventBus, EventType
+
+
+def publish(bus: EventBus, count: int, session_id: str = None):
+    for i in range(count):
+        bus.publish(EventType.TASK_STARTED, {"i": i}, session_id=session_id)
+
+
+async def collect(subscription, count: int):
+    return [await subscription.next(timeout=1) for _ in range(count)]
+
+
+def test_resume_replays_history_then_live_events_in_order():
+    async def scenario():
+        bus = EventBus()
+        publish(bus, 5)
+        subscription = bus.subscribe(since=2)
+        publish(bus, 2)
+
+        received = await collect(subscription, 5)
+        assert [event.seq for event in received] == [3, 4, 5, 6, 7]
+        subscription.close()
+        assert bus.stats()["subscribers"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_resume_past_the_history_starts_with_a_gap():
+    async def scenario():
+        bus = EventBus(history_size=3)
+        publish(bus, 10)
+        subscription = bus.subscribe(since=1)
+
+        gap, *rest = await collect(subscription, 4)
+        assert gap.type is EventType.GAP
+        assert gap.data == {"after": 1, "reason": "history_exceeded", "resume_from": 8}
+        assert [event.seq for event in rest] == [8, 9, 10]
+
+    asyncio.run(scenario())
+
+
+def test_overflowing_subscriber_drains_then_gets_a_gap(monkeypatch):
+    monkeypatch.setattr(events, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+    async def scenario():
+        bus = EventBus()
+        subscription = bus.subscribe()
+        publish(bus, 5)
+
+        received = await collect(subscription, 3)
+        assert [event.seq for event in received[:2]] == [1, 2]
+        assert received[2].type is EventType.GAP
+        assert received[2].data["resume_from"] == 3
+        assert await subscription.next(timeout=0.01) is None  # Subscription ended
+        assert bus.stats()["overflows"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_filters_by_type_and_session():
+    async def scenario():
+        bus = EventBus()
+        subscription = bus.subscribe(types=["phase.changed"], session_id="s1")
+        bus.publish(EventType.PHASE_CHANGED, {"phase": "a"}, session_id="s2")
+        bus.publish(EventType.TASK_STARTED, {}, session_id="s1")
+        bus.publish(EventType.PHASE_CHANGED, {"phase": "b"}, session_id="s1")
+        bus.publish(EventType.PHASE_CHANGED, {"phase": "c"})  # Council-wide
+
+        received = await collect(subscription, 2)
+        assert [event.data["phase"] for event in received] == ["b", "c"]
+
+    asyncio.run(scenario())
+
+
+def test_publishing_from_another_thread_reaches_the_loop():
+    async def scenario():
+        bus = EventBus()
+        subscription = bus.subscribe()
+        worker = threading.Thread(target=publish, args=(bus, 3))
+        worker.start()
+        received = await collect(subscription, 3)
+        worker.join()
+        assert [event.seq for event in received] == [1, 2, 3]
+
+    asyncio.run(scenario())
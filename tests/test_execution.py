@@ -0,0 +1,137 @@
+"""ExecutionEngine: concurrent execution, timeouts and completion races"""
+
+import asyncio
+
+from conftest import backend_task
+from src.council.execution import ExecutionEngine
+
+
+def gated(agent, gate: asyncio.Event, started: asyncio.Event):
+    """Make an agent's execute_task wait for `gate`"""
+    async def execute_task(task):
+        started.set()
+        await gate.wait()
+        return {"status": "done", "quality_score": 1.0, "hours_worked": 1.0}
+    agent.execute_task = execute_task
+
+
+def test_runs_agents_in_parallel_within_their_limits(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        gate, started = asyncio.Event(), asyncio.Event()
+        gated(veda, gate, started)
+
+        limit = veda.biometrics.MAX_CONCURRENT_TASKS
+        for i in range(limit + 2):
+            resources.executor.submit("veda", backend_task(f"t{i}"))
+        await started.wait()
+        await asyncio.sleep(0)
+        assert resources.executor.active_by_agent["veda"] == limit
+
+        gate.set()
+        outcomes = await resources.executor.drain()
+        assert [o["status"] for o in outcomes] == ["completed"] * (limit + 2)
+        assert resources.executor.peak_by_agent["veda"] == limit
+
+    asyncio.run(scenario())
+
+
+def test_timeout_releases_the_slot_without_accrual(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        gated(veda, asyncio.Event(), asyncio.Event())
+
+        outcome = await resources.executor.submit("veda", backend_task("slow"), timeout=0.01)
+        assert outcome["status"] == "timed_out"
+        assert veda.tasks["slow"].status == "timed_out"
+        assert veda.biometrics.concurrent_tasks == 0
+        assert resources.ledger.store.get_totals("veda") is None
+
+    asyncio.run(scenario())
+
+
+def test_manual_completion_of_an_executing_task_is_refused(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        gate, started = asyncio.Event(), asyncio.Event()
+        gated(veda, gate, started)
+
+        run = resources.executor.submit("veda", backend_task("race"))
+        await started.wait()
+
+        manual = await resources.record_task_completion("veda", "race", 1.0)
+        assert (manual["status"], manual["error"]) == ("error", "Task is executing: race")
+        batch = await resources.record_task_completions(
+            [{"agent_name": "veda", "task_id": "race", "hours_worked": 1.0}]
+        )
+        assert batch[0]["status"] == "error"
+
+        gate.set()
+        assert (await run)["status"] == "completed"
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 1
+        assert len(veda.task_history) == 1
+
+    asyncio.run(scenario())
+
+
+def test_engine_skips_accrual_for_a_task_completed_meanwhile(resources):
+    async def scenario():
+        veda = resources.agents["veda"]
+        gate, started = asyncio.Event(), asyncio.Event()
+        gated(veda, gate, started)
+
+        run = resources.executor.submit("veda", backend_task("race"))
+        await started.wait()
+        await veda.complete_task("race", {}, 1.0)  # Completed outside the engine
+        gate.set()
+
+        outcome = await run
+        assert outcome["status"] == "completed"
+        assert outcome["already_completed"] is True
+        assert len(veda.task_history) == 1
+        assert resources.ledger.store.get_totals("veda") is None
+
+    asyncio.run(scenario())
+
+
+def test_failed_accrual_releases_the_task_for_a_retry(resources, monkeypatch):
+    async def scenario():
+        veda = resources.agents["veda"]
+        gate = asyncio.Event()
+        gate.set()
+        gated(veda, gate, asyncio.Event())
+
+        async def fail(**kwargs):
+            raise OSError("disk full")
+        monkeypatch.setattr(resources.ledger, "arecord_completion", fail)
+
+        outcome = await resources.executor.submit("veda", backend_task("t1"))
+        assert (outcome["status"], outcome["error"]) == ("failed", "disk full")
+        assert veda.tasks["t1"].status == "failed"
+        assert veda.biometrics.concurrent_tasks == 0
+        assert resources.ledger.store.get_totals("veda") is None
+
+        monkeypatch.undo()
+        retry = await resources.record_task_completion("veda", "t1", 1.0)
+        assert retry["status"] == "completed"
+        assert resources.ledger.store.get_totals("veda")["tasks_completed"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_rejects_duplicate_submission(resources):
+    async def scenario():
+        engine: ExecutionEngine = resources.executor
+        gate = asyncio.Event()
+        gated(resources.agents["veda"], gate, asyncio.Event())
+        task = backend_task("dup")
+        engine.submit("veda", task)
+        try:
+            engine.submit("veda", task)
+            assert False, "second submit accepted"
+        except ValueError:
+            pass
+        gate.set()
+        await engine.drain()
+
+    asyncio.run(scenario())
@@ -0,0 +1,296 @@
+"""LedgerStore: atomic batches, journal recovery and Merkle commitments"""
+
+import json
+
+import pytest
+
+from src.council.ledger_store import LedgerStore, NectarAccrualRecord
+
+
+def record(task_id: str, agent: str = "veda", nectar: float = 10.0) -> NectarAccrualRecord:
+    return NectarAccrualRecord(
+        agent_name=agent,
+        task_id=task_id,
+        task_title=f"Task {task_id}",
+        repo="sandironratio-node",
+        hours_worked=1.0,
+        base_rate=10.0,
+        quality_multiplier=1.0,
+        nectar_accrued=nectar,
+        timestamp="2026-01-01T00:00:00"
+    )
+
+
+def state(store):
+    return (
+        store.record_count,
+        store.all_totals(),
+        [r.task_id for r in store.get_recent("veda")],
+        store.merkle.size if store.merkle is not None else None
+    )
+
+
+def open_store(tmp_path, backend: str, **options):
+    path = str(tmp_path / "ledger.json")
+    if backend == "sqlite":
+        from src.council.ledger_sqlite import SQLiteLedgerStore
+        return SQLiteLedgerStore(path)
+    return LedgerStore(path, journaled=backend == "journal", **options)
+
+
+@pytest.mark.parametrize("backend", ["json", "journal", "sqlite"])
+def test_failed_batch_write_rolls_everything_back(tmp_path, monkeypatch, backend):
+    store = open_store(tmp_path, backend)
+    store.attach_merkle_log()
+    store.append_batch([record("a"), record("b")])
+    before = state(store)
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    if backend == "json":
+        monkeypatch.setattr(store, "_save", fail)
+    elif backend == "journal":
+        monkeypatch.setattr(store.journal._handle, "write", fail)
+    else:
+        monkeypatch.setattr(store, "_insert", fail)
+
+    with pytest.raises(OSError):
+        store.append_batch([record("c"), record("d", agent="aura")])
+    assert state(store) == before
+
+    monkeypatch.undo()
+    store.append_batch([record("c")])
+    assert store.get_totals("veda")["tasks_completed"] == 3
+    assert store.merkle.size == 3
+
+
+def test_failed_single_append_raises_instead_of_returning_stale_totals(tmp_path, monkeypatch):
+    store = open_store(tmp_path, "json")
+    store.append(record("a"))
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(store, "_save", fail)
+
+    with pytest.raises(OSError):
+        store.append(record("b"))
+    with pytest.raises(OSError):
+        store.submit(record("b")).result()
+    assert store.get_totals("veda")["tasks_completed"] == 1
+
+    monkeypatch.undo()
+    assert store.submit(record("b")).result()["tasks_completed"] == 2
+
+
+def test_failed_journal_write_leaves_no_partial_lines(tmp_path, monkeypatch):
+    store = open_store(tmp_path, "journal")
+    store.append_batch([record("a")])
+    handle = store.journal._handle
+    write = handle.write
+
+    def torn(data):
+        write(data[:len(data) // 2])
+        raise OSError("disk full")
+    monkeypatch.setattr(handle, "write", torn)
+
+    with pytest.raises(OSError):
+        store.append_batch([record("b"), record("c")])
+    store.append_batch([record("d")])
+
+    with open(store.journal.journal_path) as f:
+        assert [json.loads(line)["task_id"] for line in f] == ["a", "d"]
+
+
+def test_failed_json_save_keeps_the_previous_file(tmp_path, monkeypatch):
+    store = open_store(tmp_path, "json")
+    store.append_batch([record("a")])
+    saved = (tmp_path / "ledger.json").read_text()
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    monkeypatch.setattr(json, "dump", fail)
+
+    with pytest.raises(OSError):
+        store.append_batch([record("b")])
+    assert (tmp_path / "ledger.json").read_text() == saved
+
+
+def test_journal_restart_loads_checkpoint_and_replays_the_tail(tmp_path):
+    store = open_store(tmp_path, "journal", checkpoint_interval=3)
+    for i in range(5):
+        store.append_batch([record(f"t{i}", agent="veda" if i % 2 else "aura")])
+    before = store.all_totals()
+    store.close()
+
+    reopened = open_store(tmp_path, "journal", checkpoint_interval=3)
+    assert reopened.all_totals() == before
+    assert reopened.record_count == 5
+    assert reopened.journal.pending_since_checkpoint == 2  # Only the tail was replayed
+    assert [r.task_id for r in reopened.get_recent("veda")] == ["t1", "t3"]
+
+
+def test_torn_journal_tail_is_dropped_on_restart(tmp_path):
+    store = open_store(tmp_path, "journal")
+    store.append_batch([record("a"), record("b")])
+    store.close()
+    with open(store.journal.journal_path, "ab") as f:
+        f.write(b'{"agent_name": "veda", "task_id": "to')  # Crash mid-append
+
+    reopened = open_store(tmp_path, "journal")
+    assert reopened.get_totals("veda")["tasks_completed"] == 2
+    reopened.append_batch([record("c")])
+    with open(reopened.journal.journal_path) as f:
+        assert [json.loads(line)["task_id"] for line in f] == ["a", "b", "c"]
+
+
+def test_json_ledger_migrates_into_sqlite(tmp_path):
+    store = open_store(tmp_path, "json")
+    store.append_batch([record("a"), record("b", agent="aura", nectar=5.0)])
+    totals = store.all_totals()
+    store.close()
+
+    migrated = open_store(tmp_path, "sqlite")
+    assert migrated.record_count == 2
+    for agent in ("veda", "aura"):
+        for field in ("total_nectar", "total_hours", "tasks_completed"):
+            assert migrated.get_totals(agent)[field] == pytest.approx(totals[agent][field])
+    migrated.close()
+
+
+def test_compaction_keeps_the_full_history_across_restarts(tmp_path):
+    store = open_store(tmp_path, "journal")
+    store.append_batch([record(f"t{i}") for i in range(4)])
+    assert store.compact()["status"] == "compacted"
+    store.append_batch([record("t4")])
+    store.close()
+
+    reopened = open_store(tmp_path, "journal")
+    assert reopened.get_totals("veda")["tasks_completed"] == 5
+    assert [r.task_id for r in reopened.iter_history()] == [f"t{i}" for i in range(5)]
+
+
+def test_cursors_page_across_archived_segments(tmp_path):
+    store = open_store(tmp_path, "journal")
+    store.append_batch([record(f"t{i}") for i in range(4)])
+    store.compact()
+    store.append_batch([record("t4")])
+
+    first = store.page_records(cursor=0, limit=3)
+    assert [r["task_id"] for r in first["records"]] == ["t0", "t1", "t2"]
+    rest = store.page_records(cursor=first["next_cursor"], limit=3)
+    assert [r["task_id"] for r in rest["records"]] == ["t3", "t4"]
+    assert rest["next_cursor"] is None
+
+
+def test_columnar_analytics_cover_archived_and_live_records(tmp_path):
+    pytest.importorskip("numpy")
+    store = open_store(tmp_path, "journal")
+    store.attach_columnar_archive()
+    store.append_batch([record(f"t{i}", agent=("veda", "aura")[i % 2]) for i in range(6)])
+    assert store.compact()["columnar_rows"] == 6
+    store.append_batch([record("t6", nectar=4.0)])
+
+    report = store.analytics()
+    assert report["rows"] == 7
+    assert report["archived_rows"] == 6
+    assert report["by_agent"]["veda"]["tasks"] == 4
+    assert report["by_agent"]["veda"]["nectar"] == pytest.approx(store.get_totals("veda")["total_nectar"])
+
+
+def test_failed_columnar_append_truncates_every_column(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    from src.council.ledger_columnar import ColumnarArchive
+
+    archive = ColumnarArchive(tmp_path / "columnar")
+    archive.append([record("a"), record("b")])
+    column_path = archive._column_path
+
+    def torn(name):
+        if name == "timestamp":
+            raise OSError("disk full")
+        return column_path(name)
+    monkeypatch.setattr(archive, "_column_path", torn)
+
+    with pytest.raises(OSError):
+        archive.append([record("c", agent="zed")])
+    with pytest.raises(OSError):
+        archive.ingest("segment-1", [record("d")])
+    monkeypatch.undo()
+
+    assert (archive.rows, archive.agents, archive.ingested_segments) == (2, ["veda"], [])
+    assert archive.ingest("segment-1", [record("d", agent="zed")]) == 1
+    assert archive.totals_by_agent()["zed"]["tasks"] == 1
+    reopened = ColumnarArchive(tmp_path / "columnar")
+    assert reopened.rows == 3
+    assert reopened.column("nectar_accrued").tolist() == [10.0] * 3
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_genesis_proofs_verify_against_the_root(tmp_path, backend):
+    from src.council.ledger_merkle import leaf_hash, verify_inclusion
+
+    store = open_store(tmp_path, backend)
+    store.attach_merkle_log()
+    for i in range(7):
+        store.append_batch([record(f"t{i}", agent=("veda", "aura", "hex")[i % 3])])
+
+    commitment = store.genesis_commitment()
+    root = bytes.fromhex(commitment["root"])
+    assert commitment["tree_size"] == 7
+    for agent, proof in commitment["proofs"].items():
+        assert proof["leaf"]["totals"]["tasks_completed"] == store.get_totals(agent)["tasks_completed"]
+        assert verify_inclusion(
+            leaf_hash(proof["leaf"]),
+            proof["leaf_index"],
+            commitment["tree_size"],
+            [bytes.fromhex(h) for h in proof["audit_path"]],
+            root
+        )
+    assert not verify_inclusion(leaf_hash(proof["leaf"]), 0, 7, [], root)
+
+
+def test_merkle_log_is_backfilled_to_the_same_root(tmp_path):
+    store = open_store(tmp_path, "journal")
+    store.attach_merkle_log()
+    store.append_batch([record(f"t{i}") for i in range(5)])
+    root = store.genesis_commitment()["root"]
+    store.close()
+    store.merkle.path.unlink()
+
+    reopened = open_store(tmp_path, "journal")
+    reopened.attach_merkle_log()
+    assert reopened.genesis_commitment()["root"] == root
+
+
+def test_closed_ledger_can_be_reopened_in_the_same_process(ledger_path):
+    from src.council.diligence_ledger import DiligenceLedger
+
+    ledger = DiligenceLedger(ledger_path, journaled=True)
+    store = ledger.store
+    ledger.close()
+
+    reopened = LedgerStore(ledger_path, journaled=True)  # Lock was released
+    reopened.close()
+    shared = LedgerStore.shared(ledger_path)
+    assert shared is not store
+    shared.close()
+
+
+def test_full_file_ledger_feeds_the_columnar_archive(ledger_path):
+    pytest.importorskip("numpy")
+    from src.council.diligence_ledger import DiligenceLedger
+
+    ledger = DiligenceLedger(ledger_path, columnar=True)
+    store = ledger.store
+    store.append_batch([record(f"t{i}", agent=("veda", "aura")[i % 2]) for i in range(6)])
+    assert store.pending_compaction() == 6
+    assert store.compact()["columnar_rows"] == 6
+    store.append_batch([record("t6", nectar=4.0)])
+
+    assert store.archive.rows == 6
+    analytics = ledger.get_analytics()
+    assert analytics["rows"] == 7
+    assert analytics["by_agent"]["veda"]["tasks"] == 4
+    assert analytics["by_agent"]["aura"]["quality_avg"] == 1.0
+    assert ledger.get_council_summary()["total_tasks_completed"] == 7
+    ledger.close()
@@ -0,0 +1,102 @@
+"""GroupCommitWriter: batching, ordering, latency bound and failures"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.council.agents import Task, TaskPriority
+from src.council.diligence_ledger import DiligenceLedger
+from src.council.ledger_writer import GroupCommitWriter
+
+
+class FakeStore:
+    """Records each batch; optionally blocks the first one until released"""
+
+    def __init__(self, block_first: bool = False, fail: bool = False):
+        self.batches = []
+        self.release = threading.Event()
+        if not block_first:
+            self.release.set()
+        self.fail = fail
+
+    def append_batch(self, records, sync=False):
+        if not self.batches:
+            self.release.wait()
+        self.batches.append(list(records))
+        if self.fail:
+            raise OSError("disk full")
+        return [{"record": record} for record in records]
+
+
+def test_flushes_full_batches_in_submission_order():
+    store = FakeStore(block_first=True)
+    writer = GroupCommitWriter(store, max_batch_size=4, max_batch_latency=0.01)
+    futures = [writer.submit(i) for i in range(10)]
+    store.release.set()
+
+    assert [f.result(timeout=2)["record"] for f in futures] == list(range(10))
+    writer.close()
+    assert [r for batch in store.batches for r in batch] == list(range(10))
+    assert max(len(batch) for batch in store.batches) == 4
+
+
+def test_leftover_records_keep_their_original_deadline():
+    store = FakeStore(block_first=True)
+    writer = GroupCommitWriter(store, max_batch_size=2, max_batch_latency=0.5)
+    writer.submit("r1")
+    writer.submit("r2")
+    while writer._pending:  # Wait for the writer to take the first batch (it blocks)
+        time.sleep(0.001)
+    queued = [writer.submit(f"r{i}") for i in (3, 4, 5)]
+    time.sleep(0.6)  # r5 is already past its latency bound
+
+    released = time.monotonic()
+    store.release.set()
+    queued[-1].result(timeout=2)
+    assert time.monotonic() - released < 0.25
+    writer.close()
+
+
+def test_failed_flush_fails_every_future_in_the_batch():
+    writer = GroupCommitWriter(FakeStore(fail=True), max_batch_size=8, max_batch_latency=0.01)
+    futures = [writer.submit(i) for i in range(3)]
+    for future in futures:
+        with pytest.raises(OSError):
+            future.result(timeout=2)
+    writer.close()
+
+
+def accrual_task(task_id: str) -> Task:
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        description="backend api endpoint",
+        repo="sandironratio-node",
+        priority=TaskPriority.NORMAL,
+        estimated_hours=1.0
+    )
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_concurrent_accruals_are_group_committed_off_the_loop(ledger_path, backend):
+    ledger = DiligenceLedger(
+        ledger_path, journaled=backend == "json", backend=backend,
+        group_commit=True, max_batch_latency=0.01
+    )
+
+    async def scenario():
+        return await asyncio.gather(*(
+            ledger.arecord_completion("veda", accrual_task(f"t{i}"), hours_worked=1.0)
+            for i in range(50)
+        ))
+
+    try:
+        results = asyncio.run(scenario())
+        totals = ledger.store.get_totals("veda")
+        assert totals["tasks_completed"] == 50
+        assert max(r["total_accrued"] for r in results) == pytest.approx(totals["total_nectar"])
+        assert ledger.get_writer_stats()["batches_flushed"] < 50
+    finally:
+        ledger.close()
@@ -0,0 +1,83 @@
+"""TaskGraph planning: dependency order, cycles and caller-owned assignments"""
+
+import asyncio
+import copy
+
+import pytest
+
+from src.council.agents.planning import DependencyCycleError, TaskGraph
+from src.council.agents.tess import TessAgent
+
+
+def assignment(task: str, agent: str = "veda", hours: float = 2.0, **extra) -> dict:
+    return {"task": task, "agent": agent, "estimated_hours": hours, **extra}
+
+
+def test_layers_order_backend_before_api_before_integration():
+    assignments = [
+        assignment("Integration tests", agent="aura"),
+        assignment("Bridge api endpoint", agent="spark"),
+        assignment("Backend storage", agent="veda"),
+    ]
+    plan = TaskGraph(assignments).schedule()
+    assert plan["order"] == [2, 1, 0]
+    assert plan["critical_path_hours"] == 6.0
+
+
+def test_explicit_cycle_is_reported():
+    assignments = [
+        assignment("Write docs", task_id="a", after=["b"]),
+        assignment("Review docs", task_id="b", after=["a"]),
+    ]
+    with pytest.raises(DependencyCycleError) as error:
+        TaskGraph(assignments).schedule()
+    assert sorted(error.value.task_ids) == ["a", "b"]
+
+
+def test_graph_does_not_write_into_the_callers_assignments():
+    assignments = [assignment("Backend storage"), assignment("Bridge api endpoint")]
+    before = copy.deepcopy(assignments)
+
+    graph = TaskGraph(assignments)
+    graph.schedule()
+    TessAgent()._calculate_timeline(assignments, {})
+
+    assert assignments == before
+    assert graph.task_ids == ["plan-00001", "plan-00002"]
+
+
+def test_coordinate_dependencies_sets_ids_on_the_plan():
+    assignments = [assignment("Bridge api endpoint"), assignment("Backend storage", task_id="db")]
+    ordered = asyncio.run(TessAgent().coordinate_dependencies(assignments))
+
+    assert [a["task_id"] for a in ordered] == ["db", "plan-00001"]
+    assert ordered[1]["depends_on"] == ["db"]
+
+
+def test_agent_starts_the_task_it_can_start_first():
+    # Highest bottom level first would hold veda's "polish" until "draft"
+    # is ready at hour 5, then run it late and push "publish" past "review"
+    assignments = [
+        assignment("Research notes", agent="aura", hours=5, task_id="research"),
+        assignment("Draft chapter", agent="veda", hours=4, task_id="draft", after=["research"]),
+        assignment("Review chapter", agent="aura", hours=5, task_id="review", after=["draft"]),
+        assignment("Polish style guide", agent="veda", hours=2, task_id="polish"),
+        assignment("Publish style guide", agent="spark", hours=4, task_id="publish", after=["polish"]),
+    ]
+    plan = TaskGraph(assignments).schedule()
+
+    assert plan["scheduled_start"] == [0.0, 5.0, 9.0, 0.0, 2.0]
+    assert plan["makespan_hours"] == 14.0
+    assert plan["per_agent"]["veda"]["busy_hours"] == 6.0
+
+
+def test_queued_assignments_take_no_agent_time():
+    assignments = [
+        assignment("Write docs", hours=3),
+        {"task": "Write more docs", "agent": "veda", "status": "queued"},
+    ]
+    plan = TaskGraph(assignments).schedule()
+
+    assert plan["makespan_hours"] == 3.0
+    assert plan["per_agent"]["veda"]["tasks"] == 1
+    assert plan["queued"] == ["plan-00002"]
@@ -0,0 +1,32 @@
+"""BatchRouter: vectorized routing against sequential per-task routing"""
+
+import pytest
+
+from src.council.agents import ScoringEngine, score_cache
+from src.council.agents.routing import _route_sequential, np
+from src.council.benchmarks import sample_critical_path
+
+
+@pytest.mark.skipif(
+    np is None,
+    reason="numpy not installed: vectorized routing is NOT checked against sequential routing"
+)
+def test_batch_router_matches_sequential_routing(council):
+    from src.council.agents import BatchRouter
+
+    critical_path = sample_critical_path(400) + ["", "   Backend API   ", "BACKEND api"]
+    engine = ScoringEngine.for_agents(council)
+    score_cache.clear()
+    sequential = _route_sequential(critical_path, engine)
+    assert BatchRouter.for_agents(council).route(critical_path) == sequential
+    # Second pass is served from the score cache and must not change
+    assert BatchRouter.for_agents(council).route(critical_path) == sequential
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed: batch router cache not checked")
+def test_batch_router_is_compiled_once_per_engine(council):
+    from src.council.agents import BatchRouter
+
+    router = BatchRouter.for_agents(council)
+    assert BatchRouter.for_agents(council) is router
+    assert ScoringEngine.for_agents(council).batch_router is router
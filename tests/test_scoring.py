@@ -0,0 +1,22 @@
+"""ScoringEngine: single-pass scoring and the score cache"""
+
+from src.council.agents import ScoringEngine, score_cache
+from src.council.benchmarks import legacy_score, sample_critical_path
+
+
+def test_single_pass_engine_matches_per_agent_scoring(council):
+    engine = ScoringEngine.for_agents(council)
+    for task in sample_critical_path(400) + ["", "   Backend API   ", "BACKEND api"]:
+        assert engine.score(task) == {
+            name: legacy_score(agent, task) for name, agent in council.items()
+        }
+
+
+def test_score_cache_reuses_normalized_descriptions(council):
+    engine = ScoringEngine.for_agents(council)
+    score_cache.clear()
+    hits = score_cache.hits
+
+    first = engine.score("Build backend API")
+    assert engine.score("  build BACKEND api ") == first
+    assert score_cache.hits == hits + 1
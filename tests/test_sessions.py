@@ -0,0 +1,80 @@
+"""SessionRegistry: LRU eviction, persistence/restore and shared multi-worker state"""
+
+import asyncio
+
+import pytest
+
+from conftest import briefing
+from src.council.sessions import SessionRegistry, UnknownSessionError
+
+
+async def brief(registry, session_id: str, *tasks):
+    async with registry.session(session_id, create=True) as council:
+        await council.receive_briefing(briefing(*tasks))
+        return council.phase
+
+
+def test_least_recently_used_session_is_dropped(resources):
+    async def scenario():
+        registry = SessionRegistry(resources, max_sessions=2)
+        for session_id in ("s1", "s2", "s3"):
+            await brief(registry, session_id, "Build backend api")
+
+        assert registry.stats()["live"] == 2
+        assert registry.get("s1") is None
+        with pytest.raises(UnknownSessionError):
+            async with registry.session("s1"):
+                pass
+
+    asyncio.run(scenario())
+
+
+def test_evicted_session_is_restored_from_the_session_dir(resources, tmp_path):
+    async def scenario():
+        registry = SessionRegistry(resources, max_sessions=1, session_dir=str(tmp_path / "sessions"))
+        phase = await brief(registry, "s1", "Build backend api", "Write integration tests")
+        await brief(registry, "s2", "Design wellness flow")
+        assert registry.stats()["persisted"] == 1
+
+        async with registry.session("s1") as council:
+            assert council.phase == phase
+            assert council.current_briefing["critical_path"] == ["Build backend api", "Write integration tests"]
+        assert registry.restored == 1
+
+    asyncio.run(scenario())
+
+
+def test_session_with_a_request_in_flight_is_not_evicted(resources):
+    async def scenario():
+        registry = SessionRegistry(resources, max_sessions=1)
+        async with registry.session("busy", create=True):
+            await brief(registry, "other", "Build backend api")
+            assert registry.get("busy") is not None
+        assert registry.stats()["live"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_workers_see_each_others_ceremonies_through_shared_state(council_env, tmp_path):
+    from src.council.convening import CouncilResources
+
+    council_env.setenv("COUNCIL_SHARED_STATE", str(tmp_path / "state.db"))
+    resources = CouncilResources()
+    try:
+        async def scenario():
+            first = SessionRegistry(resources)
+            second = SessionRegistry(resources)  # Another worker's registry
+            phase = await brief(first, "s1", "Build backend api")
+
+            async with second.session("s1") as council:
+                assert council.phase == phase
+                await council.receive_briefing(briefing("Design wellness flow"))
+
+            async with first.session("s1") as council:
+                assert council.current_briefing["critical_path"] == ["Design wellness flow"]
+            assert first.refreshed == 1
+
+        asyncio.run(scenario())
+    finally:
+        resources.ledger.close()
+        resources.shared_state.close()
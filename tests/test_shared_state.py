@@ -0,0 +1,68 @@
+"""SharedState: council-wide agent slots and session leases"""
+
+import asyncio
+
+import pytest
+
+from src.council.shared_state import LeaseLostError, SharedState
+
+
+@pytest.fixture
+def shared(tmp_path):
+    state = SharedState(str(tmp_path / "state.db"), lease_ttl=0.3, worker="host-a:1")
+    yield state
+    state.close()
+
+
+def other_worker(shared, worker: str = "host-b:2") -> SharedState:
+    return SharedState(str(shared.path), lease_ttl=shared.lease_ttl, worker=worker)
+
+
+def test_slots_are_limited_across_workers(shared):
+    other = other_worker(shared)
+    assert shared.acquire_slot("veda", "t1", limit=2) == 1
+    assert other.acquire_slot("veda", "t2", limit=2) == 2
+    assert shared.acquire_slot("veda", "t3", limit=2) is None
+    assert other.release_slot("veda", "t2") == 1
+    assert shared.acquire_slot("veda", "t3", limit=2) == 2
+    other.close()
+
+
+def test_reacquiring_a_held_slot_reports_the_real_count(shared):
+    assert shared.acquire_slot("veda", "t1", limit=3) == 1
+    assert shared.acquire_slot("veda", "t1", limit=3) == 1
+    assert shared.acquire_slot("veda", "t1", limit=1) == 1  # Already held, not denied
+    assert shared.slot_counts() == {"veda": 1}
+
+
+def test_lease_is_renewed_while_held(shared):
+    other = other_worker(shared)
+
+    async def scenario():
+        async with shared.lease("s1"):
+            await asyncio.sleep(shared.lease_ttl * 2)  # Longer than the TTL
+            assert not other._try_lease("s1")
+            shared.save_session("s1", {"phase": "deliberation"})
+        assert other._try_lease("s1")
+
+    asyncio.run(scenario())
+    assert shared.leases_lost == 0
+    other.close()
+
+
+def test_lost_lease_is_not_released_or_saved_over(shared):
+    other = other_worker(shared)
+
+    async def scenario():
+        async with shared.lease("s1"):
+            # Simulate a stalled holder: the lease expires and is taken over
+            with shared._transaction() as conn:
+                conn.execute("UPDATE session_leases SET expires_at = 0")
+            assert other._try_lease("s1")
+            with pytest.raises(LeaseLostError):
+                shared.save_session("s1", {"phase": "stale"})
+
+    asyncio.run(scenario())
+    assert shared.leases_lost == 1
+    assert not shared._try_lease("s1")  # Still the other worker's
+    other.close()